@@ -4,7 +4,7 @@ Add user_email field to Purchase model for anonymous purchases
 """
 import os
 import sys
-from sqlalchemy import text
+from sqlalchemy import inspect, text
 
 # Add the backend directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -19,27 +19,21 @@ def add_purchase_email_field():
     with app.app_context():
         try:
             # Check if column already exists
-            result = db.engine.execute(text("""
-                SELECT COUNT(*) as count 
-                FROM pragma_table_info('purchase') 
-                WHERE name = 'user_email'
-            """))
+            columns = {column['name'] for column in inspect(db.engine).get_columns('purchase')}
             
-            count = result.fetchone()[0]
-            
-            if count == 0:
+            if 'user_email' not in columns:
                 print("Adding user_email column to purchase table...")
                 
-                # Add the column
-                db.engine.execute(text("""
-                    ALTER TABLE purchase 
-                    ADD COLUMN user_email VARCHAR(255)
-                """))
-                
-                # Create index for the new column
-                db.engine.execute(text("""
-                    CREATE INDEX idx_purchase_user_email ON purchase(user_email)
-                """))
+                # Add the column and its index in a single transaction
+                with db.engine.begin() as conn:
+                    conn.execute(text("""
+                        ALTER TABLE purchase 
+                        ADD COLUMN user_email VARCHAR(255)
+                    """))
+                    
+                    conn.execute(text("""
+                        CREATE INDEX idx_purchase_user_email ON purchase(user_email)
+                    """))
                 
                 print("✅ Successfully added user_email column and index")
             else:
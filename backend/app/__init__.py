@@ -3,21 +3,104 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
+from werkzeug.utils import import_string
+import redis
 from config import config
 
 db = SQLAlchemy()
 migrate = Migrate()
 jwt = JWTManager()
 
+# Connection pool defaults for server databases; config-provided
+# SQLALCHEMY_ENGINE_OPTIONS take precedence
+DEFAULT_ENGINE_OPTIONS = {
+    'pool_size': 30,
+    'max_overflow': 20,
+    'pool_timeout': 10,
+    'pool_recycle': 3600,
+    'pool_pre_ping': True
+}
+
+# Security headers applied to every response
+CONTENT_SECURITY_POLICY = (
+    "default-src 'self'; "
+    "script-src 'self' 'unsafe-inline'; "
+    "style-src 'self' 'unsafe-inline'; "
+    "img-src 'self' data: https:; "
+    "font-src 'self' https:; "
+    "connect-src 'self' https:; "
+    "media-src 'self' https:; "
+    "object-src 'none'; "
+    "base-uri 'self'; "
+    "form-action 'self'"
+)
+
+STATIC_SECURITY_HEADERS = {
+    # Prevent clickjacking
+    'X-Frame-Options': 'DENY',
+    # Prevent MIME type sniffing
+    'X-Content-Type-Options': 'nosniff',
+    # Enable XSS protection
+    'X-XSS-Protection': '1; mode=block',
+    'Content-Security-Policy': CONTENT_SECURITY_POLICY
+}
+
+HSTS_HEADER = 'max-age=31536000; includeSubDomains'
+
+# Blueprints registered by create_app as (import path, url prefix). They are
+# imported lazily because blueprint modules import `db` from this package.
+BLUEPRINTS = [
+    ('app.main:bp', None),
+    ('app.auth:bp', '/api/auth'),
+    ('app.jobs:bp', '/api/jobs'),
+    ('app.payments:bp', '/api/payments'),
+    ('app.user:bp', '/api/user'),
+    ('app.admin:bp', '/admin/api'),
+    ('app.monitoring:bp', '/api/monitoring'),
+    ('app.admin.error_monitoring:bp', '/admin/api/monitoring'),
+    ('app.api_docs:api_bp', '/api'),
+    ('app.logging.routes:logging_bp', None),
+    ('app.downloads.routes:downloads_bp', None),
+    ('app.purchases.routes:purchases_bp', None),
+    ('app.support.routes:support_bp', None),
+]
+
 def create_app(config_name='default'):
     app = Flask(__name__)
     app.config.from_object(config[config_name])
     
+    # Normalize admin emails once so admin checks are O(1) and case-insensitive
+    app.config['ADMIN_EMAILS'] = frozenset(
+        email.lower() for email in app.config.get('ADMIN_EMAILS', [])
+    )
+    
+    # Configure connection pooling (SQLite manages its own pool)
+    if not app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+        engine_options = dict(DEFAULT_ENGINE_OPTIONS)
+        engine_options.update(app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options
+    
+    # Register the read replica as a separate bind when configured
+    if app.config.get('READ_REPLICA_URL'):
+        binds = dict(app.config.get('SQLALCHEMY_BINDS') or {})
+        binds['replica'] = app.config['READ_REPLICA_URL']
+        app.config['SQLALCHEMY_BINDS'] = binds
+    
     # Initialize extensions
     db.init_app(app)
     migrate.init_app(app, db)
     jwt.init_app(app)
     
+    # Shared Redis client for request handlers (connections are pooled)
+    if app.config.get('REDIS_URL'):
+        app.extensions['redis'] = redis.from_url(
+            app.config['REDIS_URL'],
+            socket_timeout=2,
+            socket_connect_timeout=2,
+            socket_keepalive=True,
+            health_check_interval=30
+        )
+    
     # Configure CORS with detailed settings
     CORS(app, 
          resources={
@@ -40,10 +123,18 @@ def create_app(config_name='default'):
         from app.security_config import init_all_security_features
         init_all_security_features(app)
     
+    # Serialize JSON responses with orjson when available
+    from app.json_provider import init_json_provider
+    init_json_provider(app)
+    
     # Initialize caching
     from app.cache import cache
     cache.init_app(app)
     
+    # Keep completed-payment totals current
+    from app.payments.aggregate import init_payment_aggregate
+    init_payment_aggregate(app)
+    
     # Initialize performance monitoring
     from app.performance import init_performance_monitoring
     init_performance_monitoring(app)
@@ -63,32 +154,11 @@ def create_app(config_name='default'):
     # Add security headers
     @app.after_request
     def add_security_headers(response):
-        # Prevent clickjacking
-        response.headers['X-Frame-Options'] = 'DENY'
-        
-        # Prevent MIME type sniffing
-        response.headers['X-Content-Type-Options'] = 'nosniff'
-        
-        # Enable XSS protection
-        response.headers['X-XSS-Protection'] = '1; mode=block'
+        response.headers.update(STATIC_SECURITY_HEADERS)
         
         # Strict transport security (HTTPS only)
         if app.config.get('HTTPS_ONLY', False):
-            response.headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
-        
-        # Content Security Policy
-        response.headers['Content-Security-Policy'] = (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-inline'; "
-            "style-src 'self' 'unsafe-inline'; "
-            "img-src 'self' data: https:; "
-            "font-src 'self' https:; "
-            "connect-src 'self' https:; "
-            "media-src 'self' https:; "
-            "object-src 'none'; "
-            "base-uri 'self'; "
-            "form-action 'self'"
-        )
+            response.headers['Strict-Transport-Security'] = HSTS_HEADER
         
         return response
     
@@ -113,51 +183,8 @@ def create_app(config_name='default'):
         return {'error': {'code': 'TOKEN_REQUIRED', 'message': 'Authorization token is required'}}, 401
     
     # Register blueprints
-    from app.main import bp as main_bp
-    app.register_blueprint(main_bp)
-    
-    from app.auth import bp as auth_bp
-    app.register_blueprint(auth_bp, url_prefix='/api/auth')
-    
-    from app.jobs import bp as jobs_bp
-    app.register_blueprint(jobs_bp, url_prefix='/api/jobs')
-    
-    from app.payments import bp as payments_bp
-    app.register_blueprint(payments_bp, url_prefix='/api/payments')
-    
-    from app.user import bp as user_bp
-    app.register_blueprint(user_bp, url_prefix='/api/user')
-    
-    from app.admin import bp as admin_api_bp
-    app.register_blueprint(admin_api_bp, url_prefix='/admin/api')
-    
-    # Register monitoring endpoints
-    from app.monitoring import bp as monitoring_bp
-    app.register_blueprint(monitoring_bp, url_prefix='/api/monitoring')
-    
-    # Register error monitoring endpoints
-    from app.admin.error_monitoring import bp as error_monitoring_bp
-    app.register_blueprint(error_monitoring_bp, url_prefix='/admin/api/monitoring')
-    
-    # Register API documentation
-    from app.api_docs import api_bp
-    app.register_blueprint(api_bp, url_prefix='/api')
-    
-    # Register logging endpoints
-    from app.logging.routes import logging_bp
-    app.register_blueprint(logging_bp)
-    
-    # Register downloads endpoints
-    from app.downloads.routes import downloads_bp
-    app.register_blueprint(downloads_bp)
-    
-    # Register purchases endpoints
-    from app.purchases.routes import purchases_bp
-    app.register_blueprint(purchases_bp)
-    
-    # Register support endpoints
-    from app.support.routes import support_bp
-    app.register_blueprint(support_bp)
+    for import_name, url_prefix in BLUEPRINTS:
+        app.register_blueprint(import_string(import_name), url_prefix=url_prefix)
     
     # Initialize Flask-Admin
     from app.admin.views import init_admin
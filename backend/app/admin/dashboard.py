@@ -0,0 +1,173 @@
+"""
+Admin dashboard metrics and precomputed snapshots.
+
+The aggregates here are computed by the periodic dashboard snapshot job and
+stored in a single ``dashboard_snapshot`` row; the admin views read that row
+and only compute inline when the snapshot is missing or stale.
+"""
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import and_, case
+from app import db
+from app.cache import cached
+from app.database_optimization import read_session
+from app.models import User, Payment, RenderJob, JobMetrics, SystemHealth, DashboardSnapshot
+from app.payments.aggregate import get_completed_payment_totals
+
+SNAPSHOT_ROW_ID = 1
+SNAPSHOT_MAX_AGE = timedelta(minutes=2)
+ALERTS_CACHE_TTL = 30
+
+
+def compute_system_metrics():
+    """Compute dashboard metrics as JSON-serializable data."""
+    try:
+        # Payment totals come from the running aggregate, which may be
+        # rebuilt (a write), so read them from the primary
+        completed_payments, total_revenue = get_completed_payment_totals()
+        
+        with read_session() as session:
+            metrics = _query_system_metrics(session)
+        
+        metrics.update({
+            'completed_payments': completed_payments,
+            'total_revenue_cents': total_revenue,
+            'total_revenue_dollars': total_revenue / 100 if total_revenue else 0
+        })
+        return metrics
+        
+    except Exception as e:
+        current_app.logger.error(f"Error getting system metrics: {e}")
+        return {}
+
+
+def _query_system_metrics(session):
+    """Run the read-only dashboard aggregates on the given session."""
+    # User metrics (one conditional-aggregate scan per table)
+    total_users, active_users, new_users_today = session.query(
+        db.func.count(User.id),
+        db.func.count(case((User.is_active.is_(True), 1))),
+        db.func.count(case((User.created_at >= datetime.utcnow().date(), 1)))
+    ).one()
+    
+    # Payment metrics
+    total_payments = session.query(db.func.count(Payment.id)).scalar()
+    
+    # Job metrics
+    total_jobs, completed_jobs, failed_jobs, processing_jobs = session.query(
+        db.func.count(RenderJob.id),
+        db.func.count(case((RenderJob.status == 'completed', 1))),
+        db.func.count(case((RenderJob.status == 'failed', 1))),
+        db.func.count(case((RenderJob.status == 'processing', 1)))
+    ).one()
+    
+    # Recent activity
+    recent_users = [
+        {
+            'email': user.email,
+            'created_at': user.created_at.strftime('%Y-%m-%d %H:%M'),
+            'is_active': user.is_active
+        }
+        for user in session.query(
+            User.email, User.created_at, User.is_active
+        ).order_by(User.created_at.desc()).limit(5).all()
+    ]
+    recent_jobs = [
+        {
+            'id': job.id,
+            'status': job.status,
+            'audio_filename': job.audio_filename,
+            'created_at': job.created_at.strftime('%Y-%m-%d %H:%M')
+        }
+        for job in session.query(
+            RenderJob.id, RenderJob.status, RenderJob.audio_filename, RenderJob.created_at
+        ).order_by(RenderJob.created_at.desc()).limit(10).all()
+    ]
+    
+    return {
+        'total_users': total_users,
+        'active_users': active_users,
+        'new_users_today': new_users_today,
+        'total_payments': total_payments,
+        'total_jobs': total_jobs,
+        'completed_jobs': completed_jobs,
+        'failed_jobs': failed_jobs,
+        'processing_jobs': processing_jobs,
+        'recent_users': recent_users,
+        'recent_jobs': recent_jobs
+    }
+
+
+@cached(timeout=ALERTS_CACHE_TTL, key_func=lambda: 'admin:alerts:v1')
+def evaluate_alerts():
+    """Evaluate alert rules, sharing the result across requests for a short while."""
+    from app.monitoring.alerts import AlertManager
+    
+    return [
+        {**alert, 'level': alert['level'].value}
+        for alert in AlertManager().check_alerts()
+    ]
+
+
+def compute_monitoring_metrics():
+    """Compute monitoring and health metrics as JSON-serializable data."""
+    try:
+        with read_session() as session:
+            # Get latest system health
+            latest_memory_usage = session.query(
+                SystemHealth.memory_usage_percent
+            ).order_by(SystemHealth.timestamp.desc()).first()
+            
+            # Get recent job performance
+            cutoff_time = datetime.utcnow() - timedelta(hours=24)
+            total_jobs_24h, failed_jobs_24h, avg_render_time = session.query(
+                db.func.count(JobMetrics.id),
+                db.func.count(case((JobMetrics.status == 'failed', 1))),
+                db.func.avg(case((
+                    and_(JobMetrics.job_type == 'render_video', JobMetrics.duration_seconds != 0),
+                    JobMetrics.duration_seconds
+                )))
+            ).filter(JobMetrics.created_at >= cutoff_time).one()
+        
+        # Calculate performance stats
+        failure_rate = (failed_jobs_24h / total_jobs_24h * 100) if total_jobs_24h > 0 else 0
+        avg_render_time = float(avg_render_time or 0)
+        
+        # Check for active alerts
+        active_alerts = evaluate_alerts()
+        
+        return {
+            'latest_health': {
+                'memory_usage_percent': latest_memory_usage[0]
+            } if latest_memory_usage else None,
+            'jobs_24h': total_jobs_24h,
+            'failed_jobs_24h': failed_jobs_24h,
+            'failure_rate': failure_rate,
+            'avg_render_time': avg_render_time,
+            'active_alerts': active_alerts,
+            'alert_count': len(active_alerts)
+        }
+        
+    except Exception as e:
+        current_app.logger.error(f"Error getting monitoring metrics: {e}")
+        return {}
+
+
+def save_dashboard_snapshot():
+    """Compute all dashboard metrics and store them in the snapshot row."""
+    snapshot = db.session.merge(DashboardSnapshot(
+        id=SNAPSHOT_ROW_ID,
+        system_metrics=compute_system_metrics(),
+        monitoring_metrics=compute_monitoring_metrics(),
+        computed_at=datetime.utcnow()
+    ))
+    db.session.commit()
+    return snapshot
+
+
+def get_dashboard_snapshot(max_age=SNAPSHOT_MAX_AGE):
+    """Get the stored snapshot, or None if it is missing or older than max_age."""
+    snapshot = db.session.get(DashboardSnapshot, SNAPSHOT_ROW_ID)
+    if snapshot is None or snapshot.computed_at < datetime.utcnow() - max_age:
+        return None
+    return snapshot
@@ -1,17 +1,68 @@
 """
 Admin endpoints for error monitoring and service health.
+
+Error-recovery and logging helpers are imported inside the handlers so that
+registering this blueprint stays cheap for workers that never serve them.
 """
 from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required
 from app.admin.utils import admin_required
-from app.utils.error_recovery import get_service_health_status, reset_circuit_breaker, reset_all_circuit_breakers
-from logging_config import get_error_stats
+from cachetools import TTLCache
+from operator import itemgetter
+import heapq
 import logging
 
 logger = logging.getLogger(__name__)
 
 bp = Blueprint('error_monitoring', __name__)
 
+# Circuit breaker state lives in this process, so the health summary is
+# cached in-process; probes within the TTL reuse the same payload
+SERVICE_HEALTH_CACHE_TTL = 5
+_service_health_cache = TTLCache(maxsize=1, ttl=SERVICE_HEALTH_CACHE_TTL)
+
+# The basic health check reports static values
+_HEALTH_CHECK_PAYLOAD = {
+    'status': 'healthy',
+    'timestamp': '2024-01-01T00:00:00Z',
+    'version': '1.0.0',
+    'checks': {
+        'database': 'healthy',
+        'redis': 'healthy',
+        'storage': 'healthy',
+        'email': 'healthy'
+    }
+}
+
+
+def _service_health_payload():
+    """Build (or reuse) the service health response body"""
+    payload = _service_health_cache.get('svc_health')
+    if payload is not None:
+        return payload
+    
+    from app.utils.error_recovery import get_service_health_status
+    
+    health_status = get_service_health_status()
+    
+    # Add overall health summary
+    total_services = len(health_status)
+    healthy_services = sum(1 for status in health_status.values() if status['healthy'])
+    
+    payload = {
+        'data': {
+            'services': health_status,
+            'summary': {
+                'total_services': total_services,
+                'healthy_services': healthy_services,
+                'unhealthy_services': total_services - healthy_services,
+                'overall_health': 'healthy' if healthy_services == total_services else 'degraded'
+            }
+        }
+    }
+    _service_health_cache['svc_health'] = payload
+    return payload
+
 
 @bp.route('/health/services', methods=['GET'])
 @jwt_required()
@@ -19,26 +70,10 @@ bp = Blueprint('error_monitoring', __name__)
 def get_service_health():
     """Get health status of all external services"""
     try:
-        health_status = get_service_health_status()
-        
-        # Add overall health summary
-        total_services = len(health_status)
-        healthy_services = sum(1 for status in health_status.values() if status['healthy'])
-        
-        return jsonify({
-            'data': {
-                'services': health_status,
-                'summary': {
-                    'total_services': total_services,
-                    'healthy_services': healthy_services,
-                    'unhealthy_services': total_services - healthy_services,
-                    'overall_health': 'healthy' if healthy_services == total_services else 'degraded'
-                }
-            }
-        }), 200
+        return jsonify(_service_health_payload()), 200
         
     except Exception as e:
-        logger.error(f"Error getting service health: {e}")
+        logger.error("Error getting service health: %s", e)
         return jsonify({
             'error': {
                 'code': 'HEALTH_CHECK_ERROR',
@@ -52,6 +87,8 @@ def get_service_health():
 @admin_required
 def get_error_statistics():
     """Get error statistics and patterns"""
+    from logging_config import get_error_stats
+    
     try:
         error_stats = get_error_stats()
         
@@ -60,22 +97,22 @@ def get_error_statistics():
         error_counts = error_stats.get('error_counts', {})
         error_patterns = error_stats.get('error_patterns', {})
         
-        # Sort errors by frequency
-        sorted_errors = sorted(error_counts.items(), key=lambda x: x[1], reverse=True)
-        sorted_patterns = sorted(error_patterns.items(), key=lambda x: x[1], reverse=True)
+        # Sort errors by frequency; only the top patterns are needed
+        sorted_errors = sorted(error_counts.items(), key=itemgetter(1), reverse=True)
+        top_patterns = heapq.nlargest(20, error_patterns.items(), key=itemgetter(1))
         
         return jsonify({
             'data': {
                 'total_errors': total_errors,
                 'error_types': dict(sorted_errors),
-                'error_patterns': dict(sorted_patterns[:20]),  # Top 20 patterns
+                'error_patterns': dict(top_patterns),  # Top 20 patterns
                 'top_error_type': sorted_errors[0][0] if sorted_errors else None,
-                'most_frequent_pattern': sorted_patterns[0][0] if sorted_patterns else None
+                'most_frequent_pattern': top_patterns[0][0] if top_patterns else None
             }
         }), 200
         
     except Exception as e:
-        logger.error(f"Error getting error statistics: {e}")
+        logger.error("Error getting error statistics: %s", e)
         return jsonify({
             'error': {
                 'code': 'STATS_ERROR',
@@ -89,11 +126,14 @@ def get_error_statistics():
 @admin_required
 def reset_service_circuit_breaker(service_name):
     """Reset circuit breaker for a specific service"""
+    from app.utils.error_recovery import reset_circuit_breaker
+    
     try:
         success = reset_circuit_breaker(service_name)
         
         if success:
-            logger.info(f"Admin reset circuit breaker for service: {service_name}")
+            _service_health_cache.clear()
+            logger.info("Admin reset circuit breaker for service: %s", service_name)
             return jsonify({
                 'message': f'Circuit breaker for {service_name} has been reset',
                 'data': {'service': service_name, 'status': 'reset'}
@@ -107,7 +147,7 @@ def reset_service_circuit_breaker(service_name):
             }), 404
             
     except Exception as e:
-        logger.error(f"Error resetting circuit breaker for {service_name}: {e}")
+        logger.error("Error resetting circuit breaker for %s: %s", service_name, e)
         return jsonify({
             'error': {
                 'code': 'RESET_ERROR',
@@ -121,8 +161,11 @@ def reset_service_circuit_breaker(service_name):
 @admin_required
 def reset_all_service_circuit_breakers():
     """Reset all circuit breakers"""
+    from app.utils.error_recovery import reset_all_circuit_breakers
+    
     try:
         reset_all_circuit_breakers()
+        _service_health_cache.clear()
         logger.info("Admin reset all circuit breakers")
         
         return jsonify({
@@ -131,7 +174,7 @@ def reset_all_service_circuit_breakers():
         }), 200
         
     except Exception as e:
-        logger.error(f"Error resetting all circuit breakers: {e}")
+        logger.error("Error resetting all circuit breakers: %s", e)
         return jsonify({
             'error': {
                 'code': 'RESET_ALL_ERROR',
@@ -145,23 +188,25 @@ def reset_all_service_circuit_breakers():
 @admin_required
 def get_recent_errors():
     """Get recent error logs (last 100 errors)"""
+    from logging_config import get_recent_errors
+    
     try:
         # Get query parameters
         limit = min(int(request.args.get('limit', 100)), 500)  # Max 500
         level = request.args.get('level', 'ERROR').upper()
         
-        # This would typically read from log files or a logging service
-        # For now, return a placeholder response
+        # Served from the in-process buffer of recent error records
+        errors = get_recent_errors(limit, level)
+        
         return jsonify({
             'data': {
-                'errors': [],
-                'message': 'Recent error logs would be displayed here',
-                'note': 'This endpoint would integrate with your logging infrastructure'
+                'errors': errors,
+                'count': len(errors)
             }
         }), 200
         
     except Exception as e:
-        logger.error(f"Error getting recent errors: {e}")
+        logger.error("Error getting recent errors: %s", e)
         return jsonify({
             'error': {
                 'code': 'LOG_RETRIEVAL_ERROR',
@@ -205,7 +250,7 @@ def configure_error_alerts():
             'enabled': data.get('enabled', True)
         }
         
-        logger.info(f"Admin configured error alerts: {alert_config}")
+        logger.info("Admin configured error alerts: %s", alert_config)
         
         return jsonify({
             'message': 'Error alert configuration updated',
@@ -213,7 +258,7 @@ def configure_error_alerts():
         }), 200
         
     except Exception as e:
-        logger.error(f"Error configuring alerts: {e}")
+        logger.error("Error configuring alerts: %s", e)
         return jsonify({
             'error': {
                 'code': 'ALERT_CONFIG_ERROR',
@@ -226,23 +271,10 @@ def configure_error_alerts():
 def health_check():
     """Basic health check endpoint"""
     try:
-        # Perform basic health checks
-        health_status = {
-            'status': 'healthy',
-            'timestamp': '2024-01-01T00:00:00Z',
-            'version': '1.0.0',
-            'checks': {
-                'database': 'healthy',
-                'redis': 'healthy',
-                'storage': 'healthy',
-                'email': 'healthy'
-            }
-        }
-        
-        return jsonify(health_status), 200
+        return jsonify(_HEALTH_CHECK_PAYLOAD), 200
         
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         return jsonify({
             'status': 'unhealthy',
             'error': str(e)
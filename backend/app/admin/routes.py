@@ -2,11 +2,65 @@
 Admin routes for additional functionality.
 """
 from flask import jsonify, request, current_app
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
 from app.admin import bp
+from app.admin.utils import get_admin_status
 from app.models import User, Payment, RenderJob
 from app import db
-import redis
+from app.cache import cached
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import text
+
+# Recent system-status probe results; service health does not flip faster
+SYSTEM_STATUS_CACHE_TTL = 5
+_system_status_cache = TTLCache(maxsize=1, ttl=SYSTEM_STATUS_CACHE_TTL)
+_probe_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='admin-probe')
+
+
+@cached(timeout=15, key_func=lambda: 'admin_metrics')
+def _collect_db_metrics():
+    """Aggregate user, payment and job counts with one grouped query per table."""
+    users_by_state = dict(
+        db.session.query(User.is_active, db.func.count(User.id))
+        .group_by(User.is_active)
+        .all()
+    )
+    
+    payments_by_status = {
+        status: (count, amount or 0)
+        for status, count, amount in db.session.query(
+            Payment.status, db.func.count(Payment.id), db.func.sum(Payment.amount)
+        ).group_by(Payment.status).all()
+    }
+    
+    jobs_by_status = dict(
+        db.session.query(RenderJob.status, db.func.count(RenderJob.id))
+        .group_by(RenderJob.status)
+        .all()
+    )
+    
+    return {
+        'users': {
+            'total': sum(users_by_state.values()),
+            'active': users_by_state.get(True, 0),
+            'inactive': users_by_state.get(False, 0)
+        },
+        'payments': {
+            'total': sum(count for count, _ in payments_by_status.values()),
+            'completed': payments_by_status.get('completed', (0, 0))[0],
+            'pending': payments_by_status.get('pending', (0, 0))[0],
+            'failed': payments_by_status.get('failed', (0, 0))[0],
+            'total_revenue': payments_by_status.get('completed', (0, 0))[1]
+        },
+        'jobs': {
+            'total': sum(jobs_by_status.values()),
+            'queued': jobs_by_status.get('queued', 0),
+            'processing': jobs_by_status.get('processing', 0),
+            'completed': jobs_by_status.get('completed', 0),
+            'failed': jobs_by_status.get('failed', 0)
+        }
+    }
 
 
 @bp.route('/metrics')
@@ -15,109 +69,101 @@ def get_metrics():
     """API endpoint for admin metrics."""
     try:
         # Check if user is admin
-        current_user_id = int(get_jwt_identity())
-        user = User.query.get(current_user_id)
-        admin_email = current_app.config.get('ADMIN_EMAIL')
-        
-        if not user or not admin_email or user.email != admin_email:
+        admin_status = get_admin_status()
+        if not admin_status or not admin_status[1]:
             return jsonify({'error': 'Unauthorized'}), 403
         
         # Get metrics
-        metrics = {
-            'users': {
-                'total': User.query.count(),
-                'active': User.query.filter_by(is_active=True).count(),
-                'inactive': User.query.filter_by(is_active=False).count()
-            },
-            'payments': {
-                'total': Payment.query.count(),
-                'completed': Payment.query.filter_by(status='completed').count(),
-                'pending': Payment.query.filter_by(status='pending').count(),
-                'failed': Payment.query.filter_by(status='failed').count(),
-                'total_revenue': db.session.query(db.func.sum(Payment.amount)).filter_by(
-                    status='completed'
-                ).scalar() or 0
-            },
-            'jobs': {
-                'total': RenderJob.query.count(),
-                'queued': RenderJob.query.filter_by(status='queued').count(),
-                'processing': RenderJob.query.filter_by(status='processing').count(),
-                'completed': RenderJob.query.filter_by(status='completed').count(),
-                'failed': RenderJob.query.filter_by(status='failed').count()
-            }
-        }
+        metrics = _collect_db_metrics()
         
         # Add queue status
         try:
-            redis_url = current_app.config.get('REDIS_URL')
-            if redis_url:
-                r = redis.from_url(redis_url)
+            r = current_app.extensions.get('redis')
+            if r:
+                pipe = r.pipeline(transaction=False)
+                pipe.llen('rq:queue:default')
+                pipe.llen('rq:queue:high')
+                pipe.llen('rq:queue:low')
+                default_length, high_length, low_length = pipe.execute()
                 metrics['queue'] = {
-                    'default': r.llen('rq:queue:default'),
-                    'high': r.llen('rq:queue:high'),
-                    'low': r.llen('rq:queue:low')
+                    'default': default_length,
+                    'high': high_length,
+                    'low': low_length
                 }
         except Exception as e:
-            current_app.logger.error(f"Redis metrics error: {e}")
+            current_app.logger.error("Redis metrics error: %s", e)
             metrics['queue'] = {'error': 'Unable to connect to Redis'}
         
         return jsonify(metrics)
         
     except Exception as e:
-        current_app.logger.error(f"Admin metrics error: {e}")
+        current_app.logger.error("Admin metrics error: %s", e)
         return jsonify({'error': 'Failed to fetch metrics'}), 500
 
 
+def _probe_database(app):
+    """Check database connectivity from a worker thread."""
+    with app.app_context():
+        try:
+            db.session.execute(text('SELECT 1'))
+            return 'healthy'
+        except Exception:
+            return 'unhealthy'
+
+
+def _probe_redis(app):
+    """Check Redis connectivity from a worker thread."""
+    r = app.extensions.get('redis')
+    if not r:
+        return 'not_configured'
+    try:
+        r.ping()
+        return 'healthy'
+    except Exception:
+        return 'unhealthy'
+
+
+def _probe_system_status(app):
+    """
+    Probe backing services, reusing the last result for a few seconds.
+    
+    The database and Redis probes run concurrently so the total latency is
+    bounded by the slowest probe rather than their sum.
+    """
+    status = _system_status_cache.get('system_status')
+    if status is not None:
+        return status
+    
+    database_probe = _probe_executor.submit(_probe_database, app)
+    redis_probe = _probe_executor.submit(_probe_redis, app)
+    
+    # Check GCS and SendGrid (basic config checks)
+    gcs_bucket = app.config.get('GCS_BUCKET_NAME')
+    gcs_creds = app.config.get('GOOGLE_APPLICATION_CREDENTIALS')
+    sendgrid_key = app.config.get('SENDGRID_API_KEY')
+    
+    status = {
+        'database': database_probe.result(),
+        'redis': redis_probe.result(),
+        'storage': 'configured' if gcs_bucket and gcs_creds else 'not_configured',
+        'email': 'configured' if sendgrid_key else 'not_configured'
+    }
+    _system_status_cache['system_status'] = status
+    return status
+
+
 @bp.route('/system-status')
 @jwt_required()
 def get_system_status():
     """Get system status for monitoring."""
     try:
         # Check if user is admin
-        current_user_id = int(get_jwt_identity())
-        user = User.query.get(current_user_id)
-        admin_email = current_app.config.get('ADMIN_EMAIL')
-        
-        if not user or not admin_email or user.email != admin_email:
+        admin_status = get_admin_status()
+        if not admin_status or not admin_status[1]:
             return jsonify({'error': 'Unauthorized'}), 403
         
-        status = {
-            'database': 'healthy',
-            'redis': 'unknown',
-            'storage': 'unknown',
-            'email': 'unknown'
-        }
-        
-        # Check database
-        try:
-            db.session.execute('SELECT 1')
-            status['database'] = 'healthy'
-        except Exception:
-            status['database'] = 'unhealthy'
-        
-        # Check Redis
-        try:
-            redis_url = current_app.config.get('REDIS_URL')
-            if redis_url:
-                r = redis.from_url(redis_url)
-                r.ping()
-                status['redis'] = 'healthy'
-            else:
-                status['redis'] = 'not_configured'
-        except Exception:
-            status['redis'] = 'unhealthy'
-        
-        # Check GCS (basic config check)
-        gcs_bucket = current_app.config.get('GCS_BUCKET_NAME')
-        gcs_creds = current_app.config.get('GOOGLE_APPLICATION_CREDENTIALS')
-        status['storage'] = 'configured' if gcs_bucket and gcs_creds else 'not_configured'
-        
-        # Check SendGrid (basic config check)
-        sendgrid_key = current_app.config.get('SENDGRID_API_KEY')
-        status['email'] = 'configured' if sendgrid_key else 'not_configured'
-        
-        return jsonify(status)
+        return jsonify(_probe_system_status(current_app._get_current_object()))
         
     except Exception as e:
-        current_app.logger.error(f"System status error: {e}")
+        current_app.logger.error("System status error: %s", e)
         return jsonify({'error': 'Failed to fetch system status'}), 500
\ No newline at end of file
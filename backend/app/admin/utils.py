@@ -1,54 +1,109 @@
 """
 Admin utility functions and decorators.
 """
+import hashlib
 from functools import wraps
-from flask import current_app, jsonify
-from flask_jwt_extended import get_jwt_identity
+from cachetools import TTLCache
+from flask import current_app, jsonify, request
+from flask_jwt_extended import get_jwt, get_jwt_identity
 from app.models import User
 
+# Short-lived cache of admin checks keyed by a digest of the Authorization
+# header, so bursts of admin calls skip the user lookup. The raw token is
+# never stored.
+ADMIN_STATUS_CACHE_TTL = 30
+_admin_status_cache = TTLCache(maxsize=2048, ttl=ADMIN_STATUS_CACHE_TTL)
+
+
+def _token_cache_key():
+    """Build a cache key from the current request's Authorization header"""
+    auth_header = request.headers.get('Authorization')
+    if not auth_header:
+        return None
+    return hashlib.sha256(auth_header.encode()).hexdigest()[:32]
+
+
+def get_admin_status():
+    """
+    Resolve the admin status of the current JWT identity.
+
+    Returns a ``(user_id, is_admin)`` tuple, or None if the user does not
+    exist. Tokens issued at login carry an ``is_admin`` claim, which is
+    trusted directly; older tokens fall back to a user lookup that is
+    cached per token for a few seconds.
+    """
+    claims = get_jwt()
+    if 'is_admin' in claims:
+        return int(get_jwt_identity()), bool(claims['is_admin'])
+
+    cache_key = _token_cache_key()
+    if cache_key is not None:
+        cached = _admin_status_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    user = User.query.get(int(get_jwt_identity()))
+    if not user:
+        return None
+
+    status = (user.id, is_admin_user(user.email))
+    if cache_key is not None:
+        _admin_status_cache[cache_key] = status
+    return status
+
+
+def clear_admin_status_cache():
+    """Drop all cached admin checks (e.g. after admin config changes)"""
+    _admin_status_cache.clear()
+
 
 def admin_required(f):
     """Decorator to require admin privileges for a route"""
     @wraps(f)
     def decorated_function(*args, **kwargs):
         try:
-            current_user_id = get_jwt_identity()
-            user = User.query.get(current_user_id)
-            
-            if not user:
+            status = get_admin_status()
+
+            if not status:
                 return jsonify({
                     'error': {
                         'code': 'USER_NOT_FOUND',
                         'message': 'User not found'
                     }
                 }), 404
-            
+
             # Check if user is admin (you may need to add an is_admin field to User model)
             # For now, we'll check if the user email is in admin list from config
-            admin_emails = current_app.config.get('ADMIN_EMAILS', [])
-            if user.email not in admin_emails:
+            _, is_admin = status
+            if not is_admin:
                 return jsonify({
                     'error': {
                         'code': 'ADMIN_REQUIRED',
                         'message': 'Admin privileges required'
                     }
                 }), 403
-            
+
             return f(*args, **kwargs)
-            
+
         except Exception as e:
-            current_app.logger.error(f"Admin check failed: {e}")
+            current_app.logger.error("Admin check failed: %s", e)
             return jsonify({
                 'error': {
                     'code': 'ADMIN_CHECK_ERROR',
                     'message': 'Failed to verify admin privileges'
                 }
             }), 500
-    
+
     return decorated_function
 
 
+def admin_claims(user):
+    """Additional JWT claims describing the user's admin status"""
+    return {'email': user.email, 'is_admin': is_admin_user(user.email)}
+
+
 def is_admin_user(user_email):
-    """Check if a user email is in the admin list"""
-    admin_emails = current_app.config.get('ADMIN_EMAILS', [])
-    return user_email in admin_emails
\ No newline at end of file
+    """Check if a user email is in the admin set (normalized in create_app)"""
+    if not user_email:
+        return False
+    return user_email.lower() in current_app.config.get('ADMIN_EMAILS', frozenset())
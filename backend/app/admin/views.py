@@ -1,19 +1,70 @@
 """
 Flask-Admin views for administrative interface.
 """
-import os
-from datetime import datetime, timedelta
-from flask import current_app, request, redirect, url_for, flash
+import hmac
+from datetime import datetime
+from flask import current_app, g, jsonify, request, redirect, url_for, flash
 from flask_admin import Admin, AdminIndexView, expose
+from flask_admin.actions import action
 from flask_admin.contrib.sqla import ModelView
 from flask_admin.form import Select2Widget
 from flask_jwt_extended import jwt_required, get_jwt_identity, verify_jwt_in_request
 from werkzeug.security import check_password_hash
 from wtforms import SelectField, TextAreaField, StringField
 from wtforms.validators import DataRequired
-import redis
+from sqlalchemy import event, inspect, not_, tuple_
+from sqlalchemy.orm import Session, joinedload, object_session
 from app import db
+from app.cache import cache, DASHBOARD_STALE_FLAG, mark_dashboard_stale
+from app.admin.dashboard import (
+    compute_monitoring_metrics, compute_system_metrics,
+    get_dashboard_snapshot, save_dashboard_snapshot
+)
 from app.models import User, Payment, RenderJob
+from app.security import admin_login_rate_limit
+
+# Dashboard aggregates are cached in Redis and busted when a commit touches
+# a column the dashboard displays.
+DASHBOARD_CACHE_KEY = 'admin:dashboard:metrics:v1'
+DASHBOARD_CACHE_TTL = 60
+_DASHBOARD_COLUMNS = {
+    User: ('is_active',),
+    Payment: ('status', 'amount'),
+    RenderJob: ('status',),
+}
+
+
+def check_admin_access():
+    """
+    Check whether the current request comes from the configured admin.
+    
+    The result is stored on ``g`` so the many permission checks made while
+    rendering one admin page share a single JWT decode and user lookup.
+    """
+    if '_admin_ok' in g:
+        return g._admin_ok
+    
+    g._admin_ok = False
+    g._admin_user_id = None
+    try:
+        # Simple admin check - in production, implement proper admin roles
+        admin_email = current_app.config.get('ADMIN_EMAIL')
+        if not admin_email:
+            return False
+        
+        verify_jwt_in_request(optional=True)
+        current_user_id = get_jwt_identity()
+        
+        if current_user_id:
+            user = db.session.get(User, int(current_user_id))
+            if user and user.email == admin_email and user.is_active:
+                g._admin_ok = True
+                g._admin_user_id = user.id
+    
+    except Exception:
+        pass
+    
+    return g._admin_ok
 
 
 class SecureAdminIndexView(AdminIndexView):
@@ -39,7 +90,38 @@ class SecureAdminIndexView(AdminIndexView):
             flash('Error loading dashboard', 'error')
             return self.render('admin/dashboard.html')
     
+    @expose('/api/monitoring')
+    def api_monitoring(self):
+        """Monitoring widget data, fetched by the dashboard after it renders."""
+        if not self.is_admin_authenticated():
+            return jsonify({'error': 'Admin privileges required'}), 403
+        
+        return jsonify(self.get_monitoring_metrics())
+    
+    @expose('/api/queue_status')
+    def api_queue_status(self):
+        """Queue widget data, fetched by the dashboard after it renders."""
+        if not self.is_admin_authenticated():
+            return jsonify({'error': 'Admin privileges required'}), 403
+        
+        return jsonify(self.get_queue_status())
+    
+    @expose('/refresh', methods=['POST'])
+    def refresh(self):
+        """Recompute dashboard metrics and reload the dashboard."""
+        if not self.is_admin_authenticated():
+            return redirect(url_for('admin.login'))
+        
+        cache.delete(DASHBOARD_CACHE_KEY)
+        try:
+            save_dashboard_snapshot()
+        except Exception as e:
+            current_app.logger.error(f"Dashboard snapshot refresh error: {e}")
+            db.session.rollback()
+        return redirect(url_for('admin.index'))
+    
     @expose('/login', methods=['GET', 'POST'])
+    @admin_login_rate_limit()
     def login(self):
         """Admin login page."""
         if request.method == 'POST':
@@ -63,160 +145,69 @@ class SecureAdminIndexView(AdminIndexView):
     
     def is_admin_authenticated(self):
         """Check if current user is authenticated admin."""
-        try:
-            # Simple admin check - in production, implement proper admin roles
-            admin_email = os.environ.get('ADMIN_EMAIL')
-            if not admin_email:
-                return False
-            
-            # For now, check if there's a valid JWT token for admin user
-            verify_jwt_in_request(optional=True)
-            current_user_id = get_jwt_identity()
-            
-            if current_user_id:
-                user = User.query.get(int(current_user_id))
-                return user and user.email == admin_email and user.is_active
-            
-            return False
-            
-        except Exception:
-            return False
+        return check_admin_access()
     
     def authenticate_admin(self, email, password):
         """Authenticate admin user."""
         try:
-            admin_email = os.environ.get('ADMIN_EMAIL')
-            admin_password = os.environ.get('ADMIN_PASSWORD')
+            admin_email = current_app.config.get('ADMIN_EMAIL')
             
-            if not admin_email or not admin_password:
-                current_app.logger.warning("Admin credentials not configured")
+            if not admin_email or not current_app.config.get('ADMIN_PASSWORD'):
                 return False
             
-            # Check credentials
-            if email == admin_email:
-                # In production, use proper password hashing
-                user = User.query.filter_by(email=email).first()
-                if user and check_password_hash(user.password_hash, password):
-                    return True
+            # Reject mismatches in constant time before touching the database
+            # or hashing, so arbitrary emails never cost a User lookup
+            if not password or not hmac.compare_digest(
+                (email or '').encode(), admin_email.encode()
+            ):
+                return False
             
-            return False
+            user = User.query.filter_by(email=admin_email).first()
+            return bool(user and check_password_hash(user.password_hash, password))
             
         except Exception as e:
             current_app.logger.error(f"Admin authentication error: {e}")
             return False
     
     def get_system_metrics(self):
-        """Get system metrics for dashboard."""
-        try:
-            # User metrics
-            total_users = User.query.count()
-            active_users = User.query.filter_by(is_active=True).count()
-            new_users_today = User.query.filter(
-                User.created_at >= datetime.utcnow().date()
-            ).count()
-            
-            # Payment metrics
-            total_payments = Payment.query.count()
-            completed_payments = Payment.query.filter_by(status='completed').count()
-            total_revenue = db.session.query(db.func.sum(Payment.amount)).filter_by(
-                status='completed'
-            ).scalar() or 0
-            
-            # Job metrics
-            total_jobs = RenderJob.query.count()
-            completed_jobs = RenderJob.query.filter_by(status='completed').count()
-            failed_jobs = RenderJob.query.filter_by(status='failed').count()
-            processing_jobs = RenderJob.query.filter_by(status='processing').count()
-            
-            # Recent activity
-            recent_users = User.query.order_by(User.created_at.desc()).limit(5).all()
-            recent_jobs = RenderJob.query.order_by(RenderJob.created_at.desc()).limit(10).all()
-            
-            # Job queue status
-            queue_status = self.get_queue_status()
-            
-            # System health and monitoring metrics
-            monitoring_metrics = self.get_monitoring_metrics()
-            
-            return {
-                'total_users': total_users,
-                'active_users': active_users,
-                'new_users_today': new_users_today,
-                'total_payments': total_payments,
-                'completed_payments': completed_payments,
-                'total_revenue_cents': total_revenue,
-                'total_revenue_dollars': total_revenue / 100 if total_revenue else 0,
-                'total_jobs': total_jobs,
-                'completed_jobs': completed_jobs,
-                'failed_jobs': failed_jobs,
-                'processing_jobs': processing_jobs,
-                'recent_users': recent_users,
-                'recent_jobs': recent_jobs,
-                'queue_status': queue_status,
-                'monitoring': monitoring_metrics
-            }
-            
-        except Exception as e:
-            current_app.logger.error(f"Error getting system metrics: {e}")
-            return {}
+        """
+        Get system metrics for dashboard.
+        
+        Reads the snapshot written by the periodic snapshot job, falling back
+        to a short-lived cache of inline computation when it is stale.
+        """
+        snapshot = get_dashboard_snapshot()
+        if snapshot and snapshot.system_metrics:
+            return snapshot.system_metrics
+        
+        metrics = cache.get(DASHBOARD_CACHE_KEY)
+        if metrics is None:
+            metrics = compute_system_metrics()
+            if metrics:
+                cache.set(DASHBOARD_CACHE_KEY, metrics, DASHBOARD_CACHE_TTL)
+        return metrics
     
     def get_monitoring_metrics(self):
-        """Get monitoring and health metrics."""
-        try:
-            from app.models import SystemHealth, JobMetrics
-            from app.monitoring.alerts import AlertManager
-            
-            # Get latest system health
-            latest_health = SystemHealth.query.order_by(
-                SystemHealth.timestamp.desc()
-            ).first()
-            
-            # Get recent job performance
-            cutoff_time = datetime.utcnow() - timedelta(hours=24)
-            recent_job_metrics = JobMetrics.query.filter(
-                JobMetrics.created_at >= cutoff_time
-            ).all()
-            
-            # Calculate performance stats
-            total_jobs_24h = len(recent_job_metrics)
-            failed_jobs_24h = len([m for m in recent_job_metrics if m.status == 'failed'])
-            failure_rate = (failed_jobs_24h / total_jobs_24h * 100) if total_jobs_24h > 0 else 0
-            
-            # Average render time
-            render_jobs = [m for m in recent_job_metrics if m.job_type == 'render_video' and m.duration_seconds]
-            avg_render_time = sum(m.duration_seconds for m in render_jobs) / len(render_jobs) if render_jobs else 0
-            
-            # Check for active alerts
-            alert_manager = AlertManager()
-            active_alerts = alert_manager.check_alerts()
-            
-            return {
-                'latest_health': latest_health,
-                'jobs_24h': total_jobs_24h,
-                'failed_jobs_24h': failed_jobs_24h,
-                'failure_rate': failure_rate,
-                'avg_render_time': avg_render_time,
-                'active_alerts': active_alerts,
-                'alert_count': len(active_alerts)
-            }
-            
-        except Exception as e:
-            current_app.logger.error(f"Error getting monitoring metrics: {e}")
-            return {}
+        """Get monitoring and health metrics, preferring the stored snapshot."""
+        snapshot = get_dashboard_snapshot()
+        if snapshot and snapshot.monitoring_metrics:
+            return snapshot.monitoring_metrics
+        return compute_monitoring_metrics()
     
     def get_queue_status(self):
         """Get Redis queue status."""
         try:
-            redis_url = current_app.config.get('REDIS_URL')
-            if not redis_url:
+            # Shared, pooled client created in create_app
+            r = current_app.extensions.get('redis')
+            if r is None:
                 return {'status': 'not_configured'}
             
-            r = redis.from_url(redis_url)
-            
-            # Get queue lengths
-            default_queue_length = r.llen('rq:queue:default')
-            high_queue_length = r.llen('rq:queue:high')
-            low_queue_length = r.llen('rq:queue:low')
+            # Get queue lengths in a single round trip
+            pipe = r.pipeline(transaction=False)
+            pipe.llen('rq:queue:default')
+            pipe.llen('rq:queue:high')
+            pipe.llen('rq:queue:low')
+            default_queue_length, high_queue_length, low_queue_length = pipe.execute()
             
             return {
                 'status': 'connected',
@@ -231,33 +222,115 @@ class SecureAdminIndexView(AdminIndexView):
             return {'status': 'error', 'error': str(e)}
 
 
+def _mark_dashboard_stale(mapper, connection, target):
+    """Flag the session when a flush inserts or deletes a dashboard row."""
+    session = object_session(target)
+    if session is not None:
+        mark_dashboard_stale(session)
+
+
+def _mark_dashboard_stale_on_update(mapper, connection, target):
+    """Flag the session only when an update changes a displayed column."""
+    attrs = inspect(target).attrs
+    if any(attrs[column].history.has_changes() for column in _DASHBOARD_COLUMNS[mapper.class_]):
+        _mark_dashboard_stale(mapper, connection, target)
+
+
+def _bust_dashboard_cache(session):
+    """Drop cached dashboard metrics once the flagged transaction commits."""
+    if session.info.pop(DASHBOARD_STALE_FLAG, False) and cache.redis_client is not None:
+        cache.delete(DASHBOARD_CACHE_KEY)
+
+
+def register_dashboard_cache_invalidation():
+    """Bust the dashboard cache on commits touching users, payments or jobs."""
+    if event.contains(Session, 'after_commit', _bust_dashboard_cache):
+        return
+    
+    for model in _DASHBOARD_COLUMNS:
+        event.listen(model, 'after_insert', _mark_dashboard_stale)
+        event.listen(model, 'after_update', _mark_dashboard_stale_on_update)
+        event.listen(model, 'after_delete', _mark_dashboard_stale)
+    event.listen(Session, 'after_commit', _bust_dashboard_cache)
+
+
+def attach_child_counts(models, attr, foreign_key):
+    """
+    Annotate each model with the number of child rows referencing it.
+    
+    Uses one grouped COUNT for the whole page instead of a query per row.
+    """
+    ids = [model.id for model in models]
+    counts = {}
+    if ids:
+        counts = dict(
+            db.session.query(foreign_key, db.func.count())
+            .filter(foreign_key.in_(ids))
+            .group_by(foreign_key)
+            .all()
+        )
+    for model in models:
+        setattr(model, attr, counts.get(model.id, 0))
+
+
 class SecureModelView(ModelView):
     """Base model view with admin authentication."""
     
     def is_accessible(self):
         """Check if current user can access admin interface."""
-        try:
-            admin_email = os.environ.get('ADMIN_EMAIL')
-            if not admin_email:
-                return False
-            
-            verify_jwt_in_request(optional=True)
-            current_user_id = get_jwt_identity()
-            
-            if current_user_id:
-                user = User.query.get(int(current_user_id))
-                return user and user.email == admin_email and user.is_active
-            
-            return False
-            
-        except Exception:
-            return False
+        return check_admin_access()
     
     def inaccessible_callback(self, name, **kwargs):
         """Redirect to login if not accessible."""
         return redirect(url_for('admin.login'))
 
 
+class KeysetPaginationMixin:
+    """
+    Page through the default newest-first listing by (created_at, id).
+    
+    ``?after=<created_at>&after_id=<id>`` continues after the given row
+    instead of using OFFSET, so deep pages cost the same as the first one.
+    Explicit column sorts fall back to regular page numbers.
+    """
+    
+    list_template = 'admin/model/keyset_list.html'
+    
+    def _keyset_cursor(self):
+        """Parse the (created_at, id) cursor from the request, if any."""
+        if 'sort' in request.args:
+            return None
+        try:
+            return datetime.fromisoformat(request.args['after']), int(request.args['after_id'])
+        except (KeyError, ValueError):
+            return None
+    
+    def _apply_pagination(self, query, page, page_size):
+        if 'sort' in request.args:
+            return super()._apply_pagination(query, page, page_size)
+        
+        # Break created_at ties by id so the cursor is unambiguous
+        query = query.order_by(self.model.id.desc())
+        cursor = self._keyset_cursor()
+        if cursor is None:
+            return super()._apply_pagination(query, page, page_size)
+        
+        return query.filter(
+            tuple_(self.model.created_at, self.model.id) < cursor
+        ).limit(page_size or self.page_size)
+    
+    def keyset_next_url(self, data):
+        """URL of the page following the last row shown, or None."""
+        if 'sort' in request.args or not data:
+            return None
+        
+        last = data[-1]
+        args = request.args.to_dict()
+        args.pop('page', None)
+        args.update(after=last.created_at.isoformat(), after_id=last.id)
+        return self.get_url('.index_view', **args)
+
+
 class UserAdminView(SecureModelView):
     """Admin view for User model."""
     
@@ -267,13 +340,27 @@ class UserAdminView(SecureModelView):
     column_sortable_list = ['id', 'email', 'created_at', 'is_active']
     column_default_sort = ('created_at', True)
     
+    def get_list(self, page, sort_column, sort_desc, search, filters,
+                 execute=True, page_size=None):
+        """Fetch a page of users with their payment and job counts batched."""
+        count, data = super().get_list(page, sort_column, sort_desc, search, filters,
+                                       execute=execute, page_size=page_size)
+        if execute:
+            attach_child_counts(data, '_payment_count', Payment.user_id)
+            attach_child_counts(data, '_job_count', RenderJob.user_id)
+        return count, data
+    
     # Custom columns
     def payment_count(self, context, model, name):
         """Get payment count for user."""
+        if hasattr(model, '_payment_count'):
+            return model._payment_count
         return Payment.query.filter_by(user_id=model.id).count()
     
     def job_count(self, context, model, name):
         """Get job count for user."""
+        if hasattr(model, '_job_count'):
+            return model._job_count
         return RenderJob.query.filter_by(user_id=model.id).count()
     
     column_formatters = {
@@ -302,9 +389,28 @@ class UserAdminView(SecureModelView):
             db.session.rollback()
         
         return redirect(url_for('user.index_view'))
+    
+    @action('toggle_active', 'Toggle Active', 'Toggle the active status of the selected users?')
+    def action_toggle_active(self, ids):
+        """Toggle active status for all selected users in one UPDATE."""
+        try:
+            count = User.query.filter(User.id.in_([int(i) for i in ids])).update(
+                {User.is_active: not_(User.is_active)},
+                synchronize_session=False
+            )
+            # Bulk updates skip mapper events, so flag the dashboard directly
+            mark_dashboard_stale(db.session)
+            db.session.commit()
+            
+            flash(f'Toggled active status for {count} users', 'success')
+            
+        except Exception as e:
+            current_app.logger.error(f"Error toggling user status: {e}")
+            flash('Error updating user status', 'error')
+            db.session.rollback()
 
 
-class PaymentAdminView(SecureModelView):
+class PaymentAdminView(KeysetPaginationMixin, SecureModelView):
     """Admin view for Payment model."""
     
     column_list = ['id', 'user.email', 'stripe_session_id', 'amount_dollars', 'status', 'created_at', 'job_count']
@@ -313,6 +419,19 @@ class PaymentAdminView(SecureModelView):
     column_sortable_list = ['id', 'amount', 'status', 'created_at']
     column_default_sort = ('created_at', True)
     
+    def get_query(self):
+        """Load each payment's user in the same query as the list."""
+        return super().get_query().options(joinedload(Payment.user))
+    
+    def get_list(self, page, sort_column, sort_desc, search, filters,
+                 execute=True, page_size=None):
+        """Fetch a page of payments with their job counts batched."""
+        count, data = super().get_list(page, sort_column, sort_desc, search, filters,
+                                       execute=execute, page_size=page_size)
+        if execute:
+            attach_child_counts(data, '_job_count', RenderJob.payment_id)
+        return count, data
+    
     # Custom columns
     def amount_dollars(self, context, model, name):
         """Format amount in dollars."""
@@ -320,6 +439,8 @@ class PaymentAdminView(SecureModelView):
     
     def job_count(self, context, model, name):
         """Get job count for payment."""
+        if hasattr(model, '_job_count'):
+            return model._job_count
         return RenderJob.query.filter_by(payment_id=model.id).count()
     
     column_formatters = {
@@ -337,7 +458,7 @@ class PaymentAdminView(SecureModelView):
     }
 
 
-class RenderJobAdminView(SecureModelView):
+class RenderJobAdminView(KeysetPaginationMixin, SecureModelView):
     """Admin view for RenderJob model."""
     
     column_list = ['id', 'user.email', 'status', 'audio_filename', 'created_at', 'completed_at', 'has_video']
@@ -346,6 +467,10 @@ class RenderJobAdminView(SecureModelView):
     column_sortable_list = ['id', 'status', 'created_at', 'completed_at']
     column_default_sort = ('created_at', True)
     
+    def get_query(self):
+        """Load each job's user in the same query as the list."""
+        return super().get_query().options(joinedload(RenderJob.user))
+    
     # Custom columns
     def has_video(self, context, model, name):
         """Check if job has video output."""
@@ -424,6 +549,27 @@ class RenderJobAdminView(SecureModelView):
             db.session.rollback()
         
         return redirect(url_for('renderjob.index_view'))
+    
+    @action('cancel', 'Cancel', 'Cancel the selected queued or processing jobs?')
+    def action_cancel(self, ids):
+        """Cancel all selected queued or processing jobs in one UPDATE."""
+        try:
+            count = RenderJob.query.filter(
+                RenderJob.id.in_([int(i) for i in ids]),
+                RenderJob.status.in_(['queued', 'processing'])
+            ).update(
+                {RenderJob.status: 'failed', RenderJob.error_message: 'Job cancelled by administrator'},
+                synchronize_session=False
+            )
+            mark_dashboard_stale(db.session)
+            db.session.commit()
+            
+            flash(f'{count} jobs cancelled', 'success')
+            
+        except Exception as e:
+            current_app.logger.error(f"Error cancelling jobs: {e}")
+            flash('Error cancelling jobs', 'error')
+            db.session.rollback()
 
 
 def init_admin(app):
@@ -434,6 +580,12 @@ def init_admin(app):
         index_view=SecureAdminIndexView()
     )
     
+    register_dashboard_cache_invalidation()
+    
+    # Surface missing admin credentials once at startup rather than per login
+    if not app.config.get('ADMIN_EMAIL') or not app.config.get('ADMIN_PASSWORD'):
+        app.logger.warning("Admin credentials not configured; admin login is disabled")
+    
     # Add model views with unique endpoints
     admin.add_view(UserAdminView(User, db.session, name='Users', endpoint='admin_users'))
     admin.add_view(PaymentAdminView(Payment, db.session, name='Payments', endpoint='admin_payments'))
@@ -14,6 +14,7 @@ from app.auth import bp
 from app.security import auth_rate_limit
 from app.security.validators import sanitize_input, validate_json_input, SecurityValidationError
 from app.email import get_email_service
+from app.admin.utils import admin_claims
 
 logger = logging.getLogger(__name__)
 
@@ -77,7 +78,7 @@ def register():
             }), 400
         
         # Check if user already exists
-        if User.query.filter_by(email=email).first():
+        if db.session.query(User.query.filter_by(email=email).exists()).scalar():
             return jsonify({
                 'error': {
                     'code': 'EMAIL_EXISTS',
@@ -167,7 +168,10 @@ def login():
             }), 403
         
         # Create JWT tokens
-        access_token = create_access_token(identity=str(user.id))
+        access_token = create_access_token(
+            identity=str(user.id),
+            additional_claims=admin_claims(user)
+        )
         refresh_token = create_refresh_token(identity=str(user.id))
         
         return jsonify({
@@ -209,7 +213,10 @@ def refresh():
             }), 401
         
         # Create new access token
-        new_access_token = create_access_token(identity=current_user_id)
+        new_access_token = create_access_token(
+            identity=current_user_id,
+            additional_claims=admin_claims(user)
+        )
         
         return jsonify({
             'access_token': new_access_token
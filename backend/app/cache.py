@@ -93,6 +93,14 @@ class CacheManager:
 # Global cache instance
 cache = CacheManager()
 
+# Session flag for transactions that touched rows the admin dashboard shows;
+# the cached dashboard metrics are dropped when such a session commits
+DASHBOARD_STALE_FLAG = 'admin_dashboard_stale'
+
+def mark_dashboard_stale(session):
+    """Drop the cached admin dashboard metrics once this session commits"""
+    session.info[DASHBOARD_STALE_FLAG] = True
+
 def cached(timeout: int = 300, key_func: Optional[Callable] = None):
     """
     Decorator for caching function results
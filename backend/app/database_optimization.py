@@ -1,7 +1,9 @@
 """
 Database optimization utilities for performance improvements
 """
-from sqlalchemy import text, inspect
+from contextlib import contextmanager
+from sqlalchemy import bindparam, text, inspect
+from sqlalchemy.orm import Session
 from flask import current_app
 from app import db
 import logging
@@ -15,6 +17,7 @@ def create_database_indexes():
         # User table indexes
         "CREATE INDEX IF NOT EXISTS idx_user_email_active ON user(email, is_active);",
         "CREATE INDEX IF NOT EXISTS idx_user_created_at ON user(created_at);",
+        "CREATE INDEX IF NOT EXISTS idx_user_active_created ON user(is_active, created_at);",
         
         # Payment table indexes
         "CREATE INDEX IF NOT EXISTS idx_payment_user_status ON payment(user_id, status);",
@@ -38,6 +41,7 @@ def create_database_indexes():
         "CREATE INDEX IF NOT EXISTS idx_job_metrics_job_id ON job_metrics(job_id);",
         "CREATE INDEX IF NOT EXISTS idx_job_metrics_type_status ON job_metrics(job_type, status);",
         "CREATE INDEX IF NOT EXISTS idx_job_metrics_created_at ON job_metrics(created_at);",
+        "CREATE INDEX IF NOT EXISTS idx_job_metrics_created_status ON job_metrics(created_at, status);",
         "CREATE INDEX IF NOT EXISTS idx_job_metrics_duration ON job_metrics(duration_seconds);",
         
         # SystemHealth table indexes
@@ -59,6 +63,46 @@ def create_database_indexes():
         logger.error(f"Error creating database indexes: {e}")
         raise
 
+@contextmanager
+def read_session():
+    """
+    Session for read-only queries, bound to the read replica when configured.
+    
+    Falls back to the primary ``db.session`` when no replica bind exists.
+    Replica reads may lag the primary slightly, so only use this for
+    reporting queries that tolerate it; writes must stay on ``db.session``.
+    """
+    engine = db.engines.get('replica')
+    if engine is None:
+        yield db.session
+        return
+    
+    session = Session(engine)
+    try:
+        yield session
+    finally:
+        session.close()
+
+def approximate_row_counts(tables):
+    """
+    Estimate row counts from the PostgreSQL planner statistics.
+    
+    Reading pg_class.reltuples avoids a sequential scan per table. Returns an
+    empty dict on other databases; tables that were never analyzed are
+    omitted so callers can fall back to an exact COUNT(*).
+    """
+    if db.engine.dialect.name != 'postgresql' or not tables:
+        return {}
+    
+    result = db.session.execute(
+        text("SELECT relname, reltuples::bigint FROM pg_class "
+             "WHERE relkind = 'r' AND relname IN :tables").bindparams(
+            bindparam('tables', expanding=True)
+        ),
+        {'tables': list(tables)}
+    )
+    return {name: count for name, count in result if count >= 0}
+
 def analyze_table_statistics():
     """Analyze table statistics for query optimization"""
     
@@ -67,11 +111,15 @@ def analyze_table_statistics():
         inspector = inspect(db.engine)
         tables = inspector.get_table_names()
         
+        approximate_counts = approximate_row_counts(tables)
+        
         stats = {}
         for table in tables:
-            # Get row count
-            result = db.session.execute(text(f"SELECT COUNT(*) FROM {table}"))
-            row_count = result.scalar()
+            # Get row count (planner estimate when available)
+            row_count = approximate_counts.get(table)
+            if row_count is None:
+                result = db.session.execute(text(f"SELECT COUNT(*) FROM {table}"))
+                row_count = result.scalar()
             
             # Get table size (PostgreSQL specific)
             if db.engine.dialect.name == 'postgresql':
@@ -1,21 +1,338 @@
 """
 Console email service implementation for development.
 """
+import atexit
+import functools
+import io
 import logging
+import logging.handlers
+import queue
+import re
+import sys
+import textwrap
+import threading
 from typing import Dict, Any
 from datetime import datetime, timezone
 from .interface import EmailServiceInterface
 
 logger = logging.getLogger(__name__)
 
+# Patterns used on every logged email, compiled once at import
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_SECURE_DL_RE = re.compile(r'href="([^"]*secure_download[^"]*)"')
+
+_SEP80 = "=" * 80
+_SEP40 = "-" * 40
+
+# Fixed parts of the console email block
+_LOG_HEADER = f"\n{_SEP80}\n📧 EMAIL SENT (DEVELOPMENT MODE)\n{_SEP80}\n"
+_LOG_HTML_HEADER = f"\n📄 HTML CONTENT:\n{_SEP40}\n"
+_LOG_TEXT_HEADER = f"\n\n📝 TEXT CONTENT:\n{_SEP40}\n"
+_LOG_FOOTER = f"\n\n{_SEP80}\n✅ Email logged successfully to console\n{_SEP80}\n"
+
+_console_logger = None
+_console_logger_lock = threading.Lock()
+
+
+def _get_console_logger() -> logging.Logger:
+    """
+    Get the logger that writes console emails to stdout.
+
+    Records are handed to a QueueHandler and written by a QueueListener on a
+    background thread, so a slow stdout never blocks the request that sent
+    the email. The listener is started on first use and stopped at exit.
+    """
+    global _console_logger
+    if _console_logger is None:
+        with _console_logger_lock:
+            if _console_logger is None:
+                record_queue = queue.Queue(-1)
+                
+                stream_handler = logging.StreamHandler(sys.stdout)
+                stream_handler.terminator = ''
+                listener = logging.handlers.QueueListener(record_queue, stream_handler)
+                listener.start()
+                atexit.register(listener.stop)
+                
+                console_logger = logging.getLogger('console_email')
+                console_logger.setLevel(logging.INFO)
+                console_logger.propagate = False
+                console_logger.addHandler(logging.handlers.QueueHandler(record_queue))
+                _console_logger = console_logger
+    return _console_logger
+
+
+def _clean_html(html_content: str) -> str:
+    """Strip tags, drop blank lines and wrap HTML for console display."""
+    # Remove HTML tags but keep the content
+    text = _HTML_TAG_RE.sub('', html_content)
+    
+    # One pass over the lines trims leading whitespace, drops blank lines and
+    # wraps long lines, replacing the separate whitespace regex passes
+    formatted_lines = []
+    for line in text.split('\n'):
+        line = line.lstrip()
+        if not line:
+            continue
+        if len(line) > 70:
+            formatted_lines.extend(
+                textwrap.wrap(line, width=70, break_long_words=False, break_on_hyphens=False)
+            )
+        else:
+            formatted_lines.append(line)
+    
+    return '\n'.join(formatted_lines).strip()
+
+
+# Cleaning is deterministic, so identical bodies (and every body logged twice
+# by send_email) reuse the earlier result. Very large bodies bypass the cache
+# to keep its memory bounded.
+_CLEAN_HTML_CACHE_MAX_CHARS = 50_000
+_clean_html_cached = functools.lru_cache(maxsize=256)(_clean_html)
+
+
+# Email bodies are built once at import; only the per-recipient fields are
+# substituted at send time
+_WELCOME_HTML_TMPL = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="utf-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>Welcome to Oriel FX!</title>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <h1>🎵 Welcome to Oriel FX!</h1>
+                    <p>Transform your audio into stunning visual experiences</p>
+                </div>
+                <div class="content">
+                    <h2>Hello {user_name}!</h2>
+                    <p>Welcome to Oriel FX, where your music comes to life through beautiful visualizations!</p>
+                    
+                    <h3>Getting Started</h3>
+                    <ul>
+                        <li>Upload your favorite audio tracks</li>
+                        <li>Choose from various visualization styles</li>
+                        <li>Customize colors and effects</li>
+                        <li>Download your personalized video</li>
+                    </ul>
+                    
+                    <a href="http://localhost:3000/dashboard">Start Creating</a>
+                    
+                    <p>We're excited to see what amazing visualizations you'll create!</p>
+                </div>
+                <div class="footer">
+                    <p>Happy creating!</p>
+                    <p>The Oriel FX Team</p>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+
+_WELCOME_TEXT_TMPL = """
+Welcome to Oriel FX!
+
+Hello {user_name}!
+
+Welcome to Oriel FX, where your music comes to life through beautiful visualizations!
+
+Getting Started:
+- Upload your favorite audio tracks
+- Choose from various visualization styles
+- Customize colors and effects
+- Download your personalized video
+
+Start creating: http://localhost:3000/dashboard
+
+We're excited to see what amazing visualizations you'll create!
+
+Happy creating!
+The Oriel FX Team
+        """
+
+_RESET_HTML_TMPL = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="utf-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>Reset Your Oriel FX Password</title>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <h1>🔐 Password Reset</h1>
+                    <p>Reset your Oriel FX account password</p>
+                </div>
+                <div class="content">
+                    <h2>Reset Your Password</h2>
+                    <p>We received a request to reset your password. Click the button below to create a new password:</p>
+                    
+                    <a href="{reset_url}">Reset Password</a>
+                    
+                    <p><strong>Important:</strong> This link will expire in 1 hour for security reasons.</p>
+                    
+                    <p>If you didn't request this password reset, please ignore this email. Your password will remain unchanged.</p>
+                </div>
+                <div class="footer">
+                    <p>Oriel FX Security Team</p>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+
+_RESET_TEXT_TMPL = """
+Reset Your Oriel FX Password
+
+We received a request to reset your password. Click the link below to create a new password:
+
+{reset_url}
+
+IMPORTANT: This link will expire in 1 hour for security reasons.
+
+If you didn't request this password reset, please ignore this email. Your password will remain unchanged.
+
+Oriel FX Security Team
+        """
+
+_COMPLETION_HTML_TMPL = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="utf-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>Your Oriel FX Video is Ready!</title>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <h1>🎬 Your Video is Ready!</h1>
+                    <p>Your Oriel FX audio visualization has been created successfully</p>
+                </div>
+                <div class="content">
+                    <h2>Download Your Masterpiece</h2>
+                    <p>Great news! Your audio visualization video has been processed and is ready for download.</p>
+                    
+                    <p><strong>Job ID:</strong> {job_id}</p>
+                    
+                    <a href="{video_url}">Download Video</a>
+                    
+                    <p><strong>Important:</strong> This download link will expire in 24 hours for security reasons. Please download your video soon!</p>
+                    
+                    <h3>What's Next?</h3>
+                    <ul>
+                        <li>Share your creation on social media</li>
+                        <li>Create more visualizations with different audio tracks</li>
+                        <li>Explore our premium features for longer videos</li>
+                    </ul>
+                </div>
+                <div class="footer">
+                    <p>Thanks for using Oriel FX!</p>
+                    <p>If you have any questions, feel free to reach out to our support team.</p>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+
+_COMPLETION_TEXT_TMPL = """
+Your Oriel FX Video is Ready!
+
+Great news! Your audio visualization video has been processed and is ready for download.
+
+Job ID: {job_id}
+
+Download your video: {video_url}
+
+IMPORTANT: This download link will expire in 24 hours for security reasons. Please download your video soon!
+
+What's Next?
+- Share your creation on social media
+- Create more visualizations with different audio tracks
+- Explore our premium features for longer videos
+
+Thanks for using Oriel FX!
+
+If you have any questions, feel free to reach out to our support team.
+        """
+
+
+def _licensing_links(context: Dict[str, Any]) -> list:
+    """Highlight the secure download link of a licensing email."""
+    html_content = context['html_content']
+    
+    # Plain substring searches cover the usual case without the regex engine:
+    # locate the marker, then the href attribute that encloses it
+    index = html_content.find('secure_download')
+    if index == -1:
+        return []
+    start = html_content.rfind('href="', 0, index)
+    end = html_content.find('"', index)
+    if start != -1 and end != -1 and html_content.find('"', start + 6, index) == -1:
+        return [("Secure Download", html_content[start + 6:end])]
+    
+    # The first marker is not inside an href; let the regex find a later one
+    download_match = _SECURE_DL_RE.search(html_content)
+    if download_match:
+        return [("Secure Download", download_match.group(1))]
+    return []
+
+
+# Per-kind subject, templates, highlighted links and reference ids. Kinds
+# without templates take their subject and bodies from the caller.
+_EMAIL_KINDS = {
+    'password_reset': {
+        'subject': "Reset Your Oriel FX Password",
+        'html': _RESET_HTML_TMPL,
+        'text': _RESET_TEXT_TMPL,
+        'links': lambda context: [("Reset Password", context['reset_url'])],
+        'ids': (),
+        'description': "password reset email for {user_email}",
+    },
+    'welcome': {
+        'subject': "Welcome to Oriel FX! 🎵✨",
+        'html': _WELCOME_HTML_TMPL,
+        'text': _WELCOME_TEXT_TMPL,
+        'links': lambda context: [("Start Creating", "http://localhost:3000/dashboard")],
+        'ids': (),
+        'description': "welcome email for {user_email}",
+    },
+    'video_completion': {
+        'subject': "Your Oriel FX Video is Ready! 🎬",
+        'html': _COMPLETION_HTML_TMPL,
+        'text': _COMPLETION_TEXT_TMPL,
+        'links': lambda context: [("Download Video", context['video_url'])],
+        'ids': ('job_id',),
+        'description': "video completion email for job {job_id}",
+    },
+    'licensing': {
+        'subject': None,
+        'html': None,
+        'text': None,
+        'links': _licensing_links,
+        'ids': ('purchase_id',),
+        'description': "licensing email for purchase {purchase_id}",
+    },
+}
+
 
 class ConsoleEmailService(EmailServiceInterface):
     """Email service that logs emails to console for development."""
     
+    # Several modules build their own instance; announce the mode only once
+    _announced = False
+    
     def __init__(self):
         """Initialize console email service."""
-        self.logger = logging.getLogger(__name__)
-        self.logger.info("🔧 Console Email Service initialized - Development Mode Active")
+        self.logger = logger
+        self._email_logger = _get_console_logger()
+        if not ConsoleEmailService._announced:
+            ConsoleEmailService._announced = True
+            logger.info("🔧 Console Email Service initialized - Development Mode Active")
     
     def send_password_reset_email(self, user_email: str, reset_token: str) -> Dict[str, Any]:
         """
@@ -28,41 +345,9 @@ class ConsoleEmailService(EmailServiceInterface):
         Returns:
             dict: Email sending result
         """
-        try:
-            # Create reset URL (this would be your frontend URL)
-            reset_url = f"http://localhost:3000/reset-password?token={reset_token}"
-            
-            subject = "Reset Your Oriel FX Password"
-            html_content = self._create_password_reset_email_html(reset_url)
-            text_content = self._create_password_reset_email_text(reset_url)
-            
-            # Log email to console with formatting
-            self._log_email(
-                to=user_email,
-                subject=subject,
-                html_content=html_content,
-                text_content=text_content,
-                important_links=[("Reset Password", reset_url)]
-            )
-            
-            return {
-                'success': True,
-                'email': user_email,
-                'status_code': 200,
-                'sent_at': datetime.now(timezone.utc).isoformat(),
-                'mode': 'console'
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Failed to log password reset email for {user_email}: {e}")
-            return {
-                'success': False,
-                'email': user_email,
-                'status_code': 500,
-                'sent_at': datetime.now(timezone.utc).isoformat(),
-                'mode': 'console',
-                'error': str(e)
-            }
+        # Create reset URL (this would be your frontend URL)
+        reset_url = f"http://localhost:3000/reset-password?token={reset_token}"
+        return self._send('password_reset', user_email, reset_url=reset_url)
     
     def send_welcome_email(self, user_email: str, user_name: str = None) -> Dict[str, Any]:
         """
@@ -75,38 +360,7 @@ class ConsoleEmailService(EmailServiceInterface):
         Returns:
             dict: Email sending result
         """
-        try:
-            subject = "Welcome to Oriel FX! 🎵✨"
-            html_content = self._create_welcome_email_html(user_name or user_email)
-            text_content = self._create_welcome_email_text(user_name or user_email)
-            
-            # Log email to console with formatting
-            self._log_email(
-                to=user_email,
-                subject=subject,
-                html_content=html_content,
-                text_content=text_content,
-                important_links=[("Start Creating", "http://localhost:3000/dashboard")]
-            )
-            
-            return {
-                'success': True,
-                'email': user_email,
-                'status_code': 200,
-                'sent_at': datetime.now(timezone.utc).isoformat(),
-                'mode': 'console'
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Failed to log welcome email for {user_email}: {e}")
-            return {
-                'success': False,
-                'email': user_email,
-                'status_code': 500,
-                'sent_at': datetime.now(timezone.utc).isoformat(),
-                'mode': 'console',
-                'error': str(e)
-            }
+        return self._send('welcome', user_email, user_name=user_name or user_email)
     
     def send_video_completion_email(self, user_email: str, video_url: str, job_id: str) -> Dict[str, Any]:
         """
@@ -120,41 +374,7 @@ class ConsoleEmailService(EmailServiceInterface):
         Returns:
             dict: Email sending result
         """
-        try:
-            subject = "Your Oriel FX Video is Ready! 🎬"
-            html_content = self._create_completion_email_html(video_url, job_id)
-            text_content = self._create_completion_email_text(video_url, job_id)
-            
-            # Log email to console with formatting
-            self._log_email(
-                to=user_email,
-                subject=subject,
-                html_content=html_content,
-                text_content=text_content,
-                important_links=[("Download Video", video_url)],
-                job_id=job_id
-            )
-            
-            return {
-                'success': True,
-                'email': user_email,
-                'status_code': 200,
-                'sent_at': datetime.now(timezone.utc).isoformat(),
-                'mode': 'console',
-                'job_id': job_id
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Failed to log video completion email for job {job_id}: {e}")
-            return {
-                'success': False,
-                'email': user_email,
-                'status_code': 500,
-                'sent_at': datetime.now(timezone.utc).isoformat(),
-                'mode': 'console',
-                'job_id': job_id,
-                'error': str(e)
-            }
+        return self._send('video_completion', user_email, video_url=video_url, job_id=job_id)
     
     def send_licensing_email(self, user_email: str, subject: str, html_content: str, 
                            text_content: str, purchase_id: str) -> Dict[str, Any]:
@@ -171,47 +391,95 @@ class ConsoleEmailService(EmailServiceInterface):
         Returns:
             dict: Email sending result
         """
+        return self._send(
+            'licensing', user_email,
+            subject=subject,
+            html_content=html_content,
+            text_content=text_content,
+            purchase_id=purchase_id
+        )
+    
+    def _send(self, kind: str, user_email: str, **context) -> Dict[str, Any]:
+        """
+        Log one of the known email kinds and build the sending result.
+        
+        Args:
+            kind: Key into _EMAIL_KINDS
+            user_email: Recipient email address
+            **context: Template fields, plus subject/html_content/text_content
+                for kinds that are not built from a template
+            
+        Returns:
+            dict: Email sending result
+        """
+        config = _EMAIL_KINDS[kind]
+        sent_at = datetime.now(timezone.utc).isoformat()
+        ids = {key: context[key] for key in config['ids']}
+        
         try:
-            # Extract download link for highlighting
-            import re
-            download_match = re.search(r'href="([^"]*secure_download[^"]*)"', html_content)
-            download_links = []
-            if download_match:
-                download_links.append(("Secure Download", download_match.group(1)))
+            subject = config['subject'] or context['subject']
+            important_links = config['links'](context)
             
-            # Log email to console with formatting
-            self._log_email(
-                to=user_email,
-                subject=subject,
-                html_content=html_content,
-                text_content=text_content,
-                important_links=download_links,
-                purchase_id=purchase_id
-            )
+            if self._verbose():
+                if config['html'] is None:
+                    html_content = context['html_content']
+                    text_content = context['text_content']
+                else:
+                    html_content = config['html'].format_map(context)
+                    text_content = config['text'].format_map(context)
+                
+                # Log email to console with formatting
+                self._log_email(
+                    to=user_email,
+                    subject=subject,
+                    html_content=html_content,
+                    text_content=text_content,
+                    important_links=important_links,
+                    timestamp=sent_at,
+                    **ids
+                )
+            else:
+                self._log_summary(user_email, subject, important_links)
             
             return {
                 'success': True,
                 'email': user_email,
                 'status_code': 200,
-                'sent_at': datetime.now(timezone.utc).isoformat(),
+                'sent_at': sent_at,
                 'mode': 'console',
-                'purchase_id': purchase_id
+                **ids
             }
             
         except Exception as e:
-            self.logger.error(f"Failed to log licensing email for purchase {purchase_id}: {e}")
+            description = config['description'].format(user_email=user_email, **ids)
+            self.logger.error(f"Failed to log {description}: {e}")
             return {
                 'success': False,
                 'email': user_email,
                 'status_code': 500,
-                'sent_at': datetime.now(timezone.utc).isoformat(),
+                'sent_at': sent_at,
                 'mode': 'console',
-                'purchase_id': purchase_id,
+                **ids,
                 'error': str(e)
             }
     
+    def _verbose(self) -> bool:
+        """Whether full email bodies should be built and dumped to the console."""
+        return self.logger.isEnabledFor(logging.DEBUG)
+    
+    def _log_summary(self, to: str, subject: str, important_links: list = None):
+        """
+        Log a one-line record of an email instead of the full console dump.
+        
+        Links are kept so reset and download URLs stay reachable without
+        DEBUG logging.
+        """
+        links = ''.join(f" | {label}: {url}" for label, url in important_links or ())
+        self.logger.info(f"[email] to={to} subject={subject} mode=console{links}")
+    
     def _log_email(self, to: str, subject: str, html_content: str, text_content: str, 
-                   important_links: list = None, job_id: str = None, purchase_id: str = None):
+                   important_links: list = None, job_id: str = None, purchase_id: str = None,
+                   timestamp: str = None):
         """
         Log email content to console with pretty formatting.
         
@@ -223,45 +491,43 @@ class ConsoleEmailService(EmailServiceInterface):
             important_links: List of (label, url) tuples for highlighting
             job_id: Optional job ID for video emails
             purchase_id: Optional purchase ID for licensing emails
+            timestamp: ISO send time already captured by the caller
         """
-        separator = "=" * 80
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc).isoformat()
+        
+        # Write the whole block into one buffer and emit it as one record, so
+        # one email costs a single queue put on the calling thread
+        buf = io.StringIO()
+        w = buf.write
         
         # Main email header
-        print(f"\n{separator}")
-        print("📧 EMAIL SENT (DEVELOPMENT MODE)")
-        print(separator)
-        print(f"To: {to}")
-        print(f"Subject: {subject}")
-        print(f"Mode: Console Logging")
-        print(f"Timestamp: {datetime.now(timezone.utc).isoformat()}Z")
+        w(_LOG_HEADER)
+        w(f"To: {to}\nSubject: {subject}\nMode: Console Logging\nTimestamp: {timestamp}Z\n")
         
         if job_id:
-            print(f"Job ID: {job_id}")
+            w(f"Job ID: {job_id}\n")
         
         if purchase_id:
-            print(f"Purchase ID: {purchase_id}")
+            w(f"Purchase ID: {purchase_id}\n")
         
         # Important links section
         if important_links:
-            print(f"\n🔗 IMPORTANT LINKS:")
+            w("\n🔗 IMPORTANT LINKS:\n")
             for label, url in important_links:
-                print(f"{label}: {url}")
+                w(f"{label}: {url}\n")
         
-        # HTML content section
-        print(f"\n📄 HTML CONTENT:")
-        print("-" * 40)
-        # Clean up HTML for better console readability
-        clean_html = self._clean_html_for_console(html_content)
-        print(clean_html)
+        # HTML content section, cleaned up for console readability
+        w(_LOG_HTML_HEADER)
+        w(self._clean_html_for_console(html_content))
         
         # Text content section
-        print(f"\n📝 TEXT CONTENT:")
-        print("-" * 40)
-        print(text_content.strip())
+        w(_LOG_TEXT_HEADER)
+        w(text_content.strip())
+        
+        w(_LOG_FOOTER)
         
-        print(f"\n{separator}")
-        print("✅ Email logged successfully to console")
-        print(separator)
+        self._email_logger.info(buf.getvalue())
     
     def _clean_html_for_console(self, html_content: str) -> str:
         """
@@ -273,218 +539,33 @@ class ConsoleEmailService(EmailServiceInterface):
         Returns:
             str: Cleaned content for console display
         """
-        import re
-        
-        # Remove HTML tags but keep the content
-        clean = re.sub(r'<[^>]+>', '', html_content)
-        
-        # Clean up extra whitespace
-        clean = re.sub(r'\n\s*\n', '\n\n', clean)
-        clean = re.sub(r'^\s+', '', clean, flags=re.MULTILINE)
-        
-        # Limit line length for better console readability
-        lines = clean.split('\n')
-        formatted_lines = []
-        for line in lines:
-            if len(line) > 70:
-                # Simple word wrap
-                words = line.split()
-                current_line = ""
-                for word in words:
-                    if len(current_line + word) > 70:
-                        if current_line:
-                            formatted_lines.append(current_line.strip())
-                            current_line = word + " "
-                        else:
-                            formatted_lines.append(word)
-                            current_line = ""
-                    else:
-                        current_line += word + " "
-                if current_line:
-                    formatted_lines.append(current_line.strip())
-            else:
-                formatted_lines.append(line)
-        
-        return '\n'.join(formatted_lines).strip()
+        if len(html_content) > _CLEAN_HTML_CACHE_MAX_CHARS:
+            return _clean_html(html_content)
+        return _clean_html_cached(html_content)
     
     def _create_completion_email_html(self, video_url: str, job_id: str) -> str:
         """Create HTML content for video completion email."""
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Your Oriel FX Video is Ready!</title>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🎬 Your Video is Ready!</h1>
-                    <p>Your Oriel FX audio visualization has been created successfully</p>
-                </div>
-                <div class="content">
-                    <h2>Download Your Masterpiece</h2>
-                    <p>Great news! Your audio visualization video has been processed and is ready for download.</p>
-                    
-                    <p><strong>Job ID:</strong> {job_id}</p>
-                    
-                    <a href="{video_url}">Download Video</a>
-                    
-                    <p><strong>Important:</strong> This download link will expire in 24 hours for security reasons. Please download your video soon!</p>
-                    
-                    <h3>What's Next?</h3>
-                    <ul>
-                        <li>Share your creation on social media</li>
-                        <li>Create more visualizations with different audio tracks</li>
-                        <li>Explore our premium features for longer videos</li>
-                    </ul>
-                </div>
-                <div class="footer">
-                    <p>Thanks for using Oriel FX!</p>
-                    <p>If you have any questions, feel free to reach out to our support team.</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        return _COMPLETION_HTML_TMPL.format(video_url=video_url, job_id=job_id)
     
     def _create_completion_email_text(self, video_url: str, job_id: str) -> str:
         """Create plain text content for video completion email."""
-        return f"""
-Your Oriel FX Video is Ready!
-
-Great news! Your audio visualization video has been processed and is ready for download.
-
-Job ID: {job_id}
-
-Download your video: {video_url}
-
-IMPORTANT: This download link will expire in 24 hours for security reasons. Please download your video soon!
-
-What's Next?
-- Share your creation on social media
-- Create more visualizations with different audio tracks
-- Explore our premium features for longer videos
-
-Thanks for using Oriel FX!
-
-If you have any questions, feel free to reach out to our support team.
-        """
+        return _COMPLETION_TEXT_TMPL.format(video_url=video_url, job_id=job_id)
     
     def _create_welcome_email_html(self, user_name: str) -> str:
         """Create HTML content for welcome email."""
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Welcome to Oriel FX!</title>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🎵 Welcome to Oriel FX!</h1>
-                    <p>Transform your audio into stunning visual experiences</p>
-                </div>
-                <div class="content">
-                    <h2>Hello {user_name}!</h2>
-                    <p>Welcome to Oriel FX, where your music comes to life through beautiful visualizations!</p>
-                    
-                    <h3>Getting Started</h3>
-                    <ul>
-                        <li>Upload your favorite audio tracks</li>
-                        <li>Choose from various visualization styles</li>
-                        <li>Customize colors and effects</li>
-                        <li>Download your personalized video</li>
-                    </ul>
-                    
-                    <a href="http://localhost:3000/dashboard">Start Creating</a>
-                    
-                    <p>We're excited to see what amazing visualizations you'll create!</p>
-                </div>
-                <div class="footer">
-                    <p>Happy creating!</p>
-                    <p>The Oriel FX Team</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        return _WELCOME_HTML_TMPL.format(user_name=user_name)
     
     def _create_welcome_email_text(self, user_name: str) -> str:
         """Create plain text content for welcome email."""
-        return f"""
-Welcome to Oriel FX!
-
-Hello {user_name}!
-
-Welcome to Oriel FX, where your music comes to life through beautiful visualizations!
-
-Getting Started:
-- Upload your favorite audio tracks
-- Choose from various visualization styles
-- Customize colors and effects
-- Download your personalized video
-
-Start creating: http://localhost:3000/dashboard
-
-We're excited to see what amazing visualizations you'll create!
-
-Happy creating!
-The Oriel FX Team
-        """
+        return _WELCOME_TEXT_TMPL.format(user_name=user_name)
     
     def _create_password_reset_email_html(self, reset_url: str) -> str:
         """Create HTML content for password reset email."""
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Reset Your Oriel FX Password</title>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🔐 Password Reset</h1>
-                    <p>Reset your Oriel FX account password</p>
-                </div>
-                <div class="content">
-                    <h2>Reset Your Password</h2>
-                    <p>We received a request to reset your password. Click the button below to create a new password:</p>
-                    
-                    <a href="{reset_url}">Reset Password</a>
-                    
-                    <p><strong>Important:</strong> This link will expire in 1 hour for security reasons.</p>
-                    
-                    <p>If you didn't request this password reset, please ignore this email. Your password will remain unchanged.</p>
-                </div>
-                <div class="footer">
-                    <p>Oriel FX Security Team</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        return _RESET_HTML_TMPL.format(reset_url=reset_url)
     
     def _create_password_reset_email_text(self, reset_url: str) -> str:
         """Create plain text content for password reset email."""
-        return f"""
-Reset Your Oriel FX Password
-
-We received a request to reset your password. Click the link below to create a new password:
-
-{reset_url}
-
-IMPORTANT: This link will expire in 1 hour for security reasons.
-
-If you didn't request this password reset, please ignore this email. Your password will remain unchanged.
-
-Oriel FX Security Team
-        """
+        return _RESET_TEXT_TMPL.format(reset_url=reset_url)
     
     def send_email(self, to_email: str, subject: str, html_content: str = None, 
                    text_content: str = None, **kwargs) -> Dict[str, Any]:
@@ -501,38 +582,44 @@ Oriel FX Security Team
         Returns:
             dict: Email sending result
         """
+        sent_at = datetime.now(timezone.utc).isoformat()
+        
         try:
-            # Use text content if no HTML provided
-            if not html_content and text_content:
-                html_content = f"<pre>{text_content}</pre>"
-            
-            # Use HTML content if no text provided
-            if not text_content and html_content:
-                text_content = self._clean_html_for_console(html_content)
-            
-            # Default content if neither provided
-            if not html_content and not text_content:
-                html_content = "<p>No content provided</p>"
-                text_content = "No content provided"
-            
             # Extract any important links from kwargs or HTML
             important_links = kwargs.get('important_links', [])
             
-            # Log email to console with formatting
-            self._log_email(
-                to=to_email,
-                subject=subject,
-                html_content=html_content,
-                text_content=text_content,
-                important_links=important_links,
-                **{k: v for k, v in kwargs.items() if k not in ['important_links']}
-            )
+            if self._verbose():
+                # Use text content if no HTML provided
+                if not html_content and text_content:
+                    html_content = f"<pre>{text_content}</pre>"
+                
+                # Use HTML content if no text provided
+                if not text_content and html_content:
+                    text_content = self._clean_html_for_console(html_content)
+                
+                # Default content if neither provided
+                if not html_content and not text_content:
+                    html_content = "<p>No content provided</p>"
+                    text_content = "No content provided"
+                
+                # Log email to console with formatting
+                self._log_email(
+                    to=to_email,
+                    subject=subject,
+                    html_content=html_content,
+                    text_content=text_content,
+                    important_links=important_links,
+                    timestamp=sent_at,
+                    **{k: v for k, v in kwargs.items() if k not in ['important_links', 'timestamp']}
+                )
+            else:
+                self._log_summary(to_email, subject, important_links)
             
             return {
                 'success': True,
                 'email': to_email,
                 'status_code': 200,
-                'sent_at': datetime.now(timezone.utc).isoformat(),
+                'sent_at': sent_at,
                 'mode': 'console'
             }
             
@@ -542,7 +629,7 @@ Oriel FX Security Team
                 'success': False,
                 'email': to_email,
                 'status_code': 500,
-                'sent_at': datetime.now(timezone.utc).isoformat(),
+                'sent_at': sent_at,
                 'mode': 'console',
                 'error': str(e)
             }
\ No newline at end of file
@@ -1,9 +1,7 @@
 """
 Email service factory for choosing between development and production email services.
 """
-import os
 import logging
-from typing import Union
 from flask import current_app
 
 from .interface import EmailServiceInterface
@@ -16,14 +14,35 @@ def get_email_service() -> EmailServiceInterface:
     """
     Get the appropriate email service based on environment configuration.
     
+    The service is built on first use and cached on the app, so later calls
+    skip the config checks and SendGrid client setup.
+    
+    Returns:
+        EmailServiceInterface: Configured email service (SendGrid or Console)
+    """
+    app = current_app._get_current_object()
+    service = app.extensions.get('email_service')
+    if service is None:
+        service = _build_email_service(app)
+        app.extensions['email_service'] = service
+    return service
+
+
+def _build_email_service(app) -> EmailServiceInterface:
+    """
+    Build the email service for an app from its configuration.
+    
+    Args:
+        app: Flask application instance
+        
     Returns:
         EmailServiceInterface: Configured email service (SendGrid or Console)
     """
     try:
         # Check if we're in development mode or if SendGrid is not configured
-        is_development = current_app.config.get('ENV') == 'development'
-        sendgrid_api_key = current_app.config.get('SENDGRID_API_KEY')
-        sendgrid_from_email = current_app.config.get('SENDGRID_FROM_EMAIL')
+        is_development = app.config.get('ENV') == 'development'
+        sendgrid_api_key = app.config.get('SENDGRID_API_KEY')
+        sendgrid_from_email = app.config.get('SENDGRID_FROM_EMAIL')
         
         # Use console service if in development or SendGrid not configured
         if is_development or not sendgrid_api_key or not sendgrid_from_email:
@@ -1,20 +1,100 @@
 """
 Comprehensive error handling and response formatting for the API
 """
-from flask import jsonify, current_app, request
+from flask import jsonify, current_app, request, g, has_request_context, url_for
 from werkzeug.exceptions import HTTPException
+from werkzeug.routing import BuildError
+import atexit
+import itertools
+import os
+import queue
+import random
+import re
 import traceback
 import logging
+import logging.handlers
 import time
 from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+# Default error codes by HTTP status, shared by every APIError
+_STATUS_CODE_MAP = MappingProxyType({
+    400: 'BAD_REQUEST',
+    401: 'UNAUTHORIZED',
+    403: 'FORBIDDEN',
+    404: 'NOT_FOUND',
+    409: 'CONFLICT',
+    413: 'PAYLOAD_TOO_LARGE',
+    415: 'UNSUPPORTED_MEDIA_TYPE',
+    422: 'UNPROCESSABLE_ENTITY',
+    429: 'TOO_MANY_REQUESTS',
+    500: 'INTERNAL_SERVER_ERROR',
+    502: 'BAD_GATEWAY',
+    503: 'SERVICE_UNAVAILABLE'
+})
+
+# Per-process sequence for request IDs when no logging middleware ID is set
+_REQUEST_COUNTER = itertools.count()
+
+# Maximum stack frames included in DEBUG error responses
+TRACEBACK_LIMIT = 20
+
+_SUPPORTED_AUDIO_TYPES = (
+    'audio/mpeg', 'audio/wav', 'audio/mp4', 'audio/x-m4a', 'audio/aac', 'audio/flac', 'audio/ogg'
+)
+
+# Failure classification for external service errors, most specific first
+_SERVICE_ERROR_RE = re.compile(
+    r'(?P<timeout>timeout)|(?P<connection>connection)|(?P<auth>authentication|unauthorized)',
+    re.IGNORECASE
+)
+_SERVICE_ERROR_PRIORITY = ('timeout', 'connection', 'auth')
+_SERVICE_ERROR_KINDS = {
+    'timeout': ("{title} service timeout during {operation}", 'TIMEOUT'),
+    'connection': ("Connection error to {service} service during {operation}", 'CONNECTION_ERROR'),
+    'auth': ("Authentication error with {service} service", 'AUTH_ERROR'),
+}
+
+# Placeholder string values in prebuilt error bodies, as serialized
+_PLACEHOLDER_RE = re.compile(r'"__(\w+?)__"')
+
+_API_ERROR_LOG_LABELS = {logging.ERROR: "Server error", logging.WARNING: "Client error"}
+
+# Error log records waiting for the background writer; beyond this, new
+# records are dropped rather than blocking request threads
+ERROR_LOG_QUEUE_SIZE = 10000
+
+_error_log_listener = None
+
+
+def _now_iso():
+    """
+    Current UTC time in ISO format for error payloads.
+    
+    Inside a request the value is computed once and reused, so every error
+    body and log record produced while handling that request carries the
+    same timestamp.
+    """
+    if not has_request_context():
+        return datetime.utcnow().isoformat()
+    
+    timestamp = g.get('_error_timestamp')
+    if timestamp is None:
+        timestamp = g._error_timestamp = datetime.utcnow().isoformat()
+    return timestamp
+
 
 class APIError(Exception):
     """Base custom API error class for consistent error responses"""
     
+    # Slots keep the per-instance attributes out of the exception's __dict__,
+    # which then never needs to be allocated; subclasses declare empty slots
+    __slots__ = ('message', 'status_code', 'error_code', 'details', 'recoverable',
+                 '_log_level', '_timestamp', '_dict_cache')
+    
     def __init__(self, message, status_code=400, error_code=None, details=None, recoverable=False):
         super().__init__(message)
         self.message = message
@@ -22,54 +102,92 @@ class APIError(Exception):
         self.error_code = error_code or self._generate_error_code()
         self.details = details or {}
         self.recoverable = recoverable
-        self.timestamp = datetime.utcnow().isoformat()
+        # Level log_error uses for this error; statuses below 400 aren't logged
+        if status_code >= 500:
+            self._log_level = logging.ERROR
+        elif status_code >= 400:
+            self._log_level = logging.WARNING
+        else:
+            self._log_level = None
+        self._timestamp = None
+        self._dict_cache = None
+    
+    def __reduce__(self):
+        # BaseException only pickles ``args`` and ``__dict__``, which would
+        # drop the slot fields; rebuild without calling the subclass __init__,
+        # whose signature need not match ``args``
+        state = {name: getattr(self, name) for name in APIError.__slots__}
+        state['_dict_cache'] = None
+        return _rebuild_api_error, (type(self), self.args, state, self.__dict__ or None)
+    
+    @property
+    def timestamp(self):
+        """ISO timestamp, taken when the error is first serialized"""
+        if self._timestamp is None:
+            self._timestamp = _now_iso()
+        return self._timestamp
     
     def _generate_error_code(self):
         """Generate error code from status code"""
-        code_map = {
-            400: 'BAD_REQUEST',
-            401: 'UNAUTHORIZED',
-            403: 'FORBIDDEN',
-            404: 'NOT_FOUND',
-            409: 'CONFLICT',
-            413: 'PAYLOAD_TOO_LARGE',
-            415: 'UNSUPPORTED_MEDIA_TYPE',
-            422: 'UNPROCESSABLE_ENTITY',
-            429: 'TOO_MANY_REQUESTS',
-            500: 'INTERNAL_SERVER_ERROR',
-            502: 'BAD_GATEWAY',
-            503: 'SERVICE_UNAVAILABLE'
-        }
-        return code_map.get(self.status_code, 'UNKNOWN_ERROR')
+        return _STATUS_CODE_MAP.get(self.status_code, 'UNKNOWN_ERROR')
     
     def to_dict(self):
-        """Convert error to dictionary for JSON response"""
-        return {
-            'error': {
-                'code': self.error_code,
-                'message': self.message,
-                'details': self.details,
-                'timestamp': self.timestamp,
-                'recoverable': self.recoverable
+        """
+        Convert error to dictionary for JSON response.
+        
+        The dictionary is built on first use and reused afterwards, so treat
+        the error's fields (including ``details``) as frozen once it has been
+        serialized.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'error': {
+                    'code': self.error_code,
+                    'message': self.message,
+                    'details': self.details,
+                    'timestamp': self.timestamp,
+                    'recoverable': self.recoverable
+                }
             }
-        }
+        return self._dict_cache
+    
+    def get_json_data(self):
+        """Error body without the ``error`` wrapper, for nesting in larger payloads"""
+        return self.to_dict()['error']
+
+
+def _rebuild_api_error(cls, args, state, attrs):
+    """Recreate a pickled or copied APIError with its slot fields"""
+    error = cls.__new__(cls, *args)
+    error.args = args
+    for name, value in state.items():
+        setattr(error, name, value)
+    if attrs:
+        error.__dict__.update(attrs)
+    return error
 
 
 # Authentication and Authorization Errors
 class AuthenticationError(APIError):
     """Authentication related errors"""
+    __slots__ = ()
+    
     def __init__(self, message="Authentication failed", details=None):
         super().__init__(message, 401, 'AUTHENTICATION_FAILED', details)
 
 
 class AuthorizationError(APIError):
     """Authorization related errors"""
+    __slots__ = ()
+    
     def __init__(self, message="Access denied", details=None):
         super().__init__(message, 403, 'ACCESS_DENIED', details)
 
 
 class TokenError(APIError):
     """JWT token related errors"""
+    __slots__ = ()
+    
     def __init__(self, message="Invalid token", error_code="INVALID_TOKEN", details=None):
         super().__init__(message, 401, error_code, details)
 
@@ -77,12 +195,16 @@ class TokenError(APIError):
 # Payment Processing Errors
 class PaymentError(APIError):
     """Payment processing related errors"""
+    __slots__ = ()
+    
     def __init__(self, message, error_code="PAYMENT_ERROR", details=None, recoverable=True):
         super().__init__(message, 402, error_code, details, recoverable)
 
 
 class StripeError(PaymentError):
     """Stripe specific errors"""
+    __slots__ = ()
+    
     def __init__(self, message, stripe_error_type=None, details=None):
         error_code = f"STRIPE_{stripe_error_type.upper()}" if stripe_error_type else "STRIPE_ERROR"
         super().__init__(message, error_code, details, recoverable=True)
@@ -91,18 +213,24 @@ class StripeError(PaymentError):
 # File and Upload Errors
 class FileError(APIError):
     """File handling related errors"""
+    __slots__ = ()
+    
     def __init__(self, message, error_code="FILE_ERROR", details=None):
         super().__init__(message, 400, error_code, details)
 
 
 class FileValidationError(FileError):
     """File validation errors"""
+    __slots__ = ()
+    
     def __init__(self, message, details=None):
         super().__init__(message, "FILE_VALIDATION_ERROR", details)
 
 
 class FileSizeError(FileError):
     """File size related errors"""
+    __slots__ = ()
+    
     def __init__(self, message, max_size=None, actual_size=None):
         details = {}
         if max_size:
@@ -115,18 +243,24 @@ class FileSizeError(FileError):
 # Video Rendering Errors
 class RenderingError(APIError):
     """Video rendering related errors"""
+    __slots__ = ()
+    
     def __init__(self, message, error_code="RENDERING_ERROR", details=None, recoverable=True):
         super().__init__(message, 500, error_code, details, recoverable)
 
 
 class RenderingTimeoutError(RenderingError):
     """Rendering timeout errors"""
+    __slots__ = ()
+    
     def __init__(self, message="Rendering operation timed out", details=None):
         super().__init__(message, "RENDERING_TIMEOUT", details, recoverable=True)
 
 
 class RenderingResourceError(RenderingError):
     """Rendering resource errors (memory, disk space, etc.)"""
+    __slots__ = ()
+    
     def __init__(self, message, resource_type=None, details=None):
         error_code = f"RENDERING_{resource_type.upper()}_ERROR" if resource_type else "RENDERING_RESOURCE_ERROR"
         super().__init__(message, error_code, details, recoverable=True)
@@ -135,6 +269,8 @@ class RenderingResourceError(RenderingError):
 # External Service Errors
 class ExternalServiceError(APIError):
     """External service related errors"""
+    __slots__ = ()
+    
     def __init__(self, service_name, message, error_code=None, details=None, recoverable=True):
         if not error_code:
             error_code = f"{service_name.upper()}_SERVICE_ERROR"
@@ -143,12 +279,16 @@ class ExternalServiceError(APIError):
 
 class StorageError(ExternalServiceError):
     """Cloud storage related errors"""
+    __slots__ = ()
+    
     def __init__(self, message, details=None):
         super().__init__("storage", message, "STORAGE_ERROR", details, recoverable=True)
 
 
 class EmailError(ExternalServiceError):
     """Email service related errors"""
+    __slots__ = ()
+    
     def __init__(self, message, details=None):
         super().__init__("email", message, "EMAIL_ERROR", details, recoverable=True)
 
@@ -156,6 +296,8 @@ class EmailError(ExternalServiceError):
 # Database Errors
 class DatabaseError(APIError):
     """Database related errors"""
+    __slots__ = ()
+    
     def __init__(self, message, error_code="DATABASE_ERROR", details=None, recoverable=True):
         super().__init__(message, 500, error_code, details, recoverable)
 
@@ -163,6 +305,8 @@ class DatabaseError(APIError):
 # Validation Errors
 class ValidationError(APIError):
     """Input validation errors"""
+    __slots__ = ()
+    
     def __init__(self, message, field=None, details=None):
         if field and not details:
             details = {'field': field}
@@ -174,6 +318,8 @@ class ValidationError(APIError):
 # Rate Limiting Errors
 class RateLimitError(APIError):
     """Rate limiting errors"""
+    __slots__ = ()
+    
     def __init__(self, message="Rate limit exceeded", retry_after=None, details=None):
         if retry_after and not details:
             details = {'retry_after': retry_after}
@@ -183,11 +329,27 @@ class RateLimitError(APIError):
 
 
 def log_error(error, context=None):
-    """Log error with context information"""
+    """
+    Log error with context information.
+    
+    Returns the logged context, or None when the log level filters the
+    record out (the context is then never built).
+    """
+    if isinstance(error, APIError):
+        level = error._log_level
+        if level is None:
+            return None
+        label = _API_ERROR_LOG_LABELS[level]
+    else:
+        level, label = logging.ERROR, "Unexpected error"
+    
+    if not logger.isEnabledFor(level):
+        return None
+    
     error_info = {
         'error_type': type(error).__name__,
         'error_message': str(error),
-        'timestamp': datetime.utcnow().isoformat(),
+        'timestamp': _now_iso(),
         'request_id': getattr(request, 'id', None),
         'user_agent': request.headers.get('User-Agent') if request else None,
         'ip_address': request.remote_addr if request else None,
@@ -199,21 +361,129 @@ def log_error(error, context=None):
     if context:
         error_info['context'] = context
     
-    if isinstance(error, APIError):
-        if error.status_code >= 500:
-            logger.error(f"Server error: {error_info}", exc_info=True)
-        elif error.status_code >= 400:
-            logger.warning(f"Client error: {error_info}")
-    else:
-        logger.error(f"Unexpected error: {error_info}", exc_info=True)
+    # Formatting is deferred to the handlers on the log writer thread, which
+    # has no request context, so carry the request fields on the record
+    extra = {
+        key: error_info[key]
+        for key in ('request_id', 'endpoint', 'method', 'url', 'ip_address')
+    }
+    logger.log(level, "%s: %s", label, error_info, exc_info=level >= logging.ERROR, extra=extra)
     
     return error_info
 
 
-def format_error_response(error, status_code=500, context=None):
-    """Format error response consistently for frontend consumption"""
-    # Log the error
-    log_error(error, context)
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full"""
+    
+    def __init__(self, record_queue):
+        super().__init__(record_queue)
+        self.dropped = 0
+    
+    def prepare(self, record):
+        # Records stay in this process, so leave formatting (including
+        # tracebacks) to the real handlers on the writer thread
+        return record
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return
+        
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            notice = logger.makeRecord(
+                logger.name, logging.WARNING, __file__, 0,
+                "Dropped %d error log records while the log queue was full", (dropped,), None
+            )
+            try:
+                self.queue.put_nowait(notice)
+            except queue.Full:
+                self.dropped += dropped
+
+
+def _stop_error_log_queue():
+    """Stop the background error log writer, flushing queued records"""
+    global _error_log_listener
+    if _error_log_listener is None:
+        return
+    
+    _error_log_listener.stop()
+    _error_log_listener = None
+    for handler in [h for h in logger.handlers if isinstance(h, _DroppingQueueHandler)]:
+        logger.removeHandler(handler)
+    logger.propagate = True
+
+
+def _init_error_log_queue():
+    """
+    Move this module's log output onto a background thread.
+    
+    The handlers error records would normally reach (via propagation to the
+    configured ``app`` logger) are driven by a QueueListener, so an error
+    storm costs request threads one queue put per record instead of the
+    formatting and file/stream writes.
+    """
+    global _error_log_listener
+    _stop_error_log_queue()
+    
+    handlers = []
+    current = logger
+    while current is not None:
+        handlers.extend(h for h in current.handlers if h not in handlers)
+        if not current.propagate:
+            break
+        current = current.parent
+    
+    if not handlers:
+        return
+    
+    record_queue = queue.Queue(ERROR_LOG_QUEUE_SIZE)
+    listener = logging.handlers.QueueListener(record_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    
+    logger.addHandler(_DroppingQueueHandler(record_queue))
+    logger.propagate = False
+    _error_log_listener = listener
+
+
+atexit.register(_stop_error_log_queue)
+
+
+def _prebuilt_json(app, payload):
+    """
+    Serialize an error payload once with the app's JSON provider.
+    
+    String values of the form ``'__name__'`` are placeholders. The returned
+    function takes the status code and a value for each placeholder, and
+    returns a JSON response with only those values serialized.
+    """
+    # Compact like jsonify outside debug mode; the template is split around
+    # the placeholders once, so values (some client-supplied) are never
+    # searched for further placeholders
+    parts = _PLACEHOLDER_RE.split(app.json.dumps(payload, separators=(',', ':')))
+    segments, names = parts[::2], parts[1::2]
+    
+    def render(status, **values):
+        body = [segments[0]]
+        for name, segment in zip(names, segments[1:]):
+            body.append(app.json.dumps(values[name], separators=(',', ':')))
+            body.append(segment)
+        body.append("\n")
+        return app.response_class(''.join(body), status=status, mimetype=app.json.mimetype)
+    
+    return render
+
+
+def format_error_response(error, status_code=500, context=None, skip_log=False):
+    """
+    Format error response consistently for frontend consumption.
+    
+    Pass ``skip_log=True`` when the caller has already logged the error.
+    """
+    if not skip_log:
+        log_error(error, context)
     
     if isinstance(error, APIError):
         return jsonify(error.to_dict()), error.status_code
@@ -224,16 +494,24 @@ def format_error_response(error, status_code=500, context=None):
                 'code': error.name.upper().replace(' ', '_'),
                 'message': error.description,
                 'details': {},
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': _now_iso(),
                 'recoverable': False
             }
         }), error.code
     
     # For unexpected errors, don't expose internal details in production
     if current_app.config.get('DEBUG'):
+        # Format the error's own traceback, capped so deep recursive
+        # failures don't produce huge strings
+        if error.__traceback__ is None:
+            formatted = traceback.format_exception_only(type(error), error)
+        else:
+            formatted = traceback.format_exception(
+                type(error), error, error.__traceback__, limit=TRACEBACK_LIMIT
+            )
         error_details = {
             'type': type(error).__name__,
-            'traceback': traceback.format_exc()
+            'traceback': ''.join(formatted)
         }
     else:
         error_details = {}
@@ -243,7 +521,7 @@ def format_error_response(error, status_code=500, context=None):
             'code': 'INTERNAL_SERVER_ERROR',
             'message': 'An unexpected error occurred',
             'details': error_details,
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': _now_iso(),
             'recoverable': False
         }
     }), status_code
@@ -259,24 +537,31 @@ class CircuitBreaker:
         self.expected_exception = expected_exception
         self.failure_count = 0
         self.last_failure_time = None
+        self._opened_at = None
         self.state = 'CLOSED'  # CLOSED, OPEN, HALF_OPEN
     
+    @property
+    def state(self):
+        """Current state: CLOSED, OPEN or HALF_OPEN"""
+        return self._state
+    
+    @state.setter
+    def state(self, value):
+        # Keep a single flag for the hot CLOSED path; resets elsewhere assign
+        # state directly, so it is derived here rather than in each caller
+        self._state = value
+        self._is_open = value != 'CLOSED'
+    
     def __call__(self, func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            if self.state == 'OPEN':
-                if time.time() - self.last_failure_time > self.recovery_timeout:
-                    self.state = 'HALF_OPEN'
-                else:
-                    raise ExternalServiceError(
-                        "service", 
-                        "Service temporarily unavailable due to repeated failures",
-                        details={'retry_after': self.recovery_timeout}
-                    )
+            if self._is_open:
+                self._before_call_when_open()
             
             try:
                 result = func(*args, **kwargs)
-                self._on_success()
+                if self._is_open or self.failure_count:
+                    self._on_success()
                 return result
             except self.expected_exception as e:
                 self._on_failure()
@@ -284,6 +569,20 @@ class CircuitBreaker:
         
         return wrapper
     
+    def _before_call_when_open(self):
+        """Let a trial call through after the recovery timeout, or fail fast"""
+        if self._state != 'OPEN':
+            return
+        
+        if self._opened_at is None or time.monotonic() - self._opened_at > self.recovery_timeout:
+            self.state = 'HALF_OPEN'
+        else:
+            raise ExternalServiceError(
+                "service", 
+                "Service temporarily unavailable due to repeated failures",
+                details={'retry_after': self.recovery_timeout}
+            )
+    
     def _on_success(self):
         """Reset circuit breaker on successful call"""
         self.failure_count = 0
@@ -293,6 +592,7 @@ class CircuitBreaker:
         """Handle failure and potentially open circuit"""
         self.failure_count += 1
         self.last_failure_time = time.time()
+        self._opened_at = time.monotonic()
         
         if self.failure_count >= self.failure_threshold:
             self.state = 'OPEN'
@@ -300,7 +600,14 @@ class CircuitBreaker:
 
 
 def retry_with_backoff(max_retries=3, backoff_factor=2, exceptions=(Exception,)):
-    """Decorator for retrying operations with exponential backoff"""
+    """
+    Decorator for retrying operations with exponential backoff.
+    
+    Each wait is jittered by +/-20% so callers that failed together don't
+    retry in lockstep.
+    """
+    delays = tuple(backoff_factor ** attempt for attempt in range(max_retries))
+    
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -316,8 +623,8 @@ def retry_with_backoff(max_retries=3, backoff_factor=2, exceptions=(Exception,))
                         logger.error(f"Function {func.__name__} failed after {max_retries + 1} attempts: {e}")
                         break
                     
-                    wait_time = backoff_factor ** attempt
-                    logger.warning(f"Function {func.__name__} failed (attempt {attempt + 1}), retrying in {wait_time}s: {e}")
+                    wait_time = delays[attempt] * (0.8 + 0.4 * random.random())
+                    logger.warning(f"Function {func.__name__} failed (attempt {attempt + 1}), retrying in {wait_time:.2f}s: {e}")
                     time.sleep(wait_time)
             
             raise last_exception
@@ -330,161 +637,168 @@ def handle_external_service_error(service_name, operation, error):
     """Handle external service errors with appropriate error types"""
     error_message = str(error)
     
-    # Map common error patterns to specific error types
-    if 'timeout' in error_message.lower():
-        raise ExternalServiceError(
-            service_name, 
-            f"{service_name.title()} service timeout during {operation}",
-            f"{service_name.upper()}_TIMEOUT",
-            {'operation': operation, 'original_error': error_message}
-        )
-    elif 'connection' in error_message.lower():
-        raise ExternalServiceError(
-            service_name,
-            f"Connection error to {service_name} service during {operation}",
-            f"{service_name.upper()}_CONNECTION_ERROR",
-            {'operation': operation, 'original_error': error_message}
-        )
-    elif 'authentication' in error_message.lower() or 'unauthorized' in error_message.lower():
-        raise ExternalServiceError(
-            service_name,
-            f"Authentication error with {service_name} service",
-            f"{service_name.upper()}_AUTH_ERROR",
-            {'operation': operation, 'original_error': error_message}
-        )
-    else:
-        raise ExternalServiceError(
-            service_name,
-            f"Error in {service_name} service during {operation}: {error_message}",
-            details={'operation': operation, 'original_error': error_message}
-        )
+    # Map common error patterns to specific error types; one scan finds every
+    # pattern present, then the most specific kind wins
+    found = {match.lastgroup for match in _SERVICE_ERROR_RE.finditer(error_message)}
+    for kind in _SERVICE_ERROR_PRIORITY:
+        if kind in found:
+            message_template, code_suffix = _SERVICE_ERROR_KINDS[kind]
+            raise ExternalServiceError(
+                service_name,
+                message_template.format(service=service_name, title=service_name.title(), operation=operation),
+                f"{service_name.upper()}_{code_suffix}",
+                {'operation': operation, 'original_error': error_message}
+            )
+    
+    raise ExternalServiceError(
+        service_name,
+        f"Error in {service_name} service during {operation}: {error_message}",
+        details={'operation': operation, 'original_error': error_message}
+    )
 
 
 def init_error_handlers(app):
     """Initialize comprehensive error handlers for the Flask app"""
     
+    # Logging is configured before the error handlers in create_app
+    _init_error_log_queue()
+    
+    # Bodies of the fixed-shape HTTP errors are serialized once here; only the
+    # placeholder fields are filled in per response
+    http_error_body = _prebuilt_json(app, {
+        'error': {
+            'code': '__code__',
+            'message': '__message__',
+            'details': {},
+            'timestamp': '__timestamp__',
+            'recoverable': False
+        }
+    })
+    
+    def render_http_error(error):
+        """Log a 4xx HTTPException and render it like format_error_response"""
+        log_error(error, {'http_error': True})
+        return http_error_body(
+            error.code,
+            code=error.name.upper().replace(' ', '_'),
+            message=error.description,
+            timestamp=_now_iso()
+        )
+    
+    method_not_allowed_body = _prebuilt_json(app, {
+        'error': {
+            'code': 'METHOD_NOT_ALLOWED',
+            'message': '__message__',
+            'details': {
+                'allowed_methods': '__allowed_methods__'
+            },
+            'timestamp': '__timestamp__',
+            'recoverable': False
+        }
+    })
+    
+    max_size = app.config.get('MAX_CONTENT_LENGTH') or 0
+    payload_too_large_body = _prebuilt_json(app, {
+        'error': {
+            'code': 'FILE_TOO_LARGE',
+            'message': f'File size exceeds maximum limit of {max_size // (1024*1024)}MB',
+            'details': {
+                'max_size_mb': max_size // (1024*1024),
+                'max_size_bytes': max_size
+            },
+            'timestamp': '__timestamp__',
+            'recoverable': False
+        }
+    })
+    
+    unsupported_media_type_body = _prebuilt_json(app, {
+        'error': {
+            'code': 'UNSUPPORTED_MEDIA_TYPE',
+            'message': 'The uploaded file type is not supported',
+            'details': {
+                'supported_types': _SUPPORTED_AUDIO_TYPES,
+                'received_type': '__received_type__'
+            },
+            'timestamp': '__timestamp__',
+            'recoverable': False
+        }
+    })
+    
+    bad_gateway_body = _prebuilt_json(app, {
+        'error': {
+            'code': 'BAD_GATEWAY',
+            'message': 'External service error. Please try again later.',
+            'details': {},
+            'timestamp': '__timestamp__',
+            'recoverable': True
+        }
+    })
+    
+    service_unavailable_body = _prebuilt_json(app, {
+        'error': {
+            'code': 'SERVICE_UNAVAILABLE',
+            'message': 'Service temporarily unavailable. Please try again later.',
+            'details': {
+                'retry_after': 60
+            },
+            'timestamp': '__timestamp__',
+            'recoverable': True
+        }
+    })
+    
     # Add request ID for tracking
     @app.before_request
     def add_request_id():
-        request.id = f"{int(time.time())}-{hash(request.remote_addr or 'unknown') % 10000}"
-    
-    @app.errorhandler(APIError)
-    def handle_api_error(error):
-        """Handle custom API errors"""
-        return format_error_response(error)
-    
-    @app.errorhandler(AuthenticationError)
-    def handle_authentication_error(error):
-        """Handle authentication errors"""
-        return format_error_response(error)
-    
-    @app.errorhandler(AuthorizationError)
-    def handle_authorization_error(error):
-        """Handle authorization errors"""
-        return format_error_response(error)
-    
-    @app.errorhandler(PaymentError)
-    def handle_payment_error(error):
-        """Handle payment errors"""
-        return format_error_response(error)
-    
-    @app.errorhandler(FileError)
-    def handle_file_error(error):
-        """Handle file errors"""
-        return format_error_response(error)
-    
-    @app.errorhandler(RenderingError)
-    def handle_rendering_error(error):
-        """Handle rendering errors"""
-        return format_error_response(error)
-    
-    @app.errorhandler(ExternalServiceError)
-    def handle_external_service_error(error):
-        """Handle external service errors"""
-        return format_error_response(error)
-    
-    @app.errorhandler(DatabaseError)
-    def handle_database_error(error):
-        """Handle database errors"""
-        return format_error_response(error)
+        # Reuse the logging middleware's ID so error logs correlate with the
+        # X-Request-ID header; otherwise fall back to a cheap unique ID
+        request.id = g.get('request_id') or f"{next(_REQUEST_COUNTER):x}-{os.urandom(4).hex()}"
     
-    @app.errorhandler(ValidationError)
-    def handle_validation_error(error):
-        """Handle validation errors"""
-        return format_error_response(error)
-    
-    @app.errorhandler(RateLimitError)
-    def handle_rate_limit_error(error):
-        """Handle rate limit errors"""
-        return format_error_response(error)
+    # Subclasses of APIError reach this handler through Flask's MRO lookup
+    app.register_error_handler(APIError, format_error_response)
     
     @app.errorhandler(400)
     def handle_bad_request(error):
         """Handle bad request errors"""
-        return format_error_response(error, context={'http_error': True})
+        return render_http_error(error)
     
     @app.errorhandler(401)
     def handle_unauthorized(error):
         """Handle unauthorized errors"""
-        return format_error_response(error, context={'http_error': True})
+        return render_http_error(error)
     
     @app.errorhandler(403)
     def handle_forbidden(error):
         """Handle forbidden errors"""
-        return format_error_response(error, context={'http_error': True})
+        return render_http_error(error)
     
     @app.errorhandler(404)
     def handle_not_found(error):
         """Handle not found errors"""
-        return format_error_response(error, context={'http_error': True})
+        return render_http_error(error)
     
     @app.errorhandler(405)
     def handle_method_not_allowed(error):
         """Handle method not allowed errors"""
-        return jsonify({
-            'error': {
-                'code': 'METHOD_NOT_ALLOWED',
-                'message': f'Method {request.method} not allowed for this endpoint',
-                'details': {
-                    'allowed_methods': error.valid_methods if hasattr(error, 'valid_methods') else []
-                },
-                'timestamp': datetime.utcnow().isoformat(),
-                'recoverable': False
-            }
-        }), 405
+        return method_not_allowed_body(
+            405,
+            message=f'Method {request.method} not allowed for this endpoint',
+            allowed_methods=error.valid_methods if hasattr(error, 'valid_methods') else [],
+            timestamp=_now_iso()
+        )
     
     @app.errorhandler(413)
     def handle_payload_too_large(error):
         """Handle file too large errors"""
-        max_size = app.config.get('MAX_CONTENT_LENGTH', 0)
-        return jsonify({
-            'error': {
-                'code': 'FILE_TOO_LARGE',
-                'message': f'File size exceeds maximum limit of {max_size // (1024*1024)}MB',
-                'details': {
-                    'max_size_mb': max_size // (1024*1024),
-                    'max_size_bytes': max_size
-                },
-                'timestamp': datetime.utcnow().isoformat(),
-                'recoverable': False
-            }
-        }), 413
+        return payload_too_large_body(413, timestamp=_now_iso())
     
     @app.errorhandler(415)
     def handle_unsupported_media_type(error):
         """Handle unsupported media type errors"""
-        return jsonify({
-            'error': {
-                'code': 'UNSUPPORTED_MEDIA_TYPE',
-                'message': 'The uploaded file type is not supported',
-                'details': {
-                    'supported_types': ['audio/mpeg', 'audio/wav', 'audio/mp4', 'audio/x-m4a', 'audio/aac', 'audio/flac', 'audio/ogg'],
-                    'received_type': request.content_type
-                },
-                'timestamp': datetime.utcnow().isoformat(),
-                'recoverable': False
-            }
-        }), 415
+        return unsupported_media_type_body(
+            415,
+            received_type=request.content_type,
+            timestamp=_now_iso()
+        )
     
     @app.errorhandler(422)
     def handle_unprocessable_entity(error):
@@ -494,7 +808,7 @@ def init_error_handlers(app):
                 'code': 'VALIDATION_ERROR',
                 'message': 'The request contains invalid data',
                 'details': getattr(error, 'data', {}) if hasattr(error, 'data') else {},
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': _now_iso(),
                 'recoverable': True
             }
         }), 422
@@ -511,7 +825,7 @@ def init_error_handlers(app):
                     'retry_after': retry_after,
                     'limit_type': getattr(error, 'limit_type', 'general')
                 },
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': _now_iso(),
                 'recoverable': True
             }
         }), 429
@@ -524,30 +838,12 @@ def init_error_handlers(app):
     @app.errorhandler(502)
     def handle_bad_gateway(error):
         """Handle bad gateway errors"""
-        return jsonify({
-            'error': {
-                'code': 'BAD_GATEWAY',
-                'message': 'External service error. Please try again later.',
-                'details': {},
-                'timestamp': datetime.utcnow().isoformat(),
-                'recoverable': True
-            }
-        }), 502
+        return bad_gateway_body(502, timestamp=_now_iso())
     
     @app.errorhandler(503)
     def handle_service_unavailable(error):
         """Handle service unavailable errors"""
-        return jsonify({
-            'error': {
-                'code': 'SERVICE_UNAVAILABLE',
-                'message': 'Service temporarily unavailable. Please try again later.',
-                'details': {
-                    'retry_after': 60
-                },
-                'timestamp': datetime.utcnow().isoformat(),
-                'recoverable': True
-            }
-        }), 503
+        return service_unavailable_body(503, timestamp=_now_iso())
     
     @app.errorhandler(Exception)
     def handle_unexpected_error(error):
@@ -563,33 +859,38 @@ def init_error_handlers(app):
                            'ip_address': request.remote_addr
                        })
         
-        return format_error_response(error, 500, context={'unexpected_error': True})
+        return format_error_response(error, 500, skip_log=True)
     
-    # Database connection error handling
+    # Database error handling, only for apps configured with a database so
+    # worker-style apps don't import SQLAlchemy for it
+    if app.config.get('SQLALCHEMY_DATABASE_URI'):
+        _init_database_error_handler(app)
+
+
+def _init_database_error_handler(app):
+    """Translate SQLAlchemy errors into DatabaseError responses"""
     from sqlalchemy.exc import SQLAlchemyError, DisconnectionError, TimeoutError as SQLTimeoutError
     
+    db_error_map = {
+        DisconnectionError: ("Database connection lost. Please try again.", "DATABASE_CONNECTION_ERROR"),
+        SQLTimeoutError: ("Database operation timed out. Please try again.", "DATABASE_TIMEOUT"),
+    }
+    default_db_error = ("Database error occurred. Please try again.", "DATABASE_ERROR")
+    
     @app.errorhandler(SQLAlchemyError)
     def handle_database_error(error):
         """Handle database errors"""
-        if isinstance(error, DisconnectionError):
-            db_error = DatabaseError(
-                "Database connection lost. Please try again.",
-                "DATABASE_CONNECTION_ERROR",
-                recoverable=True
-            )
-        elif isinstance(error, SQLTimeoutError):
-            db_error = DatabaseError(
-                "Database operation timed out. Please try again.",
-                "DATABASE_TIMEOUT",
-                recoverable=True
-            )
-        else:
-            db_error = DatabaseError(
-                "Database error occurred. Please try again.",
-                "DATABASE_ERROR",
-                recoverable=True
+        mapped = db_error_map.get(type(error))
+        if mapped is None:
+            # Subclasses of the mapped errors resolve through the MRO
+            mapped = next(
+                (db_error_map[cls] for cls in type(error).__mro__ if cls in db_error_map),
+                default_db_error
             )
         
+        message, error_code = mapped
+        db_error = DatabaseError(message, error_code, recoverable=True)
+        
         return format_error_response(db_error)
 
 
@@ -606,10 +907,42 @@ def success_response(data=None, message=None, status_code=200):
     return jsonify(response), status_code
 
 
+# Placeholders substituted into cached pagination URLs; url_for leaves
+# them unquoted
+_PAGE_MARK = '__page__'
+_PER_PAGE_MARK = '__per_page__'
+
+
+@lru_cache(maxsize=256)
+def _page_url_template(endpoint, script_root, kwargs_key):
+    """
+    Build a pagination URL for an endpoint with page placeholders.
+    
+    ``script_root`` is only part of the cache key, since relative URLs
+    include it. Returns None when the route's converters reject the
+    placeholders (e.g. ``<int:page>``), so callers build URLs directly.
+    """
+    try:
+        return url_for(endpoint, page=_PAGE_MARK, per_page=_PER_PAGE_MARK, **dict(kwargs_key))
+    except (ValueError, BuildError):
+        return None
+
+
+def _page_url(endpoint, page, per_page, kwargs):
+    """URL for one page of an endpoint, reusing the cached template"""
+    try:
+        template = _page_url_template(endpoint, request.script_root, tuple(kwargs.items()))
+    except TypeError:
+        # Unhashable values (e.g. lists for repeated query args)
+        template = None
+    
+    if template is None:
+        return url_for(endpoint, page=page, per_page=per_page, **kwargs)
+    return template.replace(_PER_PAGE_MARK, str(per_page)).replace(_PAGE_MARK, str(page))
+
+
 def paginated_response(items, page, per_page, total, endpoint=None, **kwargs):
     """Create paginated response format"""
-    from flask import url_for, request
-    
     # Calculate pagination info
     has_prev = page > 1
     has_next = page * per_page < total
@@ -621,9 +954,9 @@ def paginated_response(items, page, per_page, total, endpoint=None, **kwargs):
     next_url = None
     if endpoint:
         if has_prev:
-            prev_url = url_for(endpoint, page=prev_page, per_page=per_page, **kwargs)
+            prev_url = _page_url(endpoint, prev_page, per_page, kwargs)
         if has_next:
-            next_url = url_for(endpoint, page=next_page, per_page=per_page, **kwargs)
+            next_url = _page_url(endpoint, next_page, per_page, kwargs)
     
     return jsonify({
         'data': items,
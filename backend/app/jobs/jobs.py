@@ -5,17 +5,63 @@ import os
 import logging
 import tempfile
 import shutil
+import stat
 import json
-import time
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from rq import get_current_job
 from flask import current_app
+from sqlalchemy import update
 from playwright.sync_api import sync_playwright
 import ffmpeg
+from app import db
+from app.cache import mark_dashboard_stale
+from app.models import RenderJob, User, JobMetrics, SystemHealth
 
 logger = logging.getLogger(__name__)
 
+# Column names of RenderJob that status updates may set
+_RENDER_JOB_COLUMNS = frozenset(column.name for column in RenderJob.__table__.columns)
+
+# Progress percentage reported for each render stage. Workers only record
+# the stage; the status API derives the percentage from it.
+RENDER_STAGE_PROGRESS = {
+    'setup': 0,
+    'validating_audio': 25,
+    'launching_browser': 35,
+    'loading_visualizer': 45,
+    'recording_video': 55,
+    'encoding_video': 65,
+    'uploading_video': 75,
+    'completed': 100,
+}
+
+# cleanup_files removes batches of at least this many files on a thread pool
+CLEANUP_PARALLEL_MIN_FILES = 64
+CLEANUP_MAX_WORKERS = 16
+
+# Longest error message kept in RQ job meta. Meta is rewritten on every save
+# and read by status polling; full errors are in the logs and the database.
+META_ERROR_MAX_CHARS = 1000
+
+def update_job_meta(current_job, save=True, **fields):
+    """
+    Update the RQ job's meta, if running inside an RQ job.
+    
+    Each save is a Redis round-trip. Pass ``save=False`` for updates that are
+    immediately followed by another one; the fields stay in ``job.meta`` and
+    go out with the next save. An ``error`` longer than META_ERROR_MAX_CHARS
+    is truncated.
+    """
+    if current_job:
+        error = fields.get('error')
+        if isinstance(error, str) and len(error) > META_ERROR_MAX_CHARS:
+            fields['error'] = error[:META_ERROR_MAX_CHARS] + '... (truncated)'
+        current_job.meta.update(fields)
+        if save:
+            current_job.save_meta()
+
 def render_video_job(job_id, user_id, audio_file_path, render_config):
     """
     Background job for rendering video from audio and visualization config.
@@ -34,37 +80,34 @@ def render_video_job(job_id, user_id, audio_file_path, render_config):
     start_time = datetime.utcnow()
     
     try:
-        logger.info(f"Starting video render job {job_id} for user {user_id}")
+        logger.info("Starting video render job %s for user %s", job_id, user_id)
         
         # Update database job status (only if we have Flask app context)
         try:
             update_render_job_status(job_id, 'processing', started_at=start_time)
         except Exception as e:
-            logger.warning(f"Could not update database status (testing mode?): {e}")
+            logger.warning("Could not update database status (testing mode?): %s", e)
         
         # Update job meta with progress (only if we have RQ job context)
-        if current_job:
-            current_job.meta['status'] = 'initializing'
-            current_job.meta['progress'] = 0
-            current_job.meta['stage'] = 'setup'
-            current_job.meta['started_at'] = start_time.isoformat()
-            current_job.meta['estimated_duration'] = 120  # 2 minutes estimate
-            current_job.save_meta()
+        update_job_meta(
+            current_job,
+            status='initializing',
+            stage='setup',
+            started_at=start_time.isoformat(),
+            estimated_duration=120  # 2 minutes estimate
+        )
         
         # Create temporary directory for processing
         temp_dir = tempfile.mkdtemp(prefix=f'render_{job_id}_')
-        logger.info(f"Created temp directory: {temp_dir}")
+        logger.info("Created temp directory: %s", temp_dir)
         
         # Validate audio file exists
         if not os.path.exists(audio_file_path):
             raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
         
-        # Update progress
-        if current_job:
-            current_job.meta['status'] = 'processing'
-            current_job.meta['progress'] = 25
-            current_job.meta['stage'] = 'validating_audio'
-            current_job.save_meta()
+        # Update progress; the next stage follows within milliseconds, so
+        # this is saved together with the browser launch update
+        update_job_meta(current_job, save=False, status='processing', stage='validating_audio')
         
         # Render video using Playwright and FFmpeg
         video_filename = f"video_{job_id}.mp4"
@@ -75,11 +118,6 @@ def render_video_job(job_id, user_id, audio_file_path, render_config):
         temp_audio_path = os.path.join(temp_dir, audio_filename)
         shutil.copy2(audio_file_path, temp_audio_path)
         
-        if current_job:
-            current_job.meta['progress'] = 30
-            current_job.meta['stage'] = 'preparing_files'
-            current_job.save_meta()
-        
         # Render video using headless browser
         video_path = render_video_with_browser(
             temp_audio_path, 
@@ -88,10 +126,7 @@ def render_video_job(job_id, user_id, audio_file_path, render_config):
             current_job
         )
         
-        if current_job:
-            current_job.meta['progress'] = 75
-            current_job.meta['stage'] = 'uploading_video'
-            current_job.save_meta()
+        update_job_meta(current_job, stage='uploading_video')
         
         # Upload video to Google Cloud Storage
         blob_name = None
@@ -105,10 +140,10 @@ def render_video_job(job_id, user_id, audio_file_path, render_config):
             # Generate download URL (24 hour expiration)
             video_url = gcs_manager.generate_download_url(blob_name, expiration_hours=24)
             
-            logger.info(f"Video uploaded to GCS: {blob_name}")
+            logger.info("Video uploaded to GCS: %s", blob_name)
             
         except Exception as gcs_error:
-            logger.error(f"Failed to upload video to GCS: {gcs_error}")
+            logger.error("Failed to upload video to GCS: %s", gcs_error)
             # Fall back to local file URL for development/testing
             video_url = f"file://{video_path}"
         
@@ -116,40 +151,37 @@ def render_video_job(job_id, user_id, audio_file_path, render_config):
         try:
             update_render_job_status(job_id, 'completed', video_url=video_url, gcs_blob_name=blob_name)
         except Exception as e:
-            logger.warning(f"Could not update database status (testing mode?): {e}")
-        
-        if current_job:
-            current_job.meta['status'] = 'completed'
-            current_job.meta['progress'] = 100
-            current_job.meta['stage'] = 'completed'
-            current_job.meta['video_url'] = video_url
-            current_job.meta['completed_at'] = datetime.utcnow().isoformat()
-            current_job.meta['duration'] = (datetime.utcnow() - start_time).total_seconds()
-            current_job.save_meta()
+            logger.warning("Could not update database status (testing mode?): %s", e)
+        
+        # One clock read for the meta, metrics and result
+        completed_at = datetime.utcnow()
+        completed_at_iso = completed_at.isoformat()
+        duration = (completed_at - start_time).total_seconds()
+        
+        update_job_meta(
+            current_job,
+            status='completed',
+            stage='completed',
+            video_url=video_url,
+            completed_at=completed_at_iso,
+            duration=duration
+        )
         
-        # Enqueue email notification job (only if we have Flask app context)
+        # Send the email notification from this job rather than enqueueing a
+        # separate one (only if we have Flask app context)
         try:
-            from app.models import User
-            from app.jobs.queue import enqueue_job
             user = User.query.get(user_id)
             if user and user.email:
-                enqueue_job(
-                    'high_priority',
-                    send_completion_email,
-                    user.email,
-                    video_url,
-                    job_id
-                )
+                deliver_completion_email(user.email, video_url, job_id)
         except Exception as email_error:
-            logger.warning(f"Could not enqueue email job (testing mode?): {email_error}")
+            logger.warning("Could not send completion email (testing mode?): %s", email_error)
             # Don't fail the main job for email issues
         
-        logger.info(f"Video render job {job_id} completed successfully")
+        logger.info("Video render job %s completed successfully", job_id)
         
         # Collect job metrics
         try:
             from app.monitoring.metrics import collect_job_metrics
-            duration = (datetime.utcnow() - start_time).total_seconds()
             collect_job_metrics(
                 job_id=job_id,
                 job_type='render_video',
@@ -157,36 +189,41 @@ def render_video_job(job_id, user_id, audio_file_path, render_config):
                 duration=duration
             )
         except Exception as metrics_error:
-            logger.warning(f"Failed to collect job metrics: {metrics_error}")
+            logger.warning("Failed to collect job metrics: %s", metrics_error)
         
         return {
             'success': True,
             'job_id': job_id,
             'video_url': video_url,
-            'completed_at': datetime.utcnow().isoformat()
+            'completed_at': completed_at_iso
         }
         
     except Exception as e:
-        logger.error(f"Video render job {job_id} failed: {e}")
+        logger.error("Video render job %s failed: %s", job_id, e)
         
         # Update database with error
         try:
             update_render_job_status(job_id, 'failed', error_message=str(e))
         except Exception as db_error:
-            logger.warning(f"Could not update database status (testing mode?): {db_error}")
+            logger.warning("Could not update database status (testing mode?): %s", db_error)
+        
+        # One clock read for the meta, metrics and result
+        failed_at = datetime.utcnow()
+        failed_at_iso = failed_at.isoformat()
+        duration = (failed_at - start_time).total_seconds()
         
         # Update job meta with error
-        if current_job:
-            current_job.meta['status'] = 'failed'
-            current_job.meta['error'] = str(e)
-            current_job.meta['failed_at'] = datetime.utcnow().isoformat()
-            current_job.meta['duration'] = (datetime.utcnow() - start_time).total_seconds()
-            current_job.save_meta()
+        update_job_meta(
+            current_job,
+            status='failed',
+            error=str(e),
+            failed_at=failed_at_iso,
+            duration=duration
+        )
         
         # Collect job metrics for failed job
         try:
             from app.monitoring.metrics import collect_job_metrics
-            duration = (datetime.utcnow() - start_time).total_seconds()
             collect_job_metrics(
                 job_id=job_id,
                 job_type='render_video',
@@ -195,13 +232,13 @@ def render_video_job(job_id, user_id, audio_file_path, render_config):
                 error_message=str(e)
             )
         except Exception as metrics_error:
-            logger.warning(f"Failed to collect job metrics: {metrics_error}")
+            logger.warning("Failed to collect job metrics: %s", metrics_error)
         
         return {
             'success': False,
             'job_id': job_id,
             'error': str(e),
-            'failed_at': datetime.utcnow().isoformat()
+            'failed_at': failed_at_iso
         }
         
     finally:
@@ -209,9 +246,9 @@ def render_video_job(job_id, user_id, audio_file_path, render_config):
         if temp_dir and os.path.exists(temp_dir):
             try:
                 shutil.rmtree(temp_dir)
-                logger.info(f"Cleaned up temp directory: {temp_dir}")
+                logger.info("Cleaned up temp directory: %s", temp_dir)
             except Exception as e:
-                logger.error(f"Failed to cleanup temp directory {temp_dir}: {e}")
+                logger.error("Failed to cleanup temp directory %s: %s", temp_dir, e)
         
         # Cleanup uploaded audio file
         if audio_file_path and os.path.exists(audio_file_path):
@@ -220,9 +257,9 @@ def render_video_job(job_id, user_id, audio_file_path, render_config):
                 audio_temp_dir = os.path.dirname(audio_file_path)
                 if audio_temp_dir and 'audio_upload_' in audio_temp_dir:
                     shutil.rmtree(audio_temp_dir)
-                    logger.info(f"Cleaned up audio temp directory: {audio_temp_dir}")
+                    logger.info("Cleaned up audio temp directory: %s", audio_temp_dir)
             except Exception as e:
-                logger.error(f"Failed to cleanup audio file {audio_file_path}: {e}")
+                logger.error("Failed to cleanup audio file %s: %s", audio_file_path, e)
 
 def send_completion_email(user_email, video_url, job_id):
     """
@@ -239,49 +276,17 @@ def send_completion_email(user_email, video_url, job_id):
     current_job = get_current_job()
     
     try:
-        logger.info(f"Sending completion email for job {job_id} to {user_email}")
+        logger.info("Sending completion email for job %s to %s", job_id, user_email)
         
         # Update job meta
-        if current_job:
-            current_job.meta['status'] = 'sending_email'
-            current_job.save_meta()
+        update_job_meta(current_job, status='sending_email')
         
-        # Send email using SendGrid service
-        try:
-            from app.email import get_email_service
-            email_service = get_email_service()
-            
-            result = email_service.send_video_completion_email(
-                user_email=user_email,
-                video_url=video_url,
-                job_id=job_id
-            )
-            
-            logger.info(f"Completion email sent successfully for job {job_id}")
-            return result
-            
-        except Exception as email_error:
-            # If email service is not configured (development), fall back to simulation
-            logger.warning(f"Email service not available, simulating email send: {email_error}")
-            
-            import time
-            time.sleep(1)
-            
-            return {
-                'success': True,
-                'job_id': job_id,
-                'email': user_email,
-                'sent_at': datetime.utcnow().isoformat(),
-                'simulated': True
-            }
+        return deliver_completion_email(user_email, video_url, job_id)
         
     except Exception as e:
-        logger.error(f"Failed to send completion email for job {job_id}: {e}")
+        logger.error("Failed to send completion email for job %s: %s", job_id, e)
         
-        if current_job:
-            current_job.meta['status'] = 'email_failed'
-            current_job.meta['error'] = str(e)
-            current_job.save_meta()
+        update_job_meta(current_job, status='email_failed', error=str(e))
         
         return {
             'success': False,
@@ -290,6 +295,47 @@ def send_completion_email(user_email, video_url, job_id):
             'failed_at': datetime.utcnow().isoformat()
         }
 
+def deliver_completion_email(user_email, video_url, job_id):
+    """
+    Send the completion email without touching the current RQ job's meta.
+    
+    render_video_job calls this directly once a render succeeds, so the
+    email doesn't need a job of its own.
+    
+    Args:
+        user_email (str): User's email address
+        video_url (str): URL to download the rendered video
+        job_id (str): Job ID for reference
+        
+    Returns:
+        dict: Email sending result
+    """
+    # Send email using SendGrid service
+    try:
+        from app.email import get_email_service
+        email_service = get_email_service()
+        
+        result = email_service.send_video_completion_email(
+            user_email=user_email,
+            video_url=video_url,
+            job_id=job_id
+        )
+        
+        logger.info("Completion email sent successfully for job %s", job_id)
+        return result
+        
+    except Exception as email_error:
+        # If email service is not configured (development), fall back to simulation
+        logger.warning("Email service not available, simulating email send: %s", email_error)
+        
+        return {
+            'success': True,
+            'job_id': job_id,
+            'email': user_email,
+            'sent_at': datetime.utcnow().isoformat(),
+            'simulated': True
+        }
+
 def cleanup_expired_videos(max_age_days=30):
     """
     Clean up expired videos from Google Cloud Storage and update database.
@@ -303,7 +349,7 @@ def cleanup_expired_videos(max_age_days=30):
     current_job = get_current_job()
     
     try:
-        logger.info(f"Starting cleanup of videos older than {max_age_days} days")
+        logger.info("Starting cleanup of videos older than %s days", max_age_days)
         
         if current_job:
             current_job.meta['status'] = 'cleaning_videos'
@@ -320,9 +366,6 @@ def cleanup_expired_videos(max_age_days=30):
         cutoff_date = datetime.utcnow() - timedelta(days=max_age_days)
         
         try:
-            from app.models import RenderJob
-            from app import db
-            
             # Find completed jobs older than cutoff date
             expired_jobs = RenderJob.query.filter(
                 RenderJob.status == 'completed',
@@ -337,12 +380,12 @@ def cleanup_expired_videos(max_age_days=30):
                 
             db.session.commit()
             
-            logger.info(f"Updated {len(expired_jobs)} database records for expired videos")
+            logger.info("Updated %s database records for expired videos", len(expired_jobs))
             
         except Exception as db_error:
-            logger.warning(f"Could not update database records (testing mode?): {db_error}")
+            logger.warning("Could not update database records (testing mode?): %s", db_error)
         
-        logger.info(f"Video cleanup completed: {deleted_count} deleted, {error_count} errors")
+        logger.info("Video cleanup completed: %s deleted, %s errors", deleted_count, error_count)
         
         return {
             'success': True,
@@ -353,12 +396,9 @@ def cleanup_expired_videos(max_age_days=30):
         }
         
     except Exception as e:
-        logger.error(f"Video cleanup job failed: {e}")
+        logger.error("Video cleanup job failed: %s", e)
         
-        if current_job:
-            current_job.meta['status'] = 'failed'
-            current_job.meta['error'] = str(e)
-            current_job.save_meta()
+        update_job_meta(current_job, status='failed', error=str(e))
         
         return {
             'success': False,
@@ -371,7 +411,8 @@ def cleanup_files(file_paths, max_age_days=30):
     Clean up old files and temporary directories.
     
     Args:
-        file_paths (list): List of file paths to check for cleanup
+        file_paths (list): List of file paths to check for cleanup; for a
+            directory, the old files directly inside it are removed
         max_age_days (int): Maximum age in days before files are deleted
         
     Returns:
@@ -382,31 +423,38 @@ def cleanup_files(file_paths, max_age_days=30):
     errors = []
     
     try:
-        logger.info(f"Starting cleanup job for {len(file_paths)} files")
+        logger.info("Starting cleanup job for %s files", len(file_paths))
         
-        if current_job:
-            current_job.meta['status'] = 'cleaning'
-            current_job.save_meta()
+        update_job_meta(current_job, status='cleaning')
         
         cutoff_date = datetime.utcnow() - timedelta(days=max_age_days)
+        # Compared against raw mtimes, as datetime.fromtimestamp(mtime) < cutoff_date
+        cutoff_ts = cutoff_date.timestamp()
         
+        # Find the expired files first, then remove them in one batch
+        expired_paths = []
         for file_path in file_paths:
             try:
-                if os.path.exists(file_path):
-                    # Check file age
-                    file_mtime = datetime.fromtimestamp(os.path.getmtime(file_path))
-                    
-                    if file_mtime < cutoff_date:
-                        os.remove(file_path)
-                        cleaned_files.append(file_path)
-                        logger.info(f"Cleaned up old file: {file_path}")
+                # One stat gives existence, type and age
+                try:
+                    file_stat = os.stat(file_path)
+                except (OSError, ValueError):
+                    # Missing or inaccessible; skipped like os.path.exists did
+                    continue
+                
+                if stat.S_ISDIR(file_stat.st_mode):
+                    expired_paths.extend(_expired_files_in_directory(file_path, cutoff_ts))
+                elif file_stat.st_mtime < cutoff_ts:
+                    expired_paths.append(file_path)
                     
             except Exception as e:
                 error_msg = f"Failed to cleanup {file_path}: {e}"
                 errors.append(error_msg)
                 logger.error(error_msg)
         
-        logger.info(f"Cleanup job completed. Cleaned {len(cleaned_files)} files, {len(errors)} errors")
+        _remove_expired_files(expired_paths, cleaned_files, errors)
+        
+        logger.info("Cleanup job completed. Cleaned %s files, %s errors", len(cleaned_files), len(errors))
         
         return {
             'success': True,
@@ -416,12 +464,9 @@ def cleanup_files(file_paths, max_age_days=30):
         }
         
     except Exception as e:
-        logger.error(f"Cleanup job failed: {e}")
+        logger.error("Cleanup job failed: %s", e)
         
-        if current_job:
-            current_job.meta['status'] = 'failed'
-            current_job.meta['error'] = str(e)
-            current_job.save_meta()
+        update_job_meta(current_job, status='failed', error=str(e))
         
         return {
             'success': False,
@@ -429,6 +474,52 @@ def cleanup_files(file_paths, max_age_days=30):
             'failed_at': datetime.utcnow().isoformat()
         }
 
+def _expired_files_in_directory(directory, cutoff_ts):
+    """
+    Paths of the regular files directly inside a directory that are older than
+    the cutoff.
+    
+    Entries come from os.scandir, which already knows each entry's type, so
+    subdirectories and symlinks are skipped without a stat call.
+    """
+    with os.scandir(directory) as entries:
+        return [
+            entry.path for entry in entries
+            if entry.is_file(follow_symlinks=False)
+            and entry.stat(follow_symlinks=False).st_mtime < cutoff_ts
+        ]
+
+def _unlink(file_path):
+    """Remove a file, returning the OSError instead of raising it"""
+    try:
+        os.remove(file_path)
+    except OSError as e:
+        # Expected failures (already gone, permissions, busy)
+        return e
+    return None
+
+def _remove_expired_files(file_paths, cleaned_files, errors):
+    """
+    Remove expired files, recording each outcome in cleaned_files or errors.
+    
+    Large batches are spread over a thread pool; unlink releases the GIL, so
+    the syscalls overlap. Outcomes are recorded in input order either way.
+    """
+    if len(file_paths) < CLEANUP_PARALLEL_MIN_FILES:
+        outcomes = [_unlink(file_path) for file_path in file_paths]
+    else:
+        with ThreadPoolExecutor(max_workers=CLEANUP_MAX_WORKERS) as executor:
+            outcomes = list(executor.map(_unlink, file_paths))
+    
+    for file_path, error in zip(file_paths, outcomes):
+        if error is None:
+            cleaned_files.append(file_path)
+            logger.info("Cleaned up old file: %s", file_path)
+        else:
+            error_msg = f"Failed to cleanup {file_path}: {error}"
+            errors.append(error_msg)
+            logger.error(error_msg)
+
 def render_video_with_browser(audio_path, render_config, output_path, current_job=None):
     """
     Render video using headless browser automation and FFmpeg.
@@ -446,18 +537,14 @@ def render_video_with_browser(audio_path, render_config, output_path, current_jo
     raw_video_path = os.path.join(temp_dir, 'raw_recording.webm')
     
     try:
-        logger.info(f"Starting browser-based video rendering")
+        logger.info("Starting browser-based video rendering")
         
-        # Update progress
-        if current_job:
-            current_job.meta['status'] = 'launching_browser'
-            current_job.meta['progress'] = 35
-            current_job.meta['stage'] = 'launching_browser'
-            current_job.save_meta()
+        # Update progress (also saves any fields the caller left unsaved)
+        update_job_meta(current_job, status='launching_browser', stage='launching_browser')
         
         # Get audio duration for video length
         audio_duration = get_audio_duration(audio_path)
-        logger.info(f"Audio duration: {audio_duration} seconds")
+        logger.info("Audio duration: %s seconds", audio_duration)
         
         with sync_playwright() as p:
             # Launch browser in headless mode
@@ -484,11 +571,7 @@ def render_video_with_browser(audio_path, render_config, output_path, current_jo
                 page = context.new_page()
                 
                 # Update progress
-                if current_job:
-                    current_job.meta['status'] = 'loading_visualizer'
-                    current_job.meta['progress'] = 45
-                    current_job.meta['stage'] = 'loading_visualizer'
-                    current_job.save_meta()
+                update_job_meta(current_job, status='loading_visualizer', stage='loading_visualizer')
                 
                 # Create a local HTML file with the visualizer
                 html_content = create_visualizer_html(audio_path, render_config)
@@ -504,11 +587,7 @@ def render_video_with_browser(audio_path, render_config, output_path, current_jo
                 page.wait_for_timeout(2000)
                 
                 # Update progress
-                if current_job:
-                    current_job.meta['status'] = 'recording_video'
-                    current_job.meta['progress'] = 55
-                    current_job.meta['stage'] = 'recording_video'
-                    current_job.save_meta()
+                update_job_meta(current_job, status='recording_video', stage='recording_video')
                 
                 # Start screen recording
                 logger.info("Starting screen recording")
@@ -543,26 +622,22 @@ def render_video_with_browser(audio_path, render_config, output_path, current_jo
                     raise Exception("No video file was recorded")
                 
                 raw_video_path = os.path.join(temp_dir, video_files[0])
-                logger.info(f"Raw video recorded: {raw_video_path}")
+                logger.info("Raw video recorded: %s", raw_video_path)
                 
             finally:
                 browser.close()
         
         # Update progress
-        if current_job:
-            current_job.meta['status'] = 'encoding_video'
-            current_job.meta['progress'] = 65
-            current_job.meta['stage'] = 'encoding_video'
-            current_job.save_meta()
+        update_job_meta(current_job, status='encoding_video', stage='encoding_video')
         
         # Process video with FFmpeg for optimization
         encode_video_with_ffmpeg(raw_video_path, output_path, audio_path)
         
-        logger.info(f"Video rendering completed: {output_path}")
+        logger.info("Video rendering completed: %s", output_path)
         return output_path
         
     except Exception as e:
-        logger.error(f"Video rendering failed: {e}")
+        logger.error("Video rendering failed: %s", e)
         raise
 
 def create_visualizer_html(audio_path, render_config):
@@ -703,7 +778,7 @@ def get_audio_duration(audio_path):
         duration = float(probe['streams'][0]['duration'])
         return duration
     except Exception as e:
-        logger.error(f"Failed to get audio duration: {e}")
+        logger.error("Failed to get audio duration: %s", e)
         # Return default duration if probe fails
         return 30.0
 
@@ -717,7 +792,7 @@ def encode_video_with_ffmpeg(input_path, output_path, audio_path):
         audio_path (str): Path to the original audio file
     """
     try:
-        logger.info(f"Encoding video with FFmpeg: {input_path} -> {output_path}")
+        logger.info("Encoding video with FFmpeg: %s -> %s", input_path, output_path)
         
         # Create FFmpeg stream for video and audio
         video_stream = ffmpeg.input(input_path)
@@ -741,10 +816,10 @@ def encode_video_with_ffmpeg(input_path, output_path, audio_path):
         # Run FFmpeg
         ffmpeg.run(out, overwrite_output=True, quiet=True)
         
-        logger.info(f"Video encoding completed: {output_path}")
+        logger.info("Video encoding completed: %s", output_path)
         
     except Exception as e:
-        logger.error(f"FFmpeg encoding failed: {e}")
+        logger.error("FFmpeg encoding failed: %s", e)
         raise
 
 def collect_system_health_job():
@@ -779,10 +854,10 @@ def collect_system_health_job():
                     alert_manager.send_alert(alert)
                 
                 if alerts:
-                    logger.info(f"Found {len(alerts)} active alerts ({len(critical_alerts)} critical)")
+                    logger.info("Found %s active alerts (%s critical)", len(alerts), len(critical_alerts))
                 
             except Exception as alert_error:
-                logger.warning(f"Failed to check alerts: {alert_error}")
+                logger.warning("Failed to check alerts: %s", alert_error)
         
         return {
             'success': True,
@@ -791,12 +866,33 @@ def collect_system_health_job():
         }
         
     except Exception as e:
-        logger.error(f"System health collection job failed: {e}")
+        logger.error("System health collection job failed: %s", e)
         
-        if current_job:
-            current_job.meta['status'] = 'failed'
-            current_job.meta['error'] = str(e)
-            current_job.save_meta()
+        update_job_meta(current_job, status='failed', error=str(e))
+        
+        return {
+            'success': False,
+            'error': str(e),
+            'failed_at': datetime.utcnow().isoformat()
+        }
+
+def compute_dashboard_snapshot_job():
+    """
+    Background job to precompute the admin dashboard metrics.
+    """
+    try:
+        from app.admin.dashboard import save_dashboard_snapshot
+        snapshot = save_dashboard_snapshot()
+        
+        logger.info("Dashboard snapshot computed")
+        
+        return {
+            'success': True,
+            'computed_at': snapshot.computed_at.isoformat()
+        }
+        
+    except Exception as e:
+        logger.error("Dashboard snapshot job failed: %s", e)
         
         return {
             'success': False,
@@ -814,7 +910,7 @@ def cleanup_old_metrics_job(days_to_keep=30):
     current_job = get_current_job()
     
     try:
-        logger.info(f"Starting cleanup of metrics older than {days_to_keep} days")
+        logger.info("Starting cleanup of metrics older than %s days", days_to_keep)
         
         if current_job:
             current_job.meta['status'] = 'cleaning_metrics'
@@ -823,8 +919,6 @@ def cleanup_old_metrics_job(days_to_keep=30):
         cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
         
         # Clean up old job metrics
-        from app.models import JobMetrics, SystemHealth, db
-        
         old_job_metrics = JobMetrics.query.filter(
             JobMetrics.created_at < cutoff_date
         ).all()
@@ -842,7 +936,7 @@ def cleanup_old_metrics_job(days_to_keep=30):
         
         db.session.commit()
         
-        logger.info(f"Cleaned up {len(old_job_metrics)} job metrics and {len(old_health_records)} health records")
+        logger.info("Cleaned up %s job metrics and %s health records", len(old_job_metrics), len(old_health_records))
         
         return {
             'success': True,
@@ -852,12 +946,9 @@ def cleanup_old_metrics_job(days_to_keep=30):
         }
         
     except Exception as e:
-        logger.error(f"Metrics cleanup job failed: {e}")
+        logger.error("Metrics cleanup job failed: %s", e)
         
-        if current_job:
-            current_job.meta['status'] = 'failed'
-            current_job.meta['error'] = str(e)
-            current_job.save_meta()
+        update_job_meta(current_job, status='failed', error=str(e))
         
         return {
             'success': False,
@@ -960,10 +1051,6 @@ def cleanup_expired_files():
         dict: Cleanup statistics
     """
     try:
-        from app.models import RenderJob
-        from app import db
-        from datetime import datetime, timedelta
-        
         # Find expired jobs (older than 30 days)
         cutoff_date = datetime.utcnow() - timedelta(days=30)
         
@@ -988,7 +1075,7 @@ def cleanup_expired_files():
                 cleaned_count += 1
                 
             except Exception as e:
-                logger.warning(f"Failed to clean up job {job.id}: {e}")
+                logger.warning("Failed to clean up job %s: %s", job.id, e)
         
         db.session.commit()
         
@@ -999,7 +1086,7 @@ def cleanup_expired_files():
         }
         
     except Exception as e:
-        logger.error(f"File cleanup failed: {e}")
+        logger.error("File cleanup failed: %s", e)
         return {
             'success': False,
             'cleaned_count': 0,
@@ -1007,33 +1094,6 @@ def cleanup_expired_files():
         }
 
 
-def update_render_job_status(job_id, status, **kwargs):
-    """
-    Update render job status in database.
-    
-    Args:
-        job_id: Job ID
-        status: New status
-        **kwargs: Additional fields to update
-    """
-    try:
-        from app.models import RenderJob
-        from app import db
-        
-        job = RenderJob.query.get(job_id)
-        if job:
-            job.status = status
-            
-            for key, value in kwargs.items():
-                if hasattr(job, key):
-                    setattr(job, key, value)
-            
-            db.session.commit()
-            
-    except Exception as e:
-        logger.warning(f"Could not update job status: {e}")
-
-
 def render_video_with_playwright(audio_path, render_config, output_path):
     """
     Render video using Playwright (alias for render_video_with_browser).
@@ -1058,27 +1118,31 @@ def update_render_job_status(job_id, status, **kwargs):
         **kwargs: Additional fields to update
     """
     try:
-        # Import here to avoid circular imports
-        from app.models import RenderJob
-        from app import db
+        values = {'status': status}
         
-        render_job = RenderJob.query.filter_by(id=job_id).first()
-        if render_job:
-            render_job.status = status
-            
-            # Update additional fields
-            for key, value in kwargs.items():
-                if hasattr(render_job, key):
-                    setattr(render_job, key, value)
-            
-            if status == 'completed':
-                render_job.completed_at = datetime.utcnow()
-            
-            db.session.commit()
-            logger.info(f"Updated render job {job_id} status to {status}")
+        # Update additional fields (other keyword arguments are ignored)
+        for key, value in kwargs.items():
+            if key in _RENDER_JOB_COLUMNS:
+                values[key] = value
+        
+        if status == 'completed':
+            values['completed_at'] = datetime.utcnow()
+        
+        # A single UPDATE, without loading the row first; job IDs arrive as
+        # strings from the queue
+        result = db.session.execute(
+            update(RenderJob).where(RenderJob.id == int(job_id)).values(**values)
+        )
+        if result.rowcount:
+            # Bulk updates skip mapper events, so flag the dashboard directly
+            mark_dashboard_stale(db.session)
+        db.session.commit()
+        
+        if result.rowcount:
+            logger.info("Updated render job %s status to %s", job_id, status)
         else:
-            logger.error(f"Render job {job_id} not found in database")
+            logger.error("Render job %s not found in database", job_id)
             
     except Exception as e:
-        logger.error(f"Failed to update render job {job_id} status: {e}")
-        # Don't raise exception to avoid failing the main job
\ No newline at end of file
+        logger.error("Failed to update render job %s status: %s", job_id, e)
+        # Don't raise exception to avoid failing the main job
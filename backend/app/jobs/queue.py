@@ -53,6 +53,10 @@ def get_redis_connection():
     """Get the Redis connection instance."""
     return redis_conn
 
+def render_rq_job_id(render_job_id):
+    """RQ job ID used for a RenderJob, so its status can be fetched directly."""
+    return f"render-{render_job_id}"
+
 def enqueue_job(queue_name, func, *args, **kwargs):
     """
     Enqueue a job to a specific queue.
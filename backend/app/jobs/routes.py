@@ -8,8 +8,8 @@ from datetime import datetime
 from werkzeug.utils import secure_filename
 from flask import Blueprint, jsonify, request, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from app.jobs.queue import get_job_status, get_queue_info, enqueue_job, clear_failed_jobs
-from app.jobs.jobs import render_video_job, send_completion_email, cleanup_files
+from app.jobs.queue import get_job_status, get_queue_info, enqueue_job, clear_failed_jobs, render_rq_job_id
+from app.jobs.jobs import render_video_job, send_completion_email, cleanup_files, RENDER_STAGE_PROGRESS
 from app.models import RenderJob, Payment, User, db
 from app.jobs.validation import validate_audio_file, AudioValidationError
 from app.security import upload_rate_limit, api_rate_limit, download_rate_limit, admin_rate_limit
@@ -91,8 +91,10 @@ def submit_render_job():
             }), 402
         
         # Check if payment already used for a render job
-        existing_job = RenderJob.query.filter_by(payment_id=payment_id).first()
-        if existing_job:
+        payment_used = db.session.query(
+            RenderJob.query.filter_by(payment_id=payment_id).exists()
+        ).scalar()
+        if payment_used:
             return jsonify({
                 'error': {
                     'code': 'PAYMENT_ALREADY_USED',
@@ -136,7 +138,8 @@ def submit_render_job():
             str(render_job.id),
             user_id,
             audio_file_path,
-            render_config
+            render_config,
+            job_id=render_rq_job_id(render_job.id)
         )
         
         # Update render job with RQ job ID
@@ -163,6 +166,28 @@ def submit_render_job():
             }
         }), 500
 
+def _find_render_rq_job(job_id, redis_conn):
+    """
+    Find the RQ job rendering the given RenderJob.
+    
+    Jobs are enqueued under a deterministic ID, so this is a single fetch;
+    jobs enqueued before that ID scheme fall back to scanning the queues.
+    """
+    from rq.job import Job
+    from rq.exceptions import NoSuchJobError
+    
+    try:
+        return Job.fetch(render_rq_job_id(job_id), connection=redis_conn)
+    except NoSuchJobError:
+        pass
+    
+    from app.jobs.queue import queues
+    for queue in queues.values():
+        for rq_job in queue.jobs:
+            if rq_job.args and str(rq_job.args[0]) == str(job_id):
+                return rq_job
+    return None
+
 @bp.route('/render/status/<int:job_id>', methods=['GET'])
 @jwt_required()
 def render_job_status(job_id):
@@ -191,24 +216,20 @@ def render_job_status(job_id):
             
             # Get job status from RQ if job is still in queue/processing
             if render_job.status in ['queued', 'processing']:
-                # Search for job in all queues
-                from app.jobs.queue import queues
-                for queue_name, queue in queues.items():
-                    for rq_job in queue.jobs:
-                        if (hasattr(rq_job, 'args') and len(rq_job.args) > 0 and 
-                            str(rq_job.args[0]) == str(job_id)):
-                            rq_job_data = {
-                                'id': rq_job.id,
-                                'status': rq_job.get_status(),
-                                'progress': rq_job.meta.get('progress', 0),
-                                'stage': rq_job.meta.get('stage', 'unknown'),
-                                'started_at': rq_job.meta.get('started_at'),
-                                'estimated_duration': rq_job.meta.get('estimated_duration'),
-                                'error': rq_job.meta.get('error')
-                            }
-                            break
-                    if rq_job_data:
-                        break
+                rq_job = _find_render_rq_job(job_id, redis_conn)
+                if rq_job is not None:
+                    stage = rq_job.meta.get('stage', 'unknown')
+                    rq_job_data = {
+                        'id': rq_job.id,
+                        'status': rq_job.get_status(),
+                        # Jobs started before progress was derived from the
+                        # stage still carry their own value
+                        'progress': rq_job.meta.get('progress', RENDER_STAGE_PROGRESS.get(stage, 0)),
+                        'stage': stage,
+                        'started_at': rq_job.meta.get('started_at'),
+                        'estimated_duration': rq_job.meta.get('estimated_duration'),
+                        'error': rq_job.meta.get('error')
+                    }
         except Exception as rq_error:
             logger.warning(f"Could not get RQ job status: {rq_error}")
         
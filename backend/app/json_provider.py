@@ -0,0 +1,53 @@
+"""
+Flask JSON provider backed by orjson for faster response serialization.
+"""
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that encodes with orjson.
+
+    Output matches the default provider: keys are sorted when ``sort_keys``
+    is set, debug responses are indented, and datetimes and other types
+    orjson does not handle natively go through the default provider's
+    ``default`` hook. Request bodies are decoded with orjson as well, falling
+    back to the stdlib for input only it accepts.
+    """
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits; let the stdlib handle them
+            return super().dumps(obj, **kwargs)
+    
+    def loads(self, s, **kwargs):
+        if kwargs:
+            # orjson has no hooks (object_hook, parse_float, ...)
+            return super().loads(s, **kwargs)
+        
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity are accepted by the stdlib; genuinely invalid
+            # input raises its usual error there
+            return super().loads(s)
+
+
+def init_json_provider(app):
+    """Install the orjson provider when orjson is available."""
+    if ORJSON_AVAILABLE:
+        app.json = OrjsonProvider(app)
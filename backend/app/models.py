@@ -7,6 +7,7 @@ class User(db.Model):
     __table_args__ = (
         db.Index('idx_user_email_active', 'email', 'is_active'),
         db.Index('idx_user_created_at', 'created_at'),
+        db.Index('idx_user_active_created', 'is_active', 'created_at'),
         db.Index('idx_user_account_type', 'account_type'),
     )
     
@@ -45,6 +46,20 @@ class Payment(db.Model):
     def __repr__(self):
         return f'<Payment {self.stripe_session_id}>'
 
+class PaymentAggregate(db.Model):
+    """Running totals of completed payments, kept current by app.payments.aggregate"""
+    __tablename__ = 'payment_aggregate'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    total_completed_cents = db.Column(db.BigInteger, nullable=False, default=0)
+    completed_count = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Last full rebuild from the payment table; deltas only touch updated_at
+    reconciled_at = db.Column(db.DateTime)
+    
+    def __repr__(self):
+        return f'<PaymentAggregate {self.completed_count} payments>'
+
 class RenderJob(db.Model):
     __tablename__ = 'render_job'
     __table_args__ = (
@@ -96,6 +111,10 @@ class PasswordResetToken(db.Model):
 
 class JobMetrics(db.Model):
     """Model to store job performance metrics"""
+    __table_args__ = (
+        db.Index('idx_job_metrics_created_status', 'created_at', 'status'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     job_id = db.Column(db.String(255), nullable=False, index=True)
     job_type = db.Column(db.String(50), nullable=False)  # render_video, send_email, cleanup
@@ -111,6 +130,19 @@ class JobMetrics(db.Model):
         return f'<JobMetrics {self.job_id} - {self.status}>'
 
 
+class DashboardSnapshot(db.Model):
+    """Precomputed admin dashboard metrics, refreshed by a periodic job"""
+    __tablename__ = 'dashboard_snapshot'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    system_metrics = db.Column(db.JSON, nullable=False)
+    monitoring_metrics = db.Column(db.JSON, nullable=False)
+    computed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f'<DashboardSnapshot {self.computed_at}>'
+
+
 class SystemHealth(db.Model):
     """Model to store system health metrics"""
     id = db.Column(db.Integer, primary_key=True)
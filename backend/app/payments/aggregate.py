@@ -0,0 +1,122 @@
+"""
+Running totals of completed payments.
+
+Payment status transitions adjust a single ``payment_aggregate`` row inside
+the same flush, so dashboards read one row instead of summing the payment
+table. The row is rebuilt from the base table when missing or last
+reconciled more than ``AGGREGATE_MAX_AGE`` ago to correct any drift.
+"""
+from datetime import datetime, timedelta
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from app import db
+from app.models import Payment, PaymentAggregate
+
+AGGREGATE_ROW_ID = 1
+AGGREGATE_MAX_AGE = timedelta(hours=1)
+
+
+def _apply_delta(connection, count, cents):
+    """Add a delta to the aggregate row within the current transaction"""
+    table = PaymentAggregate.__table__
+    connection.execute(
+        table.update()
+        .where(table.c.id == AGGREGATE_ROW_ID)
+        .values(
+            completed_count=table.c.completed_count + count,
+            total_completed_cents=table.c.total_completed_cents + cents,
+            updated_at=datetime.utcnow()
+        )
+    )
+
+
+def _after_insert(mapper, connection, target):
+    if target.status == 'completed':
+        _apply_delta(connection, 1, target.amount or 0)
+
+
+def _load_previous_value(target, value, oldvalue, initiator):
+    """No-op set listener; registering it with active_history loads the old value"""
+
+
+def _previous_value(history, current):
+    """Value an attribute held before this flush"""
+    if history.deleted:
+        return history.deleted[0]
+    return current if not history.has_changes() else None
+
+
+def _after_update(mapper, connection, target):
+    attrs = inspect(target).attrs
+    status_history = attrs.status.history
+    amount_history = attrs.amount.history
+    if not (status_history.has_changes() or amount_history.has_changes()):
+        return
+    
+    was_completed = _previous_value(status_history, target.status) == 'completed'
+    is_completed = target.status == 'completed'
+    old_cents = (_previous_value(amount_history, target.amount) or 0) if was_completed else 0
+    new_cents = (target.amount or 0) if is_completed else 0
+    
+    count = int(is_completed) - int(was_completed)
+    if count or new_cents != old_cents:
+        _apply_delta(connection, count, new_cents - old_cents)
+
+
+def _after_delete(mapper, connection, target):
+    if target.status == 'completed':
+        _apply_delta(connection, -1, -(target.amount or 0))
+
+
+def init_payment_aggregate(app):
+    """Register the listeners that keep the aggregate row current"""
+    if event.contains(Payment, 'after_insert', _after_insert):
+        return
+    
+    event.listen(Payment, 'after_insert', _after_insert)
+    event.listen(Payment, 'after_update', _after_update)
+    event.listen(Payment, 'after_delete', _after_delete)
+    # Setting an expired attribute would otherwise leave no previous value in
+    # its history, and the update listener could not tell what to subtract
+    event.listen(Payment.status, 'set', _load_previous_value, active_history=True)
+    event.listen(Payment.amount, 'set', _load_previous_value, active_history=True)
+
+
+def rebuild_payment_aggregate():
+    """
+    Recompute the aggregate row from the payment table.
+    
+    Runs in its own session and transaction, so rebuilding from a read path
+    never commits the caller's session. Returns
+    ``(completed_count, total_completed_cents)``.
+    """
+    with Session(db.engine) as session, session.begin():
+        completed_count, total_cents = session.query(
+            db.func.count(Payment.id),
+            db.func.coalesce(db.func.sum(Payment.amount), 0)
+        ).filter(Payment.status == 'completed').one()
+        
+        now = datetime.utcnow()
+        session.merge(PaymentAggregate(
+            id=AGGREGATE_ROW_ID,
+            completed_count=completed_count,
+            total_completed_cents=total_cents,
+            updated_at=now,
+            reconciled_at=now
+        ))
+    return completed_count, total_cents
+
+
+def get_completed_payment_totals():
+    """
+    Get ``(completed_count, total_completed_cents)`` for completed payments.
+    
+    Reads the aggregate row, rebuilding it first if it is missing or has not
+    been reconciled with the payment table within ``AGGREGATE_MAX_AGE``.
+    Deltas don't count as reconciliation, so a busy system is still rebuilt.
+    """
+    aggregate = db.session.get(PaymentAggregate, AGGREGATE_ROW_ID)
+    if (aggregate is None or aggregate.reconciled_at is None
+            or aggregate.reconciled_at < datetime.utcnow() - AGGREGATE_MAX_AGE):
+        return rebuild_payment_aggregate()
+    return aggregate.completed_count, aggregate.total_completed_cents
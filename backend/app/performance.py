@@ -4,10 +4,11 @@ Performance monitoring and bottleneck identification system
 import time
 import psutil
 import threading
+from collections import Counter
 from functools import wraps
 from datetime import datetime, timedelta
-from flask import request, g, current_app
-from sqlalchemy import text
+from flask import request, g, current_app, has_request_context
+from sqlalchemy import event, text
 from app import db
 from app.cache import cache
 import logging
@@ -251,6 +252,79 @@ class DatabaseQueryMonitor:
 # Global query monitor
 query_monitor = DatabaseQueryMonitor()
 
+# A parametrized statement repeated this often within one request is
+# reported as a likely N+1 query
+N_PLUS_ONE_THRESHOLD = 3
+
+def find_repeated_statements(statements, threshold=N_PLUS_ONE_THRESHOLD):
+    """Return {statement: count} for statements executed at least threshold times"""
+    return {
+        statement: count
+        for statement, count in Counter(statements).items()
+        if count >= threshold
+    }
+
+class QueryCounter:
+    """
+    Context manager recording the SQL statements executed on an engine.
+    
+    Usage:
+        with QueryCounter() as counter:
+            client.get('/admin/')
+        assert counter.count <= 8
+    """
+    
+    def __init__(self, engine=None):
+        self.engine = engine
+        self.statements = []
+        # Keep one bound method so the same object is listened and removed
+        self._listener = self._record
+    
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+    
+    def __enter__(self):
+        self.engine = self.engine or db.engine
+        event.listen(self.engine, "before_cursor_execute", self._listener)
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        event.remove(self.engine, "before_cursor_execute", self._listener)
+        return False
+    
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+    
+    def repeated(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> dict:
+        """Statements executed at least threshold times (likely N+1)"""
+        return find_repeated_statements(self.statements, threshold)
+
+def init_query_logging(app):
+    """
+    Log every SQL statement per request and warn about likely N+1 queries.
+    
+    Enabled with DB_QUERY_LOG_ENABLED; the engine listener itself is
+    attached on the first request alongside the slow-query listeners.
+    """
+    
+    @app.after_request
+    def report_request_queries(response):
+        statements = g.pop('_sql_statements', None)
+        if not statements:
+            return response
+        
+        request_id = g.get('request_id', 'unknown')
+        for statement, count in find_repeated_statements(statements).items():
+            perf_logger.warning(
+                "Possible N+1 query in %s %s [%s]: %d x %s",
+                request.method, request.path, request_id, count, statement[:200],
+                extra={'request_id': request_id, 'query_count': count}
+            )
+        
+        response.headers['X-Query-Count'] = str(len(statements))
+        return response
+
 def init_performance_monitoring(app):
     """Initialize performance monitoring for Flask app"""
     
@@ -259,9 +333,11 @@ def init_performance_monitoring(app):
     app.before_request(before_request)
     app.after_request(after_request)
     
-    # Add database event listeners for query monitoring (deferred until first request)
-    from sqlalchemy import event
+    # Per-request query logging and N+1 detection
+    if app.config.get('DB_QUERY_LOG_ENABLED'):
+        init_query_logging(app)
     
+    # Add database event listeners for query monitoring (deferred until first request)
     def setup_db_listeners():
         """Setup database event listeners - called on first request"""
         if not hasattr(app, '_db_listeners_setup'):
@@ -275,6 +351,15 @@ def init_performance_monitoring(app):
                     duration = time.time() - context._query_start_time
                     query_monitor.log_query(statement, duration, parameters)
             
+            if app.config.get('DB_QUERY_LOG_ENABLED'):
+                @event.listens_for(db.engine, "before_cursor_execute")
+                def record_request_query(conn, cursor, statement, parameters, context, executemany):
+                    if has_request_context():
+                        g.setdefault('_sql_statements', []).append(statement)
+                        perf_logger.debug(
+                            "SQL [%s] %s", g.get('request_id', 'unknown'), statement
+                        )
+            
             app._db_listeners_setup = True
     
     # Setup listeners on first request
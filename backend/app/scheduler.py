@@ -4,7 +4,7 @@ Task scheduler for periodic background jobs.
 import logging
 from datetime import datetime, timedelta
 from app.jobs.queue import enqueue_job
-from app.jobs.jobs import collect_system_health_job, cleanup_old_metrics_job
+from app.jobs.jobs import collect_system_health_job, cleanup_old_metrics_job, compute_dashboard_snapshot_job
 
 logger = logging.getLogger(__name__)
 
@@ -112,6 +112,33 @@ class PeriodicTaskManager:
             logger.error(f"Failed to schedule metrics cleanup: {e}")
             return None
     
+    def schedule_dashboard_snapshot(self, interval_minutes=1):
+        """
+        Schedule periodic recomputation of the admin dashboard snapshot.
+        
+        Args:
+            interval_minutes (int): Interval between snapshots in minutes
+        """
+        try:
+            job = enqueue_job(
+                'high_priority',
+                compute_dashboard_snapshot_job
+            )
+            
+            self.scheduled_tasks['dashboard_snapshot'] = {
+                'job_id': job.id,
+                'interval_minutes': interval_minutes,
+                'last_scheduled': datetime.utcnow(),
+                'next_scheduled': datetime.utcnow() + timedelta(minutes=interval_minutes)
+            }
+            
+            logger.info(f"Scheduled dashboard snapshot every {interval_minutes} minutes")
+            return job.id
+            
+        except Exception as e:
+            logger.error(f"Failed to schedule dashboard snapshot: {e}")
+            return None
+    
     def get_scheduled_tasks(self):
         """Get information about scheduled tasks."""
         return self.scheduled_tasks
@@ -128,6 +155,10 @@ class PeriodicTaskManager:
                         job_id = self.schedule_health_monitoring(
                             task_info['interval_minutes']
                         )
+                    elif task_name == 'dashboard_snapshot':
+                        job_id = self.schedule_dashboard_snapshot(
+                            task_info['interval_minutes']
+                        )
                     elif task_name == 'metrics_cleanup':
                         job_id = self.schedule_metrics_cleanup(
                             task_info['interval_hours'],
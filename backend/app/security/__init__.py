@@ -3,12 +3,12 @@ Security utilities and rate limiting.
 """
 from .limiter import (
     limiter, init_limiter, auth_rate_limit, upload_rate_limit, 
-    api_rate_limit, download_rate_limit, admin_rate_limit
+    api_rate_limit, download_rate_limit, admin_rate_limit, admin_login_rate_limit
 )
 from .validators import validate_file_upload, sanitize_input
 
 __all__ = [
     'limiter', 'init_limiter', 'auth_rate_limit', 'upload_rate_limit',
-    'api_rate_limit', 'download_rate_limit', 'admin_rate_limit',
+    'api_rate_limit', 'download_rate_limit', 'admin_rate_limit', 'admin_login_rate_limit',
     'validate_file_upload', 'sanitize_input'
 ]
\ No newline at end of file
@@ -66,4 +66,8 @@ def download_rate_limit():
 
 def admin_rate_limit():
     """Rate limit for admin endpoints."""
-    return limiter.limit("100 per minute")
\ No newline at end of file
+    return limiter.limit("100 per minute")
+
+def admin_login_rate_limit():
+    """Rate limit for admin login attempts (each one costs a password hash)."""
+    return limiter.limit("5 per minute", methods=["POST"])
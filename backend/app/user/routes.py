@@ -227,8 +227,10 @@ def update_profile():
                 }), 400
             
             # Check if email is already taken by another user
-            existing_user = User.query.filter_by(email=new_email).first()
-            if existing_user and existing_user.id != user.id:
+            email_taken = db.session.query(
+                User.query.filter(User.email == new_email, User.id != user.id).exists()
+            ).scalar()
+            if email_taken:
                 return jsonify({
                     'error': {
                         'code': 'EMAIL_EXISTS',
@@ -46,6 +46,13 @@ class Config:
     # Admin configuration
     ADMIN_EMAIL = os.environ.get('ADMIN_EMAIL')
     ADMIN_PASSWORD = os.environ.get('ADMIN_PASSWORD')
+    ADMIN_EMAILS = [email.strip() for email in os.environ.get('ADMIN_EMAILS', '').split(',') if email.strip()]
+    
+    # Optional read replica for read-only reporting queries (admin dashboard)
+    READ_REPLICA_URL = os.environ.get('READ_REPLICA_URL')
+    
+    # Per-request SQL logging and N+1 detection (development/CI)
+    DB_QUERY_LOG_ENABLED = os.environ.get('DB_QUERY_LOG_ENABLED', 'false').lower() == 'true'
 
 class DevelopmentConfig(Config):
     DEBUG = True
@@ -66,12 +73,10 @@ class ProductionConfig(Config):
             uri = uri.replace('postgres://', 'postgresql://', 1)
         SQLALCHEMY_DATABASE_URI = uri
     
-    # Production-specific settings
+    # Production-specific settings (merged over the pool defaults in create_app)
     SQLALCHEMY_ENGINE_OPTIONS = {
         'pool_pre_ping': True,
-        'pool_recycle': 300,
-        'pool_timeout': 20,
-        'max_overflow': 0
+        'pool_recycle': 300
     }
     
     # Security settings for production
@@ -90,6 +95,7 @@ class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
     WTF_CSRF_ENABLED = False
+    DB_QUERY_LOG_ENABLED = True
 
 config = {
     'development': DevelopmentConfig,
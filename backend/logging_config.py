@@ -5,7 +5,9 @@ import os
 import logging
 import logging.config
 import json
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from flask import request, g
 
 
@@ -86,9 +88,39 @@ class ErrorTrackingHandler(logging.Handler):
         }
 
 
+class RecentErrorsHandler(logging.Handler):
+    """Keeps the most recent error records in a bounded in-memory buffer"""
+    
+    def __init__(self, capacity=500):
+        super().__init__(level=logging.ERROR)
+        self.records = deque(maxlen=capacity)
+    
+    def emit(self, record):
+        try:
+            self.records.append((record.created, record.levelno, record.name, record.getMessage()))
+        except Exception:
+            self.handleError(record)
+    
+    def get_recent(self, limit=100, min_level=logging.ERROR):
+        """Return up to `limit` records at or above `min_level`, newest first"""
+        matching = (entry for entry in reversed(self.records) if entry[1] >= min_level)
+        return [
+            {
+                'timestamp': datetime.utcfromtimestamp(created).isoformat(),
+                'level': logging.getLevelName(levelno),
+                'logger': name,
+                'message': message
+            }
+            for created, levelno, name, message in islice(matching, limit)
+        ]
+
+
 # Global error tracking handler instance
 error_tracker = ErrorTrackingHandler()
 
+# Global recent errors buffer served by the admin monitoring API
+recent_errors = RecentErrorsHandler()
+
 
 def setup_logging(app):
     """
@@ -249,6 +281,12 @@ def setup_logging(app):
     root_logger = logging.getLogger()
     root_logger.addHandler(error_tracker)
     
+    # Buffer recent errors; configured loggers do not propagate to root
+    for logger_name in [None, *logging_config['loggers']]:
+        logger = logging.getLogger(logger_name)
+        if recent_errors not in logger.handlers:
+            logger.addHandler(recent_errors)
+    
     # Set Flask app logger
     app.logger.setLevel(getattr(logging, log_level))
     
@@ -279,6 +317,14 @@ def get_error_stats():
     return error_tracker.get_error_stats()
 
 
+def get_recent_errors(limit=100, level='ERROR'):
+    """Get the most recent buffered error records, newest first"""
+    min_level = logging.getLevelName(level)
+    if not isinstance(min_level, int):
+        min_level = logging.ERROR
+    return recent_errors.get_recent(limit, min_level)
+
+
 def log_security_event(event_type, message, **kwargs):
     """Log security-related events"""
     security_logger = logging.getLogger('app.security')
@@ -0,0 +1,34 @@
+"""Add composite indexes for admin dashboard filters
+
+Revision ID: 56a5ea3e0225
+Revises: f6ea80e3442e
+Create Date: 2026-10-16 10:12:41.208311
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '56a5ea3e0225'
+down_revision = 'f6ea80e3442e'
+branch_labels = None
+depends_on = None
+
+# The status/created_at indexes are declared on the models but were never
+# migrated; IF NOT EXISTS keeps this safe on databases built with create_all().
+INDEXES = [
+    ('idx_payment_status_created', 'payment', 'status, created_at'),
+    ('idx_renderjob_status_created', 'render_job', 'status, created_at'),
+    ('idx_user_active_created', '"user"', 'is_active, created_at'),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})')
+
+
+def downgrade():
+    for name, _, _ in reversed(INDEXES):
+        op.execute(f'DROP INDEX IF EXISTS {name}')
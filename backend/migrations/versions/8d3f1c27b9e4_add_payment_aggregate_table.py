@@ -0,0 +1,38 @@
+"""Add payment_aggregate table for completed payment totals
+
+Revision ID: 8d3f1c27b9e4
+Revises: 56a5ea3e0225
+Create Date: 2026-10-16 11:03:27.540912
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d3f1c27b9e4'
+down_revision = '56a5ea3e0225'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('payment_aggregate',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('total_completed_cents', sa.BigInteger(), nullable=False),
+    sa.Column('completed_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('reconciled_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    # Seed the single row from existing payments
+    op.execute(
+        "INSERT INTO payment_aggregate "
+        "(id, total_completed_cents, completed_count, updated_at, reconciled_at) "
+        "SELECT 1, COALESCE(SUM(amount), 0), COUNT(*), CURRENT_TIMESTAMP, CURRENT_TIMESTAMP "
+        "FROM payment WHERE status = 'completed'"
+    )
+
+
+def downgrade():
+    op.drop_table('payment_aggregate')
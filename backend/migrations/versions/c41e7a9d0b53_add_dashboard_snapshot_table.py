@@ -0,0 +1,30 @@
+"""Add dashboard_snapshot table for precomputed admin metrics
+
+Revision ID: c41e7a9d0b53
+Revises: 8d3f1c27b9e4
+Create Date: 2026-10-16 11:48:09.316274
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41e7a9d0b53'
+down_revision = '8d3f1c27b9e4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('dashboard_snapshot',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('system_metrics', sa.JSON(), nullable=False),
+    sa.Column('monitoring_metrics', sa.JSON(), nullable=False),
+    sa.Column('computed_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('dashboard_snapshot')
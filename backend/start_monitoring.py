@@ -32,6 +32,7 @@ def start_monitoring():
             # Schedule initial monitoring tasks
             health_job_id = task_manager.schedule_health_monitoring(interval_minutes=5)
             cleanup_job_id = task_manager.schedule_metrics_cleanup(interval_hours=24)
+            snapshot_job_id = task_manager.schedule_dashboard_snapshot(interval_minutes=1)
             
             if health_job_id:
                 logger.info(f"Health monitoring scheduled: {health_job_id}")
@@ -43,6 +44,11 @@ def start_monitoring():
             else:
                 logger.error("Failed to schedule metrics cleanup")
             
+            if snapshot_job_id:
+                logger.info(f"Dashboard snapshot scheduled: {snapshot_job_id}")
+            else:
+                logger.error("Failed to schedule dashboard snapshot")
+            
             logger.info("Monitoring system started successfully")
             
             # Keep the script running to reschedule tasks as needed
@@ -0,0 +1,141 @@
+"""
+Query-count budgets for the admin interface.
+
+These guard against N+1 regressions in the admin list views and dashboard.
+"""
+import pytest
+from datetime import datetime
+from flask_jwt_extended import create_access_token
+
+from app import db
+from app.admin.dashboard import save_dashboard_snapshot
+from app.models import User, Payment, RenderJob, DashboardSnapshot
+from app.performance import QueryCounter
+
+
+@pytest.fixture
+def admin_headers(app_context, monkeypatch):
+    """Authorization headers for the configured admin user."""
+    monkeypatch.setitem(app_context.config, 'ADMIN_EMAIL', 'perf-admin@example.com')
+    admin = User(email='perf-admin@example.com', password_hash='hashed_password')
+    db.session.add(admin)
+    db.session.commit()
+    
+    token = create_access_token(identity=str(admin.id))
+    yield {'Authorization': f'Bearer {token}'}
+    
+    db.session.delete(admin)
+    db.session.commit()
+
+
+@pytest.fixture
+def users_with_activity(app_context):
+    """A page worth of users, each with payments and render jobs."""
+    users, payments, jobs = [], [], []
+    for i in range(10):
+        user = User(email=f'perf-user-{i}@example.com', password_hash='hashed_password')
+        db.session.add(user)
+        db.session.flush()
+        users.append(user)
+        
+        payment = Payment(
+            user_id=user.id,
+            stripe_session_id=f'cs_perf_{i}',
+            amount=1000,
+            status='completed'
+        )
+        db.session.add(payment)
+        db.session.flush()
+        payments.append(payment)
+        
+        job = RenderJob(
+            user_id=user.id,
+            payment_id=payment.id,
+            status='completed',
+            audio_filename=f'perf_{i}.mp3',
+            created_at=datetime.utcnow()
+        )
+        db.session.add(job)
+        jobs.append(job)
+    db.session.commit()
+    
+    yield users
+    
+    # The test database is shared across the session, so remove the rows
+    # again (children first) for the tests that follow
+    db.session.rollback()
+    for rows in (jobs, payments, users):
+        for row in rows:
+            db.session.delete(row)
+        db.session.commit()
+
+
+@pytest.fixture
+def dashboard_snapshot(app_context):
+    """A freshly saved dashboard snapshot, removed after the test."""
+    snapshot = save_dashboard_snapshot()
+    yield snapshot
+    
+    db.session.rollback()
+    db.session.query(DashboardSnapshot).delete()
+    db.session.commit()
+
+
+class TestQueryCounter:
+    """Test the QueryCounter helper."""
+    
+    def test_counts_statements(self, app_context):
+        """Test that executed statements are recorded."""
+        with QueryCounter() as counter:
+            User.query.count()
+            Payment.query.count()
+        
+        assert counter.count == 2
+    
+    def test_detects_repeated_statements(self, app_context, users_with_activity):
+        """Test that per-row lazy loads are reported as repeated."""
+        with QueryCounter() as counter:
+            for payment in Payment.query.limit(5).all():
+                payment.user.email
+        
+        assert counter.repeated()
+
+
+class TestAdminQueryBudgets:
+    """Test query budgets for admin pages."""
+    
+    def test_user_list_has_no_n_plus_one(self, client, admin_headers, users_with_activity):
+        """Test that the user list batches its payment and job counts."""
+        with QueryCounter() as counter:
+            response = client.get('/admin/admin_users/', headers=admin_headers)
+        
+        assert response.status_code == 200
+        assert counter.count <= 6
+        assert not counter.repeated()
+    
+    def test_payment_list_has_no_n_plus_one(self, client, admin_headers, users_with_activity):
+        """Test that the payment list eager-loads users and batches job counts."""
+        with QueryCounter() as counter:
+            response = client.get('/admin/admin_payments/', headers=admin_headers)
+        
+        assert response.status_code == 200
+        assert counter.count <= 5
+        assert not counter.repeated()
+    
+    def test_job_list_has_no_n_plus_one(self, client, admin_headers, users_with_activity):
+        """Test that the render job list eager-loads users."""
+        with QueryCounter() as counter:
+            response = client.get('/admin/admin_jobs/', headers=admin_headers)
+        
+        assert response.status_code == 200
+        assert counter.count <= 4
+        assert not counter.repeated()
+    
+    def test_dashboard_reads_snapshot(self, client, admin_headers, users_with_activity,
+                                      dashboard_snapshot):
+        """Test that the dashboard renders from the stored snapshot."""
+        with QueryCounter() as counter:
+            response = client.get('/admin/', headers=admin_headers)
+        
+        assert response.status_code == 200
+        assert counter.count <= 3
@@ -0,0 +1,126 @@
+"""
+Unit tests for admin view helpers.
+"""
+import pytest
+from datetime import datetime, timedelta
+
+from app import db
+from app.admin.views import KeysetPaginationMixin
+from app.models import Payment
+
+
+class _OffsetPaginationView:
+    """Stand-in for the Flask-Admin base view the mixin defers to."""
+
+    model = Payment
+    page_size = 20
+
+    def _apply_pagination(self, query, page, page_size):
+        return query.offset(page * (page_size or self.page_size)).limit(page_size or self.page_size)
+
+    def get_url(self, endpoint, **kwargs):
+        return endpoint, kwargs
+
+
+class _KeysetView(KeysetPaginationMixin, _OffsetPaginationView):
+    pass
+
+
+@pytest.fixture
+def keyset_payments(app_context):
+    """Four payments: three sharing a created_at, then an older one."""
+    created_at = datetime(2026, 1, 15, 12, 0, 0)
+    payments = [
+        Payment(user_id=1, stripe_session_id=f'cs_keyset_{i}', amount=1000,
+                status='pending', created_at=created_at)
+        for i in range(3)
+    ]
+    payments.append(Payment(user_id=1, stripe_session_id='cs_keyset_old', amount=1000,
+                            status='pending', created_at=created_at - timedelta(hours=1)))
+    db.session.add_all(payments)
+    db.session.commit()
+
+    yield payments
+
+    db.session.rollback()
+    for payment in payments:
+        db.session.delete(payment)
+    db.session.commit()
+
+
+def _listing():
+    """The default newest-first listing, limited to the fixture rows."""
+    return Payment.query.filter(
+        Payment.stripe_session_id.like('cs_keyset_%')
+    ).order_by(Payment.created_at.desc())
+
+
+class TestKeysetPagination:
+    """Test keyset pagination of the admin list views."""
+
+    def test_first_page_uses_offset(self, app, keyset_payments):
+        """Test that without a cursor the first page is read normally."""
+        with app.test_request_context('/admin/admin_payments/'):
+            rows = _KeysetView()._apply_pagination(_listing(), 0, 2).all()
+
+        # created_at ties are broken by id, newest first
+        assert [row.id for row in rows] == [keyset_payments[2].id, keyset_payments[1].id]
+
+    def test_cursor_continues_after_row(self, app, keyset_payments):
+        """Test that the cursor skips to the rows after the given one, across ties."""
+        cursor_row = keyset_payments[1]
+        query_string = {
+            'after': cursor_row.created_at.isoformat(),
+            'after_id': str(cursor_row.id),
+            'page': '5',
+        }
+
+        with app.test_request_context('/admin/admin_payments/', query_string=query_string):
+            rows = _KeysetView()._apply_pagination(_listing(), 5, 2).all()
+
+        assert [row.id for row in rows] == [keyset_payments[0].id, keyset_payments[3].id]
+
+    def test_invalid_cursor_falls_back_to_offset(self, app, keyset_payments):
+        """Test that a malformed cursor is ignored."""
+        query_string = {'after': 'not-a-date', 'after_id': 'x'}
+
+        with app.test_request_context('/admin/admin_payments/', query_string=query_string):
+            rows = _KeysetView()._apply_pagination(_listing(), 0, 2).all()
+
+        assert [row.id for row in rows] == [keyset_payments[2].id, keyset_payments[1].id]
+
+    def test_explicit_sort_uses_offset(self, app, keyset_payments):
+        """Test that column sorts keep page-number pagination."""
+        cursor_row = keyset_payments[1]
+        query_string = {
+            'sort': '1',
+            'after': cursor_row.created_at.isoformat(),
+            'after_id': str(cursor_row.id),
+        }
+
+        with app.test_request_context('/admin/admin_payments/', query_string=query_string):
+            rows = _KeysetView()._apply_pagination(_listing(), 0, 10).all()
+
+        assert len(rows) == 4
+
+    def test_next_url_points_after_last_row(self, app, keyset_payments):
+        """Test that the next link carries the last row's cursor and drops the page."""
+        last = keyset_payments[1]
+
+        with app.test_request_context('/admin/admin_payments/?page=3&search=cs'):
+            endpoint, args = _KeysetView().keyset_next_url([keyset_payments[2], last])
+
+        assert endpoint == '.index_view'
+        assert args == {
+            'search': 'cs',
+            'after': last.created_at.isoformat(),
+            'after_id': last.id,
+        }
+
+    def test_next_url_without_rows_or_with_sort(self, app, keyset_payments):
+        """Test that there is no next link for an empty page or a sorted listing."""
+        with app.test_request_context('/admin/admin_payments/'):
+            assert _KeysetView().keyset_next_url([]) is None
+
+        with app.test_request_context('/admin/admin_payments/?sort=1'):
+            assert _KeysetView().keyset_next_url(keyset_payments) is None
@@ -0,0 +1,87 @@
+"""
+Unit tests for API error handling.
+"""
+import copy
+import json
+import logging
+import pickle
+import queue
+
+import pytest
+
+from app.errors import (
+    APIError, ExternalServiceError, RateLimitError,
+    _DroppingQueueHandler, log_error, logger
+)
+from logging_config import JSONFormatter
+
+
+class TestErrorLogging:
+    """Test error log records written through the background queue."""
+
+    def test_queued_record_keeps_request_fields(self, app):
+        """Test that request fields survive formatting outside the request."""
+        record_queue = queue.Queue()
+        handler = _DroppingQueueHandler(record_queue)
+        logger.addHandler(handler)
+        try:
+            with app.test_request_context('/api/render', method='POST'):
+                from flask import request
+                request.id = 'req-123'
+                log_error(APIError('boom', 503))
+        finally:
+            logger.removeHandler(handler)
+
+        # Format the way the listener thread does: with no request context
+        record = record_queue.get_nowait()
+        entry = json.loads(JSONFormatter().format(record))
+
+        assert record.levelno == logging.ERROR
+        assert entry['request_id'] == 'req-123'
+        assert entry['endpoint'] == record.endpoint
+        assert entry['method'] == 'POST'
+        assert entry['url'] == 'http://localhost/api/render'
+        assert 'ip_address' in entry
+
+
+class TestAPIErrorCopying:
+    """Test that API errors keep their fields when pickled or copied."""
+
+    @pytest.mark.parametrize('copier', [
+        lambda error: pickle.loads(pickle.dumps(error)),
+        copy.copy,
+        copy.deepcopy,
+    ])
+    @pytest.mark.parametrize('error', [
+        APIError('boom', 503, 'SVC', {'field': 'x'}, recoverable=True),
+        ExternalServiceError('storage', 'down'),
+        RateLimitError(retry_after=30),
+    ])
+    def test_round_trip_keeps_fields(self, error, copier):
+        """Test that status, code, details and args survive a round trip."""
+        restored = copier(error)
+
+        assert type(restored) is type(error)
+        assert restored.args == error.args
+        assert restored.status_code == error.status_code
+        assert restored.error_code == error.error_code
+        assert restored.details == error.details
+        assert restored.recoverable == error.recoverable
+        assert restored.message == error.message
+
+
+class TestPrebuiltErrorBodies:
+    """Test HTTP error bodies rendered from prebuilt templates."""
+
+    def test_client_value_matching_placeholder_is_not_substituted(self, app):
+        """Test that a Content-Type spelling a placeholder stays a plain value."""
+        from werkzeug.exceptions import UnsupportedMediaType
+
+        with app.test_request_context('/api/upload', method='POST',
+                                      headers={'Content-Type': '__timestamp__'}):
+            response = app.handle_http_exception(UnsupportedMediaType())
+
+        error = json.loads(response.get_data())['error']
+        assert response.status_code == 415
+        assert error['details']['received_type'] == '__timestamp__'
+        assert error['timestamp'] != '__timestamp__'
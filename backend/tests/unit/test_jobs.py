@@ -3,7 +3,7 @@ Unit tests for job processing functionality.
 """
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime
+from datetime import datetime, timedelta
 import tempfile
 import os
 
@@ -12,6 +12,10 @@ from app.jobs.jobs import (
     render_video_job,
     send_completion_email,
     cleanup_expired_files,
+    cleanup_files,
+    update_job_meta,
+    update_render_job_status,
+    META_ERROR_MAX_CHARS,
     validate_audio_file,
     generate_video_config
 )
@@ -327,6 +331,107 @@ class TestFileCleanup:
         
         assert result['cleaned_count'] == 0
         mock_delete.assert_not_called()
+    
+    def test_cleanup_files_sweeps_directory(self, tmp_path):
+        """Test that a directory is swept for old regular files only."""
+        old_time = (datetime.utcnow() - timedelta(days=40)).timestamp()
+        
+        old_file = tmp_path / 'old.mp4'
+        old_file.write_bytes(b'old')
+        os.utime(old_file, (old_time, old_time))
+        
+        new_file = tmp_path / 'new.mp4'
+        new_file.write_bytes(b'new')
+        
+        subdir = tmp_path / 'nested'
+        subdir.mkdir()
+        nested_file = subdir / 'old_nested.mp4'
+        nested_file.write_bytes(b'nested')
+        os.utime(nested_file, (old_time, old_time))
+        os.utime(subdir, (old_time, old_time))
+        
+        target = tmp_path.parent / f'{tmp_path.name}_link_target.mp4'
+        target.write_bytes(b'target')
+        os.utime(target, (old_time, old_time))
+        link = tmp_path / 'link.mp4'
+        link.symlink_to(target)
+        
+        try:
+            result = cleanup_files([str(tmp_path)], max_age_days=30)
+            
+            assert result['success'] is True
+            assert result['cleaned_files'] == [str(old_file)]
+            assert result['errors'] == []
+            assert not old_file.exists()
+            assert new_file.exists()
+            assert nested_file.exists()
+            assert link.is_symlink()
+            assert target.exists()
+        finally:
+            target.unlink()
+    
+    def test_cleanup_files_mixes_files_and_missing_paths(self, tmp_path):
+        """Test that listed files are checked by age and missing paths skipped."""
+        old_time = (datetime.utcnow() - timedelta(days=40)).timestamp()
+        old_file = tmp_path / 'old.mp3'
+        old_file.write_bytes(b'old')
+        os.utime(old_file, (old_time, old_time))
+        new_file = tmp_path / 'new.mp3'
+        new_file.write_bytes(b'new')
+        
+        result = cleanup_files(
+            [str(old_file), str(new_file), str(tmp_path / 'missing.mp3')],
+            max_age_days=30
+        )
+        
+        assert result['cleaned_files'] == [str(old_file)]
+        assert result['errors'] == []
+        assert new_file.exists()
+
+
+class TestJobMeta:
+    """Test RQ job meta updates."""
+    
+    def test_long_error_is_truncated(self):
+        """Test that stored error messages are capped."""
+        job = Mock(meta={})
+        
+        update_job_meta(job, status='failed', error='x' * (META_ERROR_MAX_CHARS * 2))
+        
+        assert job.meta['status'] == 'failed'
+        assert job.meta['error'].startswith('x' * META_ERROR_MAX_CHARS)
+        assert len(job.meta['error']) < META_ERROR_MAX_CHARS * 2
+        job.save_meta.assert_called_once()
+    
+    def test_no_job_is_ignored(self):
+        """Test that updates outside an RQ job are a no-op."""
+        update_job_meta(None, status='processing')
+
+
+class TestRenderJobStatusUpdates:
+    """Test render job status updates from the worker."""
+    
+    @patch('app.cache.cache.redis_client')
+    @patch('app.cache.cache.delete')
+    def test_status_update_busts_dashboard_cache(self, mock_delete, mock_redis, app_context,
+                                                 test_render_job):
+        """Test that the single-UPDATE status path invalidates dashboard metrics."""
+        from app import db
+        from app.admin.views import DASHBOARD_CACHE_KEY
+        
+        update_render_job_status(test_render_job.id, 'failed', error_message='boom')
+        
+        db.session.refresh(test_render_job)
+        assert test_render_job.status == 'failed'
+        mock_delete.assert_called_once_with(DASHBOARD_CACHE_KEY)
+    
+    @patch('app.cache.cache.redis_client')
+    @patch('app.cache.cache.delete')
+    def test_missing_job_leaves_dashboard_cache(self, mock_delete, mock_redis, app_context):
+        """Test that updating an unknown job does not invalidate metrics."""
+        update_render_job_status(999999, 'failed')
+        
+        mock_delete.assert_not_called()
 
 
 class TestRenderJobModel:
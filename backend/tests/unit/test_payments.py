@@ -336,4 +336,162 @@ class TestPaymentModel:
         db.session.add(pending_payment)
         db.session.commit()
         
-        assert pending_payment.is_completed is False
\ No newline at end of file
+        assert pending_payment.is_completed is False
+
+class TestPaymentAggregate:
+    """Test the running totals of completed payments."""
+    
+    @pytest.fixture
+    def aggregate_payment(self, app_context):
+        """A pending payment, removed again after the test."""
+        from app import db
+        from app.payments.aggregate import rebuild_payment_aggregate
+        
+        # Start each test from a reconciled row
+        rebuild_payment_aggregate()
+        
+        payment = Payment(
+            user_id=1,
+            stripe_session_id='cs_test_aggregate',
+            amount=1500,
+            status='pending'
+        )
+        db.session.add(payment)
+        db.session.commit()
+        payment_id = payment.id
+        
+        yield payment
+        
+        leftover = db.session.get(Payment, payment_id)
+        if leftover is not None:
+            db.session.delete(leftover)
+            db.session.commit()
+        rebuild_payment_aggregate()
+    
+    def _totals(self):
+        from app import db
+        from app.models import PaymentAggregate
+        from app.payments.aggregate import AGGREGATE_ROW_ID
+        
+        aggregate = db.session.get(PaymentAggregate, AGGREGATE_ROW_ID, populate_existing=True)
+        return aggregate.completed_count, aggregate.total_completed_cents
+    
+    def test_insert_completed_payment(self, app_context, aggregate_payment):
+        """Test that inserting a completed payment adds to the totals."""
+        from app import db
+        
+        count, cents = self._totals()
+        payment = Payment(
+            user_id=1,
+            stripe_session_id='cs_test_aggregate_inserted',
+            amount=2500,
+            status='completed'
+        )
+        db.session.add(payment)
+        db.session.commit()
+        
+        try:
+            assert self._totals() == (count + 1, cents + 2500)
+        finally:
+            db.session.delete(payment)
+            db.session.commit()
+        
+        assert self._totals() == (count, cents)
+    
+    def test_completed_then_refunded(self, app_context, aggregate_payment):
+        """Test that status transitions move the totals in and out."""
+        from app import db
+        
+        count, cents = self._totals()
+        
+        aggregate_payment.status = 'completed'
+        db.session.commit()
+        assert self._totals() == (count + 1, cents + 1500)
+        
+        aggregate_payment.status = 'refunded'
+        db.session.commit()
+        assert self._totals() == (count, cents)
+    
+    def test_amount_edit_on_completed_payment(self, app_context, aggregate_payment):
+        """Test that editing a completed payment's amount adjusts the revenue."""
+        from app import db
+        
+        aggregate_payment.status = 'completed'
+        db.session.commit()
+        count, cents = self._totals()
+        
+        aggregate_payment.amount = 1200
+        db.session.commit()
+        
+        assert self._totals() == (count, cents - 300)
+    
+    def test_amount_edit_on_pending_payment(self, app_context, aggregate_payment):
+        """Test that editing an uncompleted payment's amount leaves the totals."""
+        from app import db
+        
+        count, cents = self._totals()
+        
+        aggregate_payment.amount = 4000
+        db.session.commit()
+        
+        assert self._totals() == (count, cents)
+    
+    def test_refund_with_corrected_amount(self, app_context, aggregate_payment):
+        """Test that a status and amount change in one flush removes the old amount."""
+        from app import db
+        
+        aggregate_payment.status = 'completed'
+        db.session.commit()
+        count, cents = self._totals()
+        
+        aggregate_payment.status = 'refunded'
+        aggregate_payment.amount = 900
+        db.session.commit()
+        
+        assert self._totals() == (count - 1, cents - 1500)
+    
+    def test_complete_with_corrected_amount(self, app_context, aggregate_payment):
+        """Test that completing with a corrected amount adds the new amount."""
+        from app import db
+        
+        count, cents = self._totals()
+        
+        aggregate_payment.status = 'completed'
+        aggregate_payment.amount = 1800
+        db.session.commit()
+        
+        assert self._totals() == (count + 1, cents + 1800)
+    
+    def test_delete_completed_payment(self, app_context, aggregate_payment):
+        """Test that deleting a completed payment subtracts from the totals."""
+        from app import db
+        
+        aggregate_payment.status = 'completed'
+        db.session.commit()
+        count, cents = self._totals()
+        
+        db.session.delete(aggregate_payment)
+        db.session.commit()
+        
+        assert self._totals() == (count - 1, cents - 1500)
+    
+    def test_deltas_do_not_postpone_reconciliation(self, app_context, aggregate_payment):
+        """Test that a stale row is rebuilt even while deltas keep arriving."""
+        from datetime import timedelta
+        from app import db
+        from app.models import PaymentAggregate
+        from app.payments.aggregate import (
+            AGGREGATE_MAX_AGE, AGGREGATE_ROW_ID, get_completed_payment_totals
+        )
+        
+        count, cents = self._totals()
+        
+        # Drift the row and age its last reconciliation, then apply a delta
+        aggregate = db.session.get(PaymentAggregate, AGGREGATE_ROW_ID)
+        aggregate.completed_count += 100
+        aggregate.reconciled_at = datetime.utcnow() - AGGREGATE_MAX_AGE - timedelta(minutes=1)
+        db.session.commit()
+        aggregate_payment.status = 'completed'
+        db.session.commit()
+        
+        assert get_completed_payment_totals() == (count + 1, cents + 1500)